@@ -1,8 +1,8 @@
-"""
-Database connection and session management
-"""
-
-from .connection import get_db, init_db, close_db
-from .base import Base
-
-__all__ = ["get_db", "init_db", "close_db", "Base"]
+"""
+Database connection and session management
+"""
+
+from .connection import get_db, init_db, close_db
+from .base import Base
+
+__all__ = ["get_db", "init_db", "close_db", "Base"]
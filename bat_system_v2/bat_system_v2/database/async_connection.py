@@ -0,0 +1,160 @@
+"""
+Async database connection management using SQLAlchemy (asyncpg)
+
+Parallel to connection.py for request handlers that run on the event loop.
+A query waiting on PostgreSQL yields to other requests instead of holding a
+worker thread, so one process can serve many concurrent lookups.
+
+Requires the asyncpg driver (pip install asyncpg). Not imported by
+database/__init__.py, and the engine is only created on first use
+(get_async_engine), so importing this module needs neither asyncpg nor a
+reachable database.
+"""
+
+import os
+import threading
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from .connection import DATABASE_URL, DEFAULT_PROFILE, SESSION_PROFILES
+from .instrumentation import instrument_engine
+
+
+def _async_url(url: str) -> str:
+    """Switch a postgresql:// URL to the asyncpg driver"""
+    scheme, _, rest = url.partition("://")
+    return f"postgresql+asyncpg://{rest}" if scheme.startswith("postgresql") else url
+
+
+# Database connection settings (defaults to DATABASE_URL on asyncpg)
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", _async_url(DATABASE_URL))
+
+# Connection pool settings
+ASYNC_POOL_SIZE = int(os.getenv("DB_ASYNC_POOL_SIZE", "20"))
+ASYNC_MAX_OVERFLOW = int(os.getenv("DB_ASYNC_MAX_OVERFLOW", "20"))
+POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+# Server-side prepared statements cached per connection by asyncpg (0 disables,
+# e.g. behind a transaction-pooling pgbouncer)
+PREPARED_STATEMENT_CACHE_SIZE = int(os.getenv("DB_PREPARED_STATEMENT_CACHE_SIZE", "500"))
+
+# Created on first use by get_async_engine()
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+_async_engine_lock = threading.Lock()
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Get the async engine (and pool), creating it on first use
+
+    Returns:
+        AsyncEngine on ASYNC_DATABASE_URL with the OLTP session settings
+    """
+    global _async_engine, _async_session_factory
+
+    with _async_engine_lock:
+        if _async_engine is None:
+            engine = create_async_engine(
+                ASYNC_DATABASE_URL,
+                pool_size=ASYNC_POOL_SIZE,
+                max_overflow=ASYNC_MAX_OVERFLOW,
+                pool_timeout=POOL_TIMEOUT,
+                pool_recycle=POOL_RECYCLE,
+                pool_pre_ping=True,  # Verify connections before using
+                echo=os.getenv("DB_ECHO", "false").lower() == "true",  # SQL logging
+                connect_args={
+                    # Same session settings as the sync OLTP profile, sent at connection startup
+                    "server_settings": dict(SESSION_PROFILES[DEFAULT_PROFILE]["settings"]),
+                    "prepared_statement_cache_size": PREPARED_STATEMENT_CACHE_SIZE,
+                },
+            )
+            instrument_engine(engine.sync_engine, name="async")
+            _async_session_factory = async_sessionmaker(
+                bind=engine,
+                autoflush=False,
+                expire_on_commit=False,  # Keep objects accessible after commit
+            )
+            _async_engine = engine
+        return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """Get the session factory bound to the async engine"""
+    get_async_engine()
+    return _async_session_factory
+
+
+def __getattr__(name: str):
+    """Lazy module attributes kept for code that imports async_engine / AsyncSessionLocal"""
+    if name == "async_engine":
+        return get_async_engine()
+    if name == "AsyncSessionLocal":
+        return get_async_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+async def close_async_db() -> None:
+    """
+    Close async database connections
+    Should be called on application shutdown
+    """
+    if _async_engine is not None:
+        await _async_engine.dispose()
+
+
+async def async_get_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for FastAPI to get an async database session
+
+    Usage:
+        @app.get("/materials/{sku}")
+        async def get_material(sku: str, db: AsyncSession = Depends(async_get_db)):
+            return await AsyncMaterialService.get_by_sku(db, sku)
+    """
+    async with get_async_session_factory()() as db:
+        yield db
+
+
+@asynccontextmanager
+async def async_get_db_context() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async context manager for database sessions (commits on success)
+
+    Usage:
+        async with async_get_db_context() as db:
+            material = await AsyncMaterialService.get_by_sku(db, "248DF")
+    """
+    async with get_async_session_factory()() as db:
+        try:
+            yield db
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+
+async def async_execute_transaction(func, *args, **kwargs):
+    """
+    Execute a coroutine function within a database transaction
+
+    Args:
+        func: Async function to execute that takes db session as first argument
+        *args: Additional positional arguments
+        **kwargs: Additional keyword arguments
+
+    Returns:
+        Result of the function
+
+    Usage:
+        async def rename_material(db, material_id, description):
+            material = await db.get(MaterialORM, material_id)
+            material.description = description
+            return material
+
+        result = await async_execute_transaction(rename_material, material_id, "2x4 Stud")
+    """
+    async with async_get_db_context() as db:
+        return await func(db, *args, **kwargs)
@@ -1,7 +1,7 @@
-"""
-SQLAlchemy declarative base
-"""
-
-from sqlalchemy.ext.declarative import declarative_base
-
-Base = declarative_base()
+"""
+SQLAlchemy declarative base
+"""
+
+from sqlalchemy.ext.declarative import declarative_base
+
+Base = declarative_base()
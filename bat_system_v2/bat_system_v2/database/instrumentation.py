@@ -0,0 +1,491 @@
+"""
+Database instrumentation
+Continuous query and connection pool metrics from SQLAlchemy engine events
+
+Collected in-process (no network calls), exportable as Prometheus text or JSON:
+- Per-statement timing histograms (statements normalized to fingerprints)
+- Slow query log with bound-parameter shapes (types only, never values)
+- Connection pool checkout wait time, overflow events and timeouts
+- Queries per request, with repeated-statement (N+1) detection
+
+Usage:
+    from bat_system_v2.database.instrumentation import query_metrics, query_scope
+
+    with query_scope("extract_packs", session=db) as scope:
+        PlanService.extract_packs(db, request)
+    print(scope.query_count)
+
+    print(query_metrics.to_prometheus())
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger("bat_system_v2.database")
+
+# Instrumentation settings
+METRICS_ENABLED = os.getenv("DB_METRICS_ENABLED", "true").lower() == "true"
+SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "500"))
+SLOW_QUERY_LOG_SIZE = int(os.getenv("DB_SLOW_QUERY_LOG_SIZE", "100"))
+MAX_STATEMENTS = int(os.getenv("DB_METRICS_MAX_STATEMENTS", "500"))
+# Same statement this many times in one request scope is reported as N+1
+N_PLUS_ONE_THRESHOLD = int(os.getenv("DB_N_PLUS_ONE_THRESHOLD", "20"))
+
+# Histogram bucket upper bounds
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+# Fingerprint used once MAX_STATEMENTS distinct statements are tracked
+OTHER_STATEMENT = "<other>"
+
+_WHITESPACE = re.compile(r"\s+")
+_IN_LIST = re.compile(r"\(\s*(?:%\([^)]+\)s|\$\d+|\?|:\w+)(?:\s*,\s*(?:%\([^)]+\)s|\$\d+|\?|:\w+))+\s*\)")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Normalize SQL so executions of the same query share one metric
+
+    Collapses whitespace, expanded IN lists and inline literals:
+        "... WHERE code IN (%(c_1)s, %(c_2)s) LIMIT 5" -> "... WHERE code IN (?) LIMIT ?"
+    """
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _IN_LIST.sub("(?)", normalized)
+    normalized = _STRING.sub("?", normalized)
+    return _NUMBER.sub("?", normalized)
+
+
+def parameter_shape(parameters: Any) -> Any:
+    """Describe bound parameters by type only (values are never recorded)"""
+    if isinstance(parameters, (list, tuple)) and parameters and isinstance(
+        parameters[0], (dict, list, tuple)
+    ):
+        # executemany: shape of the first row plus the row count
+        return {"rows": len(parameters), "row": parameter_shape(parameters[0])}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+class _Histogram:
+    """Cumulative histogram with fixed buckets (Prometheus semantics)"""
+
+    __slots__ = ("buckets", "counts", "count", "total")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self) -> List[int]:
+        running, result = 0, []
+        for count in self.counts:
+            running += count
+            result.append(running)
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "buckets": dict(zip((str(b) for b in self.buckets), self.cumulative())),
+        }
+
+
+class QueryScope:
+    """Queries issued inside one query_scope() (typically one request)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.query_count = 0
+        self.duration = 0.0
+        self.statements: Dict[str, int] = {}
+        self.closed = False
+
+    def record(self, statement: str, duration: float) -> None:
+        self.query_count += 1
+        self.duration += duration
+        self.statements[statement] = self.statements.get(statement, 0) + 1
+
+    def merge(self, other: "QueryScope") -> None:
+        """Fold a finished nested scope into this one"""
+        self.query_count += other.query_count
+        self.duration += other.duration
+        for sql, count in other.statements.items():
+            self.statements[sql] = self.statements.get(sql, 0) + count
+
+    def repeated_statements(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> Dict[str, int]:
+        """Statements executed at least threshold times (likely N+1 loops)"""
+        return {sql: n for sql, n in self.statements.items() if n >= threshold}
+
+
+_current_scope: ContextVar[Optional[QueryScope]] = ContextVar("bat_query_scope", default=None)
+
+# Session.info / Connection.info key for a scope bound to a session
+_SCOPE_KEY = "bat_query_scope"
+
+
+@event.listens_for(Session, "after_begin")
+def _bind_scope_to_connection(session, transaction, connection):
+    """Carry the session's scope to the connection its statements run on"""
+    scope = session.info.get(_SCOPE_KEY)
+    if scope is not None:
+        connection.info[_SCOPE_KEY] = scope
+
+
+class QueryMetrics:
+    """Thread-safe store for query, pool and per-request metrics"""
+
+    def __init__(self, max_statements: int = MAX_STATEMENTS, slow_query_ms: float = SLOW_QUERY_MS):
+        self.max_statements = max_statements
+        self.slow_query_seconds = slow_query_ms / 1000
+        self._lock = threading.Lock()
+        # (profile name, engine) pairs reported by pool_status()
+        self._engines: List[Tuple[str, Engine]] = []
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all collected metrics"""
+        with self._lock:
+            self._statements: Dict[str, _Histogram] = {}
+            self._fingerprints: Dict[str, str] = {}
+            self.slow_queries = deque(maxlen=SLOW_QUERY_LOG_SIZE)
+            self.slow_query_count = 0
+            self.error_count = 0
+            self.connections_opened = 0
+            self.checkout_wait = _Histogram(DURATION_BUCKETS)
+            self.checkout_timeouts = 0
+            self.overflow_events = 0
+            self.queries_per_request = _Histogram(QUERY_COUNT_BUCKETS)
+            self.n_plus_one_count = 0
+
+    def record_query(
+        self, statement: str, parameters: Any, duration: float, scope: Optional[QueryScope] = None
+    ) -> None:
+        """Record one cursor execution (in scope, else the context's query_scope())"""
+        with self._lock:
+            sql = self._fingerprints.get(statement)
+            if sql is None:
+                sql = fingerprint(statement)
+                if len(self._fingerprints) >= self.max_statements * 4:
+                    self._fingerprints.clear()
+                self._fingerprints[statement] = sql
+
+            histogram = self._statements.get(sql)
+            if histogram is None:
+                if len(self._statements) >= self.max_statements:
+                    sql = OTHER_STATEMENT
+                    histogram = self._statements.get(sql)
+                if histogram is None:
+                    histogram = self._statements[sql] = _Histogram(DURATION_BUCKETS)
+            histogram.observe(duration)
+
+            slow = duration >= self.slow_query_seconds
+            if slow:
+                self.slow_query_count += 1
+                entry = {
+                    "timestamp": time.time(),
+                    "duration_ms": round(duration * 1000, 3),
+                    "statement": sql,
+                    "parameters": parameter_shape(parameters),
+                }
+                self.slow_queries.append(entry)
+
+        if slow:
+            logger.warning(
+                "Slow query (%.1f ms): %s params=%s",
+                entry["duration_ms"],
+                sql[:500],
+                entry["parameters"],
+            )
+
+        if scope is None or scope.closed:
+            scope = _current_scope.get()
+        if scope is not None:
+            scope.record(sql, duration)
+
+    def record_error(self) -> None:
+        with self._lock:
+            self.error_count += 1
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connections_opened += 1
+
+    def record_checkout(self, wait: float) -> None:
+        with self._lock:
+            self.checkout_wait.observe(wait)
+
+    def record_overflow(self) -> None:
+        with self._lock:
+            self.overflow_events += 1
+
+    def record_checkout_timeout(self, wait: float) -> None:
+        with self._lock:
+            self.checkout_wait.observe(wait)
+            self.checkout_timeouts += 1
+
+    def record_scope(self, scope: QueryScope) -> None:
+        """Record the per-request query count and report repeated statements"""
+        repeated = scope.repeated_statements()
+        with self._lock:
+            self.queries_per_request.observe(scope.query_count)
+            if repeated:
+                self.n_plus_one_count += 1
+
+        for sql, count in repeated.items():
+            logger.warning(
+                "Possible N+1 in %s: statement executed %d times: %s", scope.name, count, sql[:500]
+            )
+
+    def pool_status(self) -> List[Dict[str, Any]]:
+        """Current pool gauges for each instrumented engine"""
+        status = []
+        for name, engine in self._engines:
+            pool = engine.pool
+            if isinstance(pool, QueuePool):
+                status.append(
+                    {
+                        "profile": name,
+                        "size": pool.size(),
+                        "checked_in": pool.checkedin(),
+                        "checked_out": pool.checkedout(),
+                        "overflow": max(pool.overflow(), 0),
+                    }
+                )
+        return status
+
+    def to_json(self) -> Dict[str, Any]:
+        """All metrics as a JSON-serializable dict"""
+        with self._lock:
+            statements = [
+                {"statement": sql, **histogram.to_dict()}
+                for sql, histogram in sorted(
+                    self._statements.items(), key=lambda item: item[1].total, reverse=True
+                )
+            ]
+            return {
+                "queries": {
+                    "total": sum(h.count for h in self._statements.values()),
+                    "errors": self.error_count,
+                    "slow": self.slow_query_count,
+                    "slow_threshold_ms": self.slow_query_seconds * 1000,
+                    "statements": statements,
+                },
+                "slow_queries": list(self.slow_queries),
+                "pool": {
+                    "connections_opened": self.connections_opened,
+                    "checkout_wait_seconds": self.checkout_wait.to_dict(),
+                    "checkout_timeouts": self.checkout_timeouts,
+                    "overflow_events": self.overflow_events,
+                    "engines": self.pool_status(),
+                },
+                "requests": {
+                    "queries_per_request": self.queries_per_request.to_dict(),
+                    "n_plus_one": self.n_plus_one_count,
+                },
+            }
+
+    def to_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        lines: List[str] = []
+
+        def histogram(name: str, help_text: str, series: List[tuple]) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, h in series:
+                for bound, count in zip(h.buckets, h.cumulative()):
+                    lines.append(f'{name}_bucket{{{labels}le="{bound}"}} {count}')
+                lines.append(f'{name}_bucket{{{labels}le="+Inf"}} {h.count}')
+                base = labels.rstrip(",")
+                lines.append(f"{name}_sum{{{base}}} {h.total}" if base else f"{name}_sum {h.total}")
+                lines.append(f"{name}_count{{{base}}} {h.count}" if base else f"{name}_count {h.count}")
+
+        def counter(name: str, help_text: str, value: float, kind: str = "counter") -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"{name} {value}")
+
+        with self._lock:
+            series = []
+            for sql, h in self._statements.items():
+                digest = hashlib.sha1(sql.encode()).hexdigest()[:12]
+                operation = sql.split(" ", 1)[0].upper() if sql != OTHER_STATEMENT else "OTHER"
+                series.append((f'statement="{digest}",operation="{operation}",', h))
+            histogram("bat_db_query_duration_seconds", "Query execution time by statement fingerprint", series)
+            counter("bat_db_query_errors_total", "Failed statements", self.error_count)
+            counter("bat_db_slow_queries_total", "Statements slower than the slow query threshold", self.slow_query_count)
+            counter("bat_db_connections_opened_total", "New DBAPI connections", self.connections_opened)
+            histogram("bat_db_pool_checkout_wait_seconds", "Time waiting for a pooled connection", [("", self.checkout_wait)])
+            counter("bat_db_pool_checkout_timeouts_total", "Pool checkouts that timed out", self.checkout_timeouts)
+            counter("bat_db_pool_overflow_events_total", "Checkouts that opened an overflow connection", self.overflow_events)
+            histogram("bat_db_queries_per_request", "Statements issued per request scope", [("", self.queries_per_request)])
+            counter("bat_db_n_plus_one_total", "Request scopes with a repeated statement (possible N+1)", self.n_plus_one_count)
+
+        pool_status = self.pool_status()
+        for key, help_text in (
+            ("size", "Configured pool size"),
+            ("checked_out", "Connections currently checked out"),
+            ("overflow", "Overflow connections currently open"),
+        ):
+            lines.append(f"# HELP bat_db_pool_{key} {help_text}")
+            lines.append(f"# TYPE bat_db_pool_{key} gauge")
+            for status in pool_status:
+                lines.append(f'bat_db_pool_{key}{{profile="{status["profile"]}"}} {status[key]}')
+
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide metrics store used by the default engine
+query_metrics = QueryMetrics()
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that reports checkout wait time, overflow and timeouts to query_metrics"""
+
+    def _do_get(self):
+        if not METRICS_ENABLED:
+            return super()._do_get()
+
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            query_metrics.record_checkout_timeout(time.perf_counter() - start)
+            raise
+
+        query_metrics.record_checkout(time.perf_counter() - start)
+        return connection
+
+    def _create_connection(self):
+        # Overflow is reserved before the connection is created, so a positive
+        # count here means this connection is beyond pool_size
+        if METRICS_ENABLED and self._overflow > 0:
+            query_metrics.record_overflow()
+        return super()._create_connection()
+
+
+def instrument_engine(
+    engine: Engine, name: Optional[str] = None, metrics: QueryMetrics = query_metrics
+) -> Engine:
+    """
+    Attach query timing, error and connection listeners to an engine
+
+    Args:
+        engine: Engine to instrument (sync engine; use get_async_engine().sync_engine for async)
+        name: Label for this engine's pool gauges, e.g. the session profile
+            (defaults to the URL without password; engines sharing a URL need distinct names)
+        metrics: Metrics store (defaults to the process-wide query_metrics)
+
+    Returns:
+        The same engine
+    """
+    if not METRICS_ENABLED:
+        return engine
+
+    metrics._engines.append((name or engine.url.render_as_string(hide_password=True), engine))
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_conn, connection_record):
+        metrics.record_connect()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_execute(conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - conn.info["query_start"].pop()
+        metrics.record_query(statement, parameters, duration, conn.info.get(_SCOPE_KEY))
+
+    @event.listens_for(engine, "handle_error")
+    def _on_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start"):
+            conn.info["query_start"].pop()
+        metrics.record_error()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_conn, connection_record):
+        # Connection.info lives on the pooled connection: unbind the scope
+        if connection_record is not None:
+            connection_record.info.pop(_SCOPE_KEY, None)
+
+    return engine
+
+
+@contextmanager
+def query_scope(
+    name: str = "request", metrics: QueryMetrics = query_metrics, session: Optional[Session] = None
+) -> Iterator[QueryScope]:
+    """
+    Count the statements issued inside a block (one request, job or call)
+
+    On exit the count is added to the queries-per-request histogram and any
+    statement repeated N_PLUS_ONE_THRESHOLD+ times is logged as a possible N+1.
+    A nested scope (e.g. get_db_context inside a job scope) is folded into
+    the enclosing scope, which is the one recorded.
+
+    With session, the scope is attached to the session (Session.info) and
+    counts that session's statements wherever they run. This is what a
+    FastAPI dependency needs: sync dependencies and endpoints run in
+    threadpool workers with copied contexts, where a context variable set
+    by the dependency is not visible to the endpoint.
+
+    Usage:
+        with query_scope("GET /plans/1670/extract") as scope:
+            ...
+        scope.query_count
+    """
+    scope = QueryScope(name)
+    previous = _current_scope.get()
+    if session is not None:
+        # Picked up by connections the session begins from now on
+        session.info[_SCOPE_KEY] = scope
+        token = None
+    else:
+        token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        if session is not None:
+            session.info.pop(_SCOPE_KEY, None)
+        else:
+            _current_scope.reset(token)
+        scope.closed = True
+        if previous is not None:
+            previous.merge(scope)
+        elif METRICS_ENABLED:
+            metrics.record_scope(scope)
+
+
+def current_scope() -> Optional[QueryScope]:
+    """The active query_scope(), if any"""
+    return _current_scope.get()
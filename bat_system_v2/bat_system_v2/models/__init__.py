@@ -1,46 +1,46 @@
-"""
-BAT System v2.0 - Data Models
-Pydantic models matching PostgreSQL database schema
-"""
-
-from .material import Material, MaterialCreate, MaterialUpdate, MaterialInDB
-from .pricing import (
-    PriceLevel,
-    MaterialPricing,
-    CustomerPricing,
-    PricingUpdate,
-)
-from .plan import Plan, PlanCreate, Pack, PlanMaterial, PlanOption
-from .bid import Bid, BidCreate, BidItem, BidRevision
-from .customer import Customer, CustomerCreate
-from .supplier import Supplier, SupplierCreate
-
-__all__ = [
-    # Materials
-    "Material",
-    "MaterialCreate",
-    "MaterialUpdate",
-    "MaterialInDB",
-    # Pricing
-    "PriceLevel",
-    "MaterialPricing",
-    "CustomerPricing",
-    "PricingUpdate",
-    # Plans
-    "Plan",
-    "PlanCreate",
-    "Pack",
-    "PlanMaterial",
-    "PlanOption",
-    # Bids
-    "Bid",
-    "BidCreate",
-    "BidItem",
-    "BidRevision",
-    # Customers
-    "Customer",
-    "CustomerCreate",
-    # Suppliers
-    "Supplier",
-    "SupplierCreate",
-]
+"""
+BAT System v2.0 - Data Models
+Pydantic models matching PostgreSQL database schema
+"""
+
+from .material import Material, MaterialCreate, MaterialUpdate, MaterialInDB
+from .pricing import (
+    PriceLevel,
+    MaterialPricing,
+    CustomerPricing,
+    PricingUpdate,
+)
+from .plan import Plan, PlanCreate, Pack, PlanMaterial, PlanOption
+from .bid import Bid, BidCreate, BidItem, BidRevision
+from .customer import Customer, CustomerCreate
+from .supplier import Supplier, SupplierCreate
+
+__all__ = [
+    # Materials
+    "Material",
+    "MaterialCreate",
+    "MaterialUpdate",
+    "MaterialInDB",
+    # Pricing
+    "PriceLevel",
+    "MaterialPricing",
+    "CustomerPricing",
+    "PricingUpdate",
+    # Plans
+    "Plan",
+    "PlanCreate",
+    "Pack",
+    "PlanMaterial",
+    "PlanOption",
+    # Bids
+    "Bid",
+    "BidCreate",
+    "BidItem",
+    "BidRevision",
+    # Customers
+    "Customer",
+    "CustomerCreate",
+    # Suppliers
+    "Supplier",
+    "SupplierCreate",
+]
@@ -1,15 +1,17 @@
-"""
-BAT System v2.0 - Business Logic Services
-"""
-
-from .material_service import MaterialService
-from .pricing_service import PricingService
-from .plan_service import PlanService
-from .bid_service import BidService
-
-__all__ = [
-    "MaterialService",
-    "PricingService",
-    "PlanService",
-    "BidService",
-]
+"""
+BAT System v2.0 - Business Logic Services
+"""
+
+from .material_service import AsyncMaterialService, MaterialService
+from .pricing_service import AsyncPricingService, PricingService
+from .plan_service import PlanService
+from .bid_service import BidService
+
+__all__ = [
+    "MaterialService",
+    "PricingService",
+    "PlanService",
+    "BidService",
+    "AsyncMaterialService",
+    "AsyncPricingService",
+]
@@ -0,0 +1,695 @@
+"""
+Bid Generation Service
+Replaces copy-pasting plan sheet rows into an Excel bid
+
+Key functionality:
+- Bid generation from plan + packs + price level
+- Batched pricing (one pricing pass for all lines)
+- Bulk line item insertion
+- Totals and margins rolled up in the database
+"""
+
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, case, insert, literal, or_, select, update
+from sqlalchemy.orm import Session, relationship
+
+from ..database.base import Base
+from ..models.bid import BidGenerateRequest, BidItemCreate, BidItemUpdate
+from ..models.pricing import PriceCalculationRequest
+
+
+# SQLAlchemy ORM Models
+from sqlalchemy import Boolean, Column, Date, ForeignKey, Integer, Numeric, String, Text, TIMESTAMP
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
+from sqlalchemy.sql import func
+
+from . import bid_snapshots
+from .plan_service import PackORM, PlanMaterialORM, PlanORM
+from .pricing_service import PriceLevelORM, PricingService
+
+
+class BidORM(Base):
+    """Bid ORM model"""
+
+    __tablename__ = "bids"
+
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    bid_number = Column(String(50), unique=True, nullable=False)
+    customer_id = Column(PG_UUID(as_uuid=True), index=True)
+    plan_id = Column(PG_UUID(as_uuid=True), ForeignKey("plans.id"), index=True)
+    status = Column(String(20), default="draft", index=True)
+    created_date = Column(Date, nullable=False, server_default=func.current_date())
+    valid_until = Column(Date)
+    total_cost = Column(Numeric(12, 2))
+    total_sell = Column(Numeric(12, 2))
+    margin_dollars = Column(Numeric(12, 2))
+    margin_percent = Column(Numeric(5, 2))
+    created_by = Column(String(100))
+    notes = Column(Text)
+    created_at = Column(TIMESTAMP, server_default=func.now())
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+
+    items = relationship("BidItemORM", order_by="BidItemORM.line_number", lazy="select")
+
+
+class BidItemORM(Base):
+    """Bid Item ORM model"""
+
+    __tablename__ = "bid_items"
+
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    bid_id = Column(PG_UUID(as_uuid=True), ForeignKey("bids.id", ondelete="CASCADE"), index=True)
+    material_id = Column(PG_UUID(as_uuid=True), ForeignKey("materials.id"), index=True)
+    pack_code = Column(String(50))
+    quantity = Column(Numeric(10, 4))
+    unit_cost = Column(Numeric(10, 4))
+    unit_sell = Column(Numeric(10, 4))
+    line_total_cost = Column(Numeric(12, 2))
+    line_total_sell = Column(Numeric(12, 2))
+    is_optional = Column(Boolean, default=False)
+    line_number = Column(Integer)
+    created_at = Column(TIMESTAMP, server_default=func.now())
+
+
+class BidRevisionORM(Base):
+    """Bid Revision ORM model"""
+
+    __tablename__ = "bid_revisions"
+
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    bid_id = Column(PG_UUID(as_uuid=True), ForeignKey("bids.id", ondelete="CASCADE"))
+    revision_number = Column(Integer, nullable=False)
+    revised_date = Column(Date, nullable=False, server_default=func.current_date())
+    revision_reason = Column(Text)
+    price_delta = Column(Numeric(12, 2))
+    revised_by = Column(String(100))
+    bid_snapshot = Column(JSONB)
+    created_at = Column(TIMESTAMP, server_default=func.now())
+
+
+def _line_totals(
+    quantity: Optional[Decimal], unit_cost: Optional[Decimal], unit_sell: Optional[Decimal]
+) -> Tuple[Optional[Decimal], Optional[Decimal]]:
+    """TTL COST / TTL SELL for one line, rounded like the bid_items columns"""
+    if quantity is None:
+        return None, None
+    line_cost = round(quantity * unit_cost, 2) if unit_cost is not None else None
+    line_sell = round(quantity * unit_sell, 2) if unit_sell is not None else None
+    return line_cost, line_sell
+
+
+def _margin_percent(total_cost, total_sell):
+    """MARGIN% as a SQL expression (Column R, 0 when there is no sell)"""
+    return case(
+        (total_sell > 0, func.round((1 - total_cost / total_sell) * 100, 2)),
+        else_=0,
+    )
+
+
+def _totals_values(total_cost, total_sell) -> Dict[str, Any]:
+    """SET clause for the denormalized bid totals from cost/sell expressions"""
+    return {
+        "total_cost": total_cost,
+        "total_sell": total_sell,
+        "margin_dollars": total_sell - total_cost,
+        "margin_percent": _margin_percent(total_cost, total_sell),
+        "updated_at": func.now(),
+    }
+
+
+def _item_totals_subquery():
+    """Actual totals per bid summed from bid_items (zeros for empty bids)"""
+    return (
+        select(
+            BidORM.id.label("bid_id"),
+            func.coalesce(func.sum(BidItemORM.line_total_cost), 0).label("total_cost"),
+            func.coalesce(func.sum(BidItemORM.line_total_sell), 0).label("total_sell"),
+        )
+        .outerjoin(BidItemORM, BidItemORM.bid_id == BidORM.id)
+        .group_by(BidORM.id)
+        .subquery("item_totals")
+    )
+
+
+class BidService:
+    """
+    Bid generation service
+
+    Replaces Excel workflow:
+    - Copy plan sheet rows for the selected packs into a bid
+    - Look up PRICE (column H) for the customer's price level
+    - Sum TTL COST (P) / TTL SELL (M), compute MARGIN$ (Q) and MARGIN% (R)
+    """
+
+    @staticmethod
+    def get_by_id(db: Session, bid_id: UUID) -> Optional[BidORM]:
+        """Get bid by ID"""
+        return db.query(BidORM).filter(BidORM.id == bid_id).first()
+
+    @staticmethod
+    def get_by_number(db: Session, bid_number: str) -> Optional[BidORM]:
+        """Get bid by bid number"""
+        return db.query(BidORM).filter(BidORM.bid_number == bid_number).first()
+
+    @staticmethod
+    def get_items(db: Session, bid_id: UUID) -> List[BidItemORM]:
+        """Get bid line items in line order"""
+        return (
+            db.query(BidItemORM)
+            .filter(BidItemORM.bid_id == bid_id)
+            .order_by(BidItemORM.line_number)
+            .all()
+        )
+
+    @staticmethod
+    def generate_bid(
+        db: Session, request: BidGenerateRequest, created_by: Optional[str] = None
+    ) -> Optional[BidORM]:
+        """
+        Generate a bid from a plan, packs and price level
+
+        Replaces building an Excel bid by hand. Round trips are constant no
+        matter how many lines the packs contain:
+        - one query for the plan lines of the selected packs
+        - one batched pricing pass (PricingService.calculate_prices)
+        - one bulk INSERT for all bid items
+        - one aggregate UPDATE for the bid totals and margins
+
+        Lines that cannot be priced (no current cost) are kept on the bid
+        with empty pricing so nothing silently drops off the takeoff.
+
+        Args:
+            db: Database session
+            request: Customer, plan, packs, price level and options
+            created_by: User generating the bid
+
+        Returns:
+            The new bid with totals, None if the plan does not exist
+
+        Raises:
+            ValueError: If price_level_code does not exist
+        """
+        plan = (
+            db.query(PlanORM.id, PriceLevelORM.id.label("price_level_id"))
+            .outerjoin(
+                PriceLevelORM,
+                and_(
+                    PriceLevelORM.code == request.price_level_code,
+                    PriceLevelORM.is_active == True,
+                ),
+            )
+            .filter(PlanORM.plan_code == request.plan_code)
+            .first()
+        )
+        if not plan:
+            return None
+        if plan.price_level_id is None:
+            raise ValueError(f"Unknown price level: {request.price_level_code}")
+
+        # Plan lines for the selected packs, in takeoff order
+        lines_query = (
+            db.query(
+                PlanMaterialORM.material_id,
+                PlanMaterialORM.quantity,
+                PlanMaterialORM.is_optional,
+                PackORM.code.label("pack_code"),
+            )
+            .join(PackORM, PackORM.id == PlanMaterialORM.pack_id)
+            .filter(
+                PlanMaterialORM.plan_id == plan.id,
+                PackORM.code.in_(request.pack_codes),
+            )
+        )
+        if not request.include_optional:
+            lines_query = lines_query.filter(PlanMaterialORM.is_optional == False)
+
+        lines = lines_query.order_by(
+            PackORM.display_order.nullslast(),
+            PackORM.code,
+            PlanMaterialORM.unified_code,
+            PlanMaterialORM.id,
+        ).all()
+
+        # Price every line in one pass
+        prices = PricingService.calculate_prices(
+            db,
+            [
+                PriceCalculationRequest(
+                    material_id=line.material_id,
+                    quantity=line.quantity,
+                    price_level_code=request.price_level_code,
+                    customer_id=request.customer_id,
+                )
+                for line in lines
+            ],
+        )
+
+        today = date.today()
+        bid = BidORM(
+            bid_number=BidService._next_bid_number(today),
+            customer_id=request.customer_id,
+            plan_id=plan.id,
+            status="draft",
+            created_date=today,
+            valid_until=today + timedelta(days=request.valid_days),
+            created_by=created_by,
+            notes=request.notes,
+        )
+        db.add(bid)
+        db.flush()
+
+        items = []
+        for line_number, (line, price) in enumerate(zip(lines, prices), start=1):
+            line_cost, line_sell = (
+                _line_totals(line.quantity, price.unit_cost, price.unit_sell)
+                if price
+                else (None, None)
+            )
+            items.append(
+                {
+                    "id": uuid.uuid4(),
+                    "bid_id": bid.id,
+                    "material_id": line.material_id,
+                    "pack_code": line.pack_code,
+                    "quantity": line.quantity,
+                    "unit_cost": price.unit_cost if price else None,
+                    "unit_sell": price.unit_sell if price else None,
+                    "line_total_cost": line_cost,
+                    "line_total_sell": line_sell,
+                    "is_optional": line.is_optional,
+                    "line_number": line_number,
+                }
+            )
+
+        try:
+            if items:
+                db.execute(insert(BidItemORM), items)
+            BidService.recalculate_totals(db, bid.id)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        db.refresh(bid)
+        return bid
+
+    @staticmethod
+    def recalculate_totals(db: Session, bid_id: UUID) -> None:
+        """
+        Roll line totals up onto the bid with one aggregate UPDATE
+
+        Sums TTL COST / TTL SELL over the bid's items in the database and
+        sets MARGIN$ and MARGIN% (0 when there is no sell). Does not commit.
+
+        Args:
+            db: Database session
+            bid_id: Bid to recalculate
+        """
+        # Ungrouped aggregate: always one row, zeros when the bid has no items
+        totals = (
+            select(
+                literal(bid_id, PG_UUID(as_uuid=True)).label("bid_id"),
+                func.coalesce(func.sum(BidItemORM.line_total_cost), 0).label("total_cost"),
+                func.coalesce(func.sum(BidItemORM.line_total_sell), 0).label("total_sell"),
+            )
+            .where(BidItemORM.bid_id == bid_id)
+            .subquery("totals")
+        )
+
+        db.execute(
+            update(BidORM)
+            .where(BidORM.id == totals.c.bid_id)
+            .values(**_totals_values(totals.c.total_cost, totals.c.total_sell))
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def add_item(db: Session, item: BidItemCreate) -> BidItemORM:
+        """
+        Add a line item and adjust the bid totals by its line totals
+
+        The item insert and the totals delta are committed together, so the
+        bid's denormalized totals never need a full recompute.
+
+        Args:
+            db: Database session
+            item: Line item (line totals are calculated from quantity and unit prices)
+
+        Returns:
+            Created bid item
+        """
+        line_cost, line_sell = _line_totals(item.quantity, item.unit_cost, item.unit_sell)
+        db_item = BidItemORM(
+            **item.model_dump(), line_total_cost=line_cost, line_total_sell=line_sell
+        )
+
+        try:
+            db.add(db_item)
+            BidService._apply_totals_delta(db, item.bid_id, line_cost, line_sell)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        db.refresh(db_item)
+        return db_item
+
+    @staticmethod
+    def update_item(db: Session, item_id: UUID, item: BidItemUpdate) -> Optional[BidItemORM]:
+        """
+        Update a line item and adjust the bid totals by the change in its line totals
+
+        Args:
+            db: Database session
+            item_id: Bid item to update
+            item: Fields to change (line totals are recalculated)
+
+        Returns:
+            Updated bid item or None if not found
+        """
+        db_item = (
+            db.query(BidItemORM).filter(BidItemORM.id == item_id).with_for_update().first()
+        )
+        if not db_item:
+            return None
+
+        old_cost, old_sell = db_item.line_total_cost, db_item.line_total_sell
+        for field, value in item.model_dump(exclude_unset=True).items():
+            setattr(db_item, field, value)
+        db_item.line_total_cost, db_item.line_total_sell = _line_totals(
+            db_item.quantity, db_item.unit_cost, db_item.unit_sell
+        )
+
+        try:
+            BidService._apply_totals_delta(
+                db,
+                db_item.bid_id,
+                (db_item.line_total_cost or 0) - (old_cost or 0),
+                (db_item.line_total_sell or 0) - (old_sell or 0),
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        db.refresh(db_item)
+        return db_item
+
+    @staticmethod
+    def remove_item(db: Session, item_id: UUID) -> bool:
+        """
+        Remove a line item and subtract its line totals from the bid
+
+        Args:
+            db: Database session
+            item_id: Bid item to remove
+
+        Returns:
+            True if removed, False if not found
+        """
+        db_item = (
+            db.query(BidItemORM).filter(BidItemORM.id == item_id).with_for_update().first()
+        )
+        if not db_item:
+            return False
+
+        try:
+            BidService._apply_totals_delta(
+                db,
+                db_item.bid_id,
+                -(db_item.line_total_cost or 0),
+                -(db_item.line_total_sell or 0),
+            )
+            db.delete(db_item)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        return True
+
+    @staticmethod
+    def verify_totals(
+        db: Session, repair: bool = False, bid_ids: Optional[List[UUID]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Compare stored bid totals with the sums of their items
+
+        One grouped query recomputes every bid (or the given bids); with
+        repair=True the drifted bids are corrected by a single UPDATE and
+        committed. Use after bulk SQL edits to bid_items or as a periodic
+        consistency check.
+
+        Args:
+            db: Database session
+            repair: Rewrite drifted totals from the items
+            bid_ids: Optional bids to check (default: all)
+
+        Returns:
+            One entry per drifted bid with stored and actual totals
+        """
+        actual = _item_totals_subquery()
+        drifted = or_(
+            BidORM.total_cost.is_distinct_from(actual.c.total_cost),
+            BidORM.total_sell.is_distinct_from(actual.c.total_sell),
+            BidORM.margin_dollars.is_distinct_from(actual.c.total_sell - actual.c.total_cost),
+            BidORM.margin_percent.is_distinct_from(
+                _margin_percent(actual.c.total_cost, actual.c.total_sell)
+            ),
+        )
+        conditions = [BidORM.id == actual.c.bid_id, drifted]
+        if bid_ids is not None:
+            conditions.append(BidORM.id.in_(bid_ids))
+
+        rows = (
+            db.query(
+                BidORM.id,
+                BidORM.bid_number,
+                BidORM.total_cost,
+                actual.c.total_cost.label("actual_cost"),
+                BidORM.total_sell,
+                actual.c.total_sell.label("actual_sell"),
+            )
+            .filter(*conditions)
+            .order_by(BidORM.bid_number)
+            .all()
+        )
+
+        drift = [
+            {
+                "bid_id": row.id,
+                "bid_number": row.bid_number,
+                "stored_cost": row.total_cost,
+                "actual_cost": row.actual_cost,
+                "stored_sell": row.total_sell,
+                "actual_sell": row.actual_sell,
+            }
+            for row in rows
+        ]
+
+        if repair and drift:
+            try:
+                db.execute(
+                    update(BidORM)
+                    .where(*conditions)
+                    .values(**_totals_values(actual.c.total_cost, actual.c.total_sell))
+                    .execution_options(synchronize_session=False)
+                )
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+
+        return drift
+
+    @staticmethod
+    def create_revision(
+        db: Session,
+        bid_id: UUID,
+        revision_reason: Optional[str] = None,
+        revised_by: Optional[str] = None,
+    ) -> Optional[BidRevisionORM]:
+        """
+        Record the current bid and its lines as a new revision
+
+        Every SNAPSHOT_KEYFRAME_INTERVAL-th revision (starting with the first)
+        stores the full state; the others store a compressed line-level delta
+        against the previous revision. price_delta is the change in total sell.
+
+        Args:
+            db: Database session
+            bid_id: Bid to snapshot
+            revision_reason: Reason for revision
+            revised_by: User who made the revision
+
+        Returns:
+            Created revision or None if the bid does not exist
+        """
+        # Lock the bid so concurrent revisions get distinct numbers; totals
+        # are maintained by SQL updates, so reload over any cached instance
+        bid = (
+            db.query(BidORM)
+            .filter(BidORM.id == bid_id)
+            .with_for_update()
+            .populate_existing()
+            .first()
+        )
+        if not bid:
+            return None
+
+        items = (
+            db.query(BidItemORM.id, *[getattr(BidItemORM, f) for f in bid_snapshots.ITEM_FIELDS])
+            .filter(BidItemORM.bid_id == bid_id)
+            .all()
+        )
+        state = bid_snapshots.build_state(bid, items)
+
+        last = (
+            db.query(
+                BidRevisionORM.revision_number,
+                BidRevisionORM.bid_snapshot["total_sell"].astext.label("total_sell"),
+            )
+            .filter(BidRevisionORM.bid_id == bid_id)
+            .order_by(BidRevisionORM.revision_number.desc())
+            .first()
+        )
+        revision_number = last.revision_number + 1 if last else 1
+
+        previous = None
+        if last and not bid_snapshots.needs_keyframe(revision_number):
+            previous = BidService._load_revision_state(db, bid_id, last.revision_number)
+
+        if previous is None:
+            snapshot = bid_snapshots.encode(bid_snapshots.KEYFRAME, state, state)
+        else:
+            delta = bid_snapshots.diff_states(previous, state)
+            snapshot = bid_snapshots.encode(bid_snapshots.DELTA, delta, state)
+
+        price_delta = None
+        if last:
+            price_delta = Decimal(state["bid"]["total_sell"] or 0) - Decimal(last.total_sell or 0)
+
+        revision = BidRevisionORM(
+            bid_id=bid_id,
+            revision_number=revision_number,
+            revised_date=date.today(),
+            revision_reason=revision_reason,
+            price_delta=price_delta,
+            revised_by=revised_by,
+            bid_snapshot=snapshot,
+        )
+        try:
+            db.add(revision)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        db.refresh(revision)
+        return revision
+
+    @staticmethod
+    def get_revision_snapshot(
+        db: Session, bid_id: UUID, revision_number: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Rebuild the bid state at a revision
+
+        Loads the nearest keyframe at or before the revision plus the deltas
+        after it (at most SNAPSHOT_KEYFRAME_INTERVAL rows).
+
+        Args:
+            db: Database session
+            bid_id: Bid reference
+            revision_number: Revision to rebuild
+
+        Returns:
+            {"bid": {...}, "items": {item_id: {...}}} or None if not found
+        """
+        return BidService._load_revision_state(db, bid_id, revision_number)
+
+    @staticmethod
+    def diff_revisions(
+        db: Session, bid_id: UUID, from_revision: int, to_revision: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Compare two revisions of a bid
+
+        Args:
+            db: Database session
+            bid_id: Bid reference
+            from_revision: Older revision number
+            to_revision: Newer revision number
+
+        Returns:
+            Header changes and added/removed/changed lines (with old and new
+            values), None if either revision does not exist
+        """
+        old = BidService._load_revision_state(db, bid_id, from_revision)
+        new = BidService._load_revision_state(db, bid_id, to_revision)
+        if old is None or new is None:
+            return None
+
+        return bid_snapshots.compare_states(old, new)
+
+    @staticmethod
+    def _load_revision_state(
+        db: Session, bid_id: UUID, revision_number: int
+    ) -> Optional[Dict[str, Any]]:
+        """Replay the keyframe at or before revision_number and the deltas after it"""
+        keyframe_number = (
+            select(func.max(BidRevisionORM.revision_number))
+            .where(
+                BidRevisionORM.bid_id == bid_id,
+                BidRevisionORM.revision_number <= revision_number,
+                BidRevisionORM.bid_snapshot["kind"].astext == bid_snapshots.KEYFRAME,
+            )
+            .scalar_subquery()
+        )
+        rows = (
+            db.query(BidRevisionORM.revision_number, BidRevisionORM.bid_snapshot)
+            .filter(
+                BidRevisionORM.bid_id == bid_id,
+                BidRevisionORM.revision_number >= keyframe_number,
+                BidRevisionORM.revision_number <= revision_number,
+            )
+            .order_by(BidRevisionORM.revision_number)
+            .all()
+        )
+        if not rows or rows[-1].revision_number != revision_number:
+            return None
+
+        state = bid_snapshots.decode(rows[0].bid_snapshot)
+        for row in rows[1:]:
+            state = bid_snapshots.apply_delta(state, bid_snapshots.decode(row.bid_snapshot))
+        return state
+
+    @staticmethod
+    def _apply_totals_delta(
+        db: Session, bid_id: UUID, cost_delta: Optional[Decimal], sell_delta: Optional[Decimal]
+    ) -> None:
+        """
+        Shift the bid totals by a line delta in SQL (does not commit)
+
+        Computed from the stored values inside the UPDATE, so concurrent item
+        writes on the same bid serialize on the bid row instead of losing
+        each other's changes.
+        """
+        total_cost = func.coalesce(BidORM.total_cost, 0) + (cost_delta or 0)
+        total_sell = func.coalesce(BidORM.total_sell, 0) + (sell_delta or 0)
+        db.execute(
+            update(BidORM)
+            .where(BidORM.id == bid_id)
+            .values(**_totals_values(total_cost, total_sell))
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def _next_bid_number(bid_date: date) -> str:
+        """Generate a unique bid number (B20250115-1A2B3C)"""
+        return f"B{bid_date:%Y%m%d}-{uuid.uuid4().hex[:6].upper()}"
@@ -0,0 +1,192 @@
+"""
+Bid Revision Snapshots
+Compact storage for bid_revisions.bid_snapshot
+
+A revision snapshot is either a keyframe (the full bid state) or a delta
+against the previous revision (changed header fields plus added, removed
+and changed lines). Payloads are zlib-compressed JSON; only a small header
+(kind, totals, line count) stays readable in JSONB for reporting.
+
+A keyframe is written every SNAPSHOT_KEYFRAME_INTERVAL revisions, so
+rebuilding revision N reads at most that many rows instead of the whole
+history.
+
+State format (what get_revision_snapshot returns):
+    {
+        "bid": {"status": ..., "total_sell": "1234.50", ...},
+        "items": {"<bid_item_id>": {"material_id": ..., "quantity": "12.0000", ...}},
+    }
+Values are JSON-safe (Decimal/UUID/date as strings).
+"""
+
+import base64
+import json
+import os
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Mapping
+from uuid import UUID
+
+# Full snapshot every N revisions (bounds reconstruction cost)
+SNAPSHOT_KEYFRAME_INTERVAL = int(os.getenv("SNAPSHOT_KEYFRAME_INTERVAL", "10"))
+
+SNAPSHOT_VERSION = 1
+KEYFRAME = "keyframe"
+DELTA = "delta"
+
+# Bid header fields captured in each snapshot
+BID_FIELDS = (
+    "bid_number",
+    "customer_id",
+    "plan_id",
+    "status",
+    "valid_until",
+    "notes",
+    "total_cost",
+    "total_sell",
+    "margin_dollars",
+    "margin_percent",
+)
+
+# Line fields captured for each bid item
+ITEM_FIELDS = (
+    "material_id",
+    "pack_code",
+    "quantity",
+    "unit_cost",
+    "unit_sell",
+    "line_total_cost",
+    "line_total_sell",
+    "is_optional",
+    "line_number",
+)
+
+
+def _json_value(value: Any) -> Any:
+    """Convert a column value to a JSON-safe value"""
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def build_state(bid: Any, items: Iterable[Any]) -> Dict[str, Any]:
+    """
+    Capture the snapshot state of a bid and its items
+
+    Args:
+        bid: Bid row (ORM object or row with BID_FIELDS attributes)
+        items: Item rows with an id plus ITEM_FIELDS attributes
+
+    Returns:
+        State dict (see module docstring)
+    """
+    return {
+        "bid": {field: _json_value(getattr(bid, field)) for field in BID_FIELDS},
+        "items": {
+            str(item.id): {field: _json_value(getattr(item, field)) for field in ITEM_FIELDS}
+            for item in items
+        },
+    }
+
+
+def diff_states(old: Mapping[str, Any], new: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Line-level difference between two states
+
+    Returns:
+        {"bid": {field: new_value}, "added": {id: line}, "removed": [ids],
+         "changed": {id: {field: new_value}}}
+    """
+    old_items, new_items = old["items"], new["items"]
+    changed = {}
+    for item_id, line in new_items.items():
+        previous = old_items.get(item_id)
+        if previous is not None and previous != line:
+            changed[item_id] = {
+                field: value for field, value in line.items() if previous.get(field) != value
+            }
+
+    return {
+        "bid": {
+            field: value for field, value in new["bid"].items() if old["bid"].get(field) != value
+        },
+        "added": {
+            item_id: line for item_id, line in new_items.items() if item_id not in old_items
+        },
+        "removed": sorted(item_id for item_id in old_items if item_id not in new_items),
+        "changed": changed,
+    }
+
+
+def compare_states(old: Mapping[str, Any], new: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Human-oriented difference between two states (old and new values)
+
+    Returns:
+        {"bid": {field: {"from": a, "to": b}}, "added": {id: line},
+         "removed": {id: line}, "changed": {id: {field: {"from": a, "to": b}}}}
+    """
+    delta = diff_states(old, new)
+    return {
+        "bid": {
+            field: {"from": old["bid"].get(field), "to": value}
+            for field, value in delta["bid"].items()
+        },
+        "added": delta["added"],
+        "removed": {item_id: old["items"][item_id] for item_id in delta["removed"]},
+        "changed": {
+            item_id: {
+                field: {"from": old["items"][item_id].get(field), "to": value}
+                for field, value in fields.items()
+            }
+            for item_id, fields in delta["changed"].items()
+        },
+    }
+
+
+def apply_delta(state: Mapping[str, Any], delta: Mapping[str, Any]) -> Dict[str, Any]:
+    """Apply a diff_states() delta to a state, returning the new state"""
+    items = {item_id: dict(line) for item_id, line in state["items"].items()}
+    for item_id in delta["removed"]:
+        items.pop(item_id, None)
+    for item_id, fields in delta["changed"].items():
+        items[item_id].update(fields)
+    items.update({item_id: dict(line) for item_id, line in delta["added"].items()})
+
+    return {"bid": {**state["bid"], **delta["bid"]}, "items": items}
+
+
+def encode(kind: str, payload: Mapping[str, Any], state: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Build the bid_snapshot JSONB value for a keyframe or delta
+
+    Args:
+        kind: KEYFRAME (payload is the full state) or DELTA (payload from diff_states)
+        payload: Data to compress
+        state: Full state after this revision (for the readable summary)
+
+    Returns:
+        JSONB document with kind, summary and compressed data
+    """
+    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode()
+    return {
+        "v": SNAPSHOT_VERSION,
+        "kind": kind,
+        "total_cost": state["bid"].get("total_cost"),
+        "total_sell": state["bid"].get("total_sell"),
+        "item_count": len(state["items"]),
+        "data": base64.b64encode(zlib.compress(raw, 6)).decode("ascii"),
+    }
+
+
+def decode(snapshot: Mapping[str, Any]) -> Dict[str, Any]:
+    """Decompress the payload of a bid_snapshot document"""
+    return json.loads(zlib.decompress(base64.b64decode(snapshot["data"])))
+
+
+def needs_keyframe(revision_number: int) -> bool:
+    """Revision numbers that start a new keyframe (1, 1 + interval, ...)"""
+    return (revision_number - 1) % max(SNAPSHOT_KEYFRAME_INTERVAL, 1) == 0
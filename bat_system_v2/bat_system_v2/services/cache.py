@@ -0,0 +1,164 @@
+"""
+In-process Cache
+Bounded LRU cache for read-mostly lookups (prices, counts, SKUs)
+
+Pricing tables only change during monthly updates, so repeated lookups
+for the same material can be answered from memory instead of PostgreSQL.
+Writers invalidate entries by tag (e.g. a material_id) without having to
+know every key that depends on that record.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+# Returned by LRUCache.get() on a miss, so that None can be cached as a value
+MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache with a size bound, optional TTL and tag invalidation
+
+    Usage:
+        cache = LRUCache(max_size=10000)
+        value = cache.get(key)
+        if value is MISSING:
+            value = expensive_lookup()
+            cache.set(key, value, tags=(material_id,))
+
+        cache.invalidate_tags([material_id])  # after a write
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl: Optional[float] = None,
+        normalize_tag: Optional[Callable[[Hashable], Hashable]] = None,
+    ):
+        """
+        Args:
+            max_size: Maximum number of entries before least-recently-used eviction
+            ttl: Optional time-to-live in seconds (None = entries never expire)
+            normalize_tag: Applied to tags in set() and invalidate_tags(), so equal
+                ids passed as different types (str vs UUID) match
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self._normalize_tag = normalize_tag or (lambda tag: tag)
+        self._lock = threading.Lock()
+        # key -> (value, expires_at, tags)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Optional[float], Tuple]]" = OrderedDict()
+        # tag -> keys carrying that tag
+        self._tags: Dict[Hashable, Set[Hashable]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """Return cached value (marking it recently used) or default on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, expires_at, _ = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, tags: Iterable[Hashable] = ()) -> None:
+        """Store value, evicting the least recently used entries when full"""
+        tags = tuple(self._normalize_tag(tag) for tag in tags)
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (value, expires_at, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.max_size:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Drop a single entry, returns True if it was cached"""
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            self.invalidations += 1
+            return True
+
+    def invalidate_tags(self, tags: Iterable[Hashable]) -> int:
+        """Drop every entry carrying any of the given tags, returns entries dropped"""
+        tags = [self._normalize_tag(tag) for tag in tags]
+        dropped = 0
+        with self._lock:
+            for tag in tags:
+                for key in self._tags.pop(tag, set()):
+                    if key in self._entries:
+                        self._remove(key)
+                        dropped += 1
+            self.invalidations += dropped
+        return dropped
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)"""
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._tags.clear()
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss/eviction counters"""
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+            self.expirations = self.invalidations = 0
+
+    def stats(self) -> dict:
+        """Get cache counters and hit rate"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove key and its tag references (caller holds the lock)"""
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
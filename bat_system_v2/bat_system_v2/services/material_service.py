@@ -1,321 +1,1097 @@
-"""
-Material Catalog Service
-Replaces Excel VLOOKUP with fast database queries
-
-Key functionality:
-- Fast SKU lookup (replaces VLOOKUP)
-- Full-text search
-- CRUD operations
-- Bulk import from Excel
-"""
-
-from typing import List, Optional
-from uuid import UUID
-
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
-
-from ..database.base import Base
-from ..models.material import (
-    Material,
-    MaterialCreate,
-    MaterialInDB,
-    MaterialSearch,
-    MaterialUpdate,
-    MaterialWithPricing,
-)
-
-
-# SQLAlchemy ORM Model (matching database schema)
-from sqlalchemy import Boolean, Column, Integer, String, Text, TIMESTAMP
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.sql import func
-import uuid
-
-
-class MaterialORM(Base):
-    """Material ORM model matching database schema"""
-
-    __tablename__ = "materials"
-
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    sku = Column(String(50), unique=True, nullable=False, index=True)
-    description = Column(Text, nullable=False)
-    online_description = Column(Text)
-    category_id = Column(Integer)
-    uom = Column(String(20))
-    format1 = Column(String(20))
-    format2 = Column(String(20))
-    is_active = Column(Boolean, default=True, index=True)
-    created_at = Column(TIMESTAMP, server_default=func.now())
-    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
-
-
-class MaterialService:
-    """
-    Material Catalog Service
-
-    Replaces Excel VLOOKUP with database queries:
-    - Excel: =VLOOKUP(F12,PD,17,0)  [O(n) scan, slow]
-    - Database: SELECT * FROM materials WHERE sku = ? [O(1) index lookup, fast]
-    """
-
-    @staticmethod
-    def get_by_sku(db: Session, sku: str) -> Optional[MaterialORM]:
-        """
-        Fast SKU lookup - replaces Excel VLOOKUP
-
-        Excel equivalent: =VLOOKUP(sku, PD, column_index, 0)
-        Performance: Database index lookup ~100x faster than Excel VLOOKUP
-
-        Args:
-            db: Database session
-            sku: Material SKU (Excel Column F)
-
-        Returns:
-            Material if found, None otherwise
-        """
-        return db.query(MaterialORM).filter(MaterialORM.sku == sku).first()
-
-    @staticmethod
-    def get_by_id(db: Session, material_id: UUID) -> Optional[MaterialORM]:
-        """Get material by UUID"""
-        return db.query(MaterialORM).filter(MaterialORM.id == material_id).first()
-
-    @staticmethod
-    def search(db: Session, search_params: MaterialSearch) -> List[MaterialORM]:
-        """
-        Advanced material search
-
-        Supports:
-        - Full-text search in SKU and description
-        - Category filtering
-        - Active/inactive filtering
-        - Pagination
-
-        Args:
-            db: Database session
-            search_params: Search parameters
-
-        Returns:
-            List of materials matching criteria
-        """
-        query = db.query(MaterialORM)
-
-        # Apply filters
-        if search_params.query:
-            # Search in both SKU and description
-            search_term = f"%{search_params.query}%"
-            query = query.filter(
-                or_(
-                    MaterialORM.sku.ilike(search_term),
-                    MaterialORM.description.ilike(search_term),
-                )
-            )
-
-        if search_params.sku_contains:
-            query = query.filter(MaterialORM.sku.ilike(f"%{search_params.sku_contains}%"))
-
-        if search_params.description_contains:
-            query = query.filter(
-                MaterialORM.description.ilike(f"%{search_params.description_contains}%")
-            )
-
-        if search_params.category_id is not None:
-            query = query.filter(MaterialORM.category_id == search_params.category_id)
-
-        if search_params.is_active is not None:
-            query = query.filter(MaterialORM.is_active == search_params.is_active)
-
-        # Apply pagination
-        query = query.offset(search_params.offset).limit(search_params.limit)
-
-        return query.all()
-
-    @staticmethod
-    def get_all(
-        db: Session, skip: int = 0, limit: int = 100, active_only: bool = True
-    ) -> List[MaterialORM]:
-        """
-        Get all materials with pagination
-
-        Args:
-            db: Database session
-            skip: Number of records to skip
-            limit: Maximum records to return
-            active_only: Filter to active materials only
-
-        Returns:
-            List of materials
-        """
-        query = db.query(MaterialORM)
-
-        if active_only:
-            query = query.filter(MaterialORM.is_active == True)
-
-        return query.offset(skip).limit(limit).all()
-
-    @staticmethod
-    def count(db: Session, active_only: bool = True) -> int:
-        """Get total count of materials"""
-        query = db.query(MaterialORM)
-        if active_only:
-            query = query.filter(MaterialORM.is_active == True)
-        return query.count()
-
-    @staticmethod
-    def create(db: Session, material: MaterialCreate) -> MaterialORM:
-        """
-        Create new material
-
-        Args:
-            db: Database session
-            material: Material creation data
-
-        Returns:
-            Created material
-
-        Raises:
-            IntegrityError: If SKU already exists
-        """
-        db_material = MaterialORM(**material.model_dump())
-        db.add(db_material)
-        db.commit()
-        db.refresh(db_material)
-        return db_material
-
-    @staticmethod
-    def bulk_create(db: Session, materials: List[MaterialCreate]) -> List[MaterialORM]:
-        """
-        Bulk create materials - optimized for Excel imports
-
-        Used by auto_import_bat.py to import thousands of materials quickly
-
-        Args:
-            db: Database session
-            materials: List of materials to create
-
-        Returns:
-            List of created materials
-        """
-        db_materials = [MaterialORM(**m.model_dump()) for m in materials]
-        db.bulk_save_objects(db_materials)
-        db.commit()
-        return db_materials
-
-    @staticmethod
-    def update(db: Session, material_id: UUID, material: MaterialUpdate) -> Optional[MaterialORM]:
-        """
-        Update existing material
-
-        Args:
-            db: Database session
-            material_id: Material UUID
-            material: Update data (only non-None fields are updated)
-
-        Returns:
-            Updated material if found, None otherwise
-        """
-        db_material = MaterialService.get_by_id(db, material_id)
-        if not db_material:
-            return None
-
-        # Update only provided fields
-        update_data = material.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_material, field, value)
-
-        db.commit()
-        db.refresh(db_material)
-        return db_material
-
-    @staticmethod
-    def delete(db: Session, material_id: UUID) -> bool:
-        """
-        Delete material (soft delete by setting is_active=False)
-
-        Args:
-            db: Database session
-            material_id: Material UUID
-
-        Returns:
-            True if deleted, False if not found
-        """
-        db_material = MaterialService.get_by_id(db, material_id)
-        if not db_material:
-            return False
-
-        db_material.is_active = False
-        db.commit()
-        return True
-
-    @staticmethod
-    def hard_delete(db: Session, material_id: UUID) -> bool:
-        """
-        Permanently delete material from database
-
-        Warning: This cannot be undone!
-
-        Args:
-            db: Database session
-            material_id: Material UUID
-
-        Returns:
-            True if deleted, False if not found
-        """
-        db_material = MaterialService.get_by_id(db, material_id)
-        if not db_material:
-            return False
-
-        db.delete(db_material)
-        db.commit()
-        return True
-
-    @staticmethod
-    def get_with_pricing(
-        db: Session, material_id: UUID, price_level: Optional[str] = None
-    ) -> Optional[MaterialWithPricing]:
-        """
-        Get material with current pricing information
-
-        Combines material data with pricing (replaces multiple Excel VLOOKUP calls)
-
-        Args:
-            db: Database session
-            material_id: Material UUID
-            price_level: Price level code (01, 02, 03, L5)
-
-        Returns:
-            Material with pricing data
-        """
-        # TODO: Implement join with pricing tables
-        # This will replace Excel's nested VLOOKUP formulas
-        db_material = MaterialService.get_by_id(db, material_id)
-        if not db_material:
-            return None
-
-        # Convert to MaterialWithPricing
-        # In full implementation, would join material_pricing and customer_pricing tables
-        return MaterialWithPricing(
-            **db_material.__dict__,
-            current_cost=None,  # TODO: Get from material_pricing
-            current_price_01=None,  # TODO: Calculate based on price level
-            current_price_02=None,
-            current_price_03=None,
-            current_price_l5=None,
-            supplier_name=None,  # TODO: Get from suppliers table
-        )
-
-    @staticmethod
-    def verify_sku_exists(db: Session, sku: str) -> bool:
-        """
-        Quick check if SKU exists - useful for data validation
-
-        Args:
-            db: Database session
-            sku: Material SKU to check
-
-        Returns:
-            True if exists, False otherwise
-        """
-        return db.query(MaterialORM).filter(MaterialORM.sku == sku).count() > 0
+"""
+Material Catalog Service
+Replaces Excel VLOOKUP with fast database queries
+
+Key functionality:
+- Fast SKU lookup (replaces VLOOKUP)
+- Full-text search
+- CRUD operations
+- Bulk import from Excel
+"""
+
+import base64
+import binascii
+import io
+import json
+import os
+import re
+import warnings
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from uuid import UUID
+
+from sqlalchemy import (
+    Select,
+    and_,
+    any_,
+    bindparam,
+    case,
+    column,
+    exists,
+    literal,
+    or_,
+    select,
+    table,
+    text,
+    tuple_,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, deferred
+
+from ..database.base import Base
+from ..database.connection import replica_read
+from ..models.material import (
+    Material,
+    MaterialCreate,
+    MaterialInDB,
+    MaterialSearch,
+    MaterialSearchResult,
+    MaterialUpdate,
+    MaterialWithPricing,
+)
+from .cache import MISSING, LRUCache
+from .pricing_service import MaterialPriceSummaryORM
+
+
+# SQLAlchemy ORM Model (matching database schema)
+from sqlalchemy import Boolean, Column, Computed, Integer, String, Text, TIMESTAMP
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR, UUID as PG_UUID
+from sqlalchemy.sql import func
+import uuid
+
+
+class MaterialORM(Base):
+    """Material ORM model matching database schema"""
+
+    __tablename__ = "materials"
+
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    sku = Column(String(50), unique=True, nullable=False, index=True)
+    description = Column(Text, nullable=False)
+    online_description = Column(Text)
+    category_id = Column(Integer)
+    uom = Column(String(20))
+    format1 = Column(String(20))
+    format2 = Column(String(20))
+    is_active = Column(Boolean, default=True, index=True)
+    created_at = Column(TIMESTAMP, server_default=func.now())
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+    # Generated full-text document, only loaded by ranked search
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "to_tsvector('simple', coalesce(sku, '') || ' ' || coalesce(description, ''))",
+                persisted=True,
+            ),
+        )
+    )
+
+
+# Exact catalog counts keyed by (table, active_only, bind). Pagination asks
+# for the total on every page; writes below clear the cache, the TTL bounds
+# staleness from writers in other processes. The bind keeps counts read from
+# the (possibly lagging) replica apart from primary counts.
+MATERIAL_COUNT_TTL = float(os.getenv("MATERIAL_COUNT_TTL", "30"))
+count_cache = LRUCache(max_size=64, ttl=MATERIAL_COUNT_TTL)
+
+_pg_class = table("pg_class", column("oid"), column("reltuples"))
+
+
+# Optional read-through SKU cache for resolve_skus(use_cache=True): sku ->
+# Material snapshot. Only hits are cached, so a newly created SKU is never
+# reported missing because of the cache.
+SKU_CACHE_SIZE = int(os.getenv("SKU_CACHE_SIZE", "100000"))
+SKU_CACHE_TTL = float(os.getenv("SKU_CACHE_TTL", "300"))
+sku_cache = LRUCache(max_size=SKU_CACHE_SIZE, ttl=SKU_CACHE_TTL)
+
+# SKUs per "= ANY(:skus)" query in resolve_skus
+SKU_RESOLVE_CHUNK_SIZE = int(os.getenv("SKU_RESOLVE_CHUNK_SIZE", "5000"))
+
+
+def _count_cache_key(db: Union[Session, AsyncSession], statement: Select, active_only: bool) -> tuple:
+    """Cache key for an exact count, including the engine the statement will run on"""
+    bind = db.get_bind(clause=statement)
+    return (MaterialORM.__tablename__, active_only, bind.url.render_as_string(hide_password=True))
+
+
+def _invalidate_counts() -> None:
+    """Drop cached catalog counts after a write that adds/removes/(de)activates rows"""
+    count_cache.clear()
+
+
+def _invalidate_skus(skus: Optional[Iterable[str]] = None) -> None:
+    """Drop cached SKU lookups for the given SKUs (None = all, e.g. after a bulk load)"""
+    if skus is None:
+        sku_cache.clear()
+    else:
+        for sku in skus:
+            sku_cache.invalidate(sku)
+
+
+# Read-model columns loaded next to MaterialORM for MaterialWithPricing
+_PRICING_COLUMNS = (
+    MaterialPriceSummaryORM.current_cost,
+    MaterialPriceSummaryORM.price_01.label("current_price_01"),
+    MaterialPriceSummaryORM.price_02.label("current_price_02"),
+    MaterialPriceSummaryORM.price_03.label("current_price_03"),
+    MaterialPriceSummaryORM.price_l5.label("current_price_l5"),
+    MaterialPriceSummaryORM.supplier_name,
+)
+
+
+def _with_pricing(query):
+    """Add the price summary columns (outer join: unpriced materials keep None)"""
+    return query.add_columns(*_PRICING_COLUMNS).outerjoin(
+        MaterialPriceSummaryORM, MaterialPriceSummaryORM.material_id == MaterialORM.id
+    )
+
+
+def _material_with_pricing(row) -> MaterialWithPricing:
+    """Build MaterialWithPricing from a (MaterialORM, *_PRICING_COLUMNS) row"""
+    return MaterialWithPricing(
+        **Material.model_validate(row[0]).model_dump(),
+        current_cost=row.current_cost,
+        current_price_01=row.current_price_01,
+        current_price_02=row.current_price_02,
+        current_price_03=row.current_price_03,
+        current_price_l5=row.current_price_l5,
+        supplier_name=row.supplier_name,
+    )
+
+
+def _like_escape(value: str) -> str:
+    """Escape LIKE wildcards so user input matches literally"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _prefix_tsquery(value: str) -> Optional[str]:
+    """Build a prefix tsquery ("2x4 stud" -> "2x4:* & stud:*"), None if no words"""
+    words = re.findall(r"[A-Za-z0-9]+", value)
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
+
+def _encode_cursor(position: Dict[str, Any]) -> str:
+    """Encode a keyset position as an opaque, URL-safe cursor"""
+    raw = json.dumps(position, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, keys: Sequence[str]) -> Dict[str, Any]:
+    """Decode a cursor from _encode_cursor, raising ValueError if malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor}") from e
+
+    if not isinstance(position, dict) or any(key not in position for key in keys):
+        raise ValueError(f"Invalid pagination cursor: {cursor}")
+    return position
+
+
+# Column order for bulk_load rows (matches MaterialCreate field order)
+BULK_LOAD_COLUMNS = (
+    "sku",
+    "description",
+    "online_description",
+    "category_id",
+    "uom",
+    "format1",
+    "format2",
+    "is_active",
+)
+
+_BULK_LOAD_STAGE_SQL = text("""
+    CREATE TEMP TABLE materials_stage (
+        seq BIGSERIAL,
+        sku VARCHAR(50),
+        description TEXT,
+        online_description TEXT,
+        category_id INTEGER,
+        uom VARCHAR(20),
+        format1 VARCHAR(20),
+        format2 VARCHAR(20),
+        is_active BOOLEAN
+    ) ON COMMIT DROP
+""")
+
+_BULK_LOAD_COPY_SQL = (
+    f"COPY materials_stage ({', '.join(BULK_LOAD_COLUMNS)}) FROM STDIN"
+)
+
+# Upsert staged rows on sku (last row wins for duplicate SKUs in the input).
+# Unchanged rows are skipped by the WHERE clause and do not come back from
+# RETURNING; xmax = 0 identifies freshly inserted rows.
+_BULK_LOAD_UPSERT_SQL = text("""
+    WITH src AS (
+        SELECT DISTINCT ON (sku)
+            sku, description, online_description, category_id,
+            uom, format1, format2, COALESCE(is_active, true) AS is_active
+        FROM materials_stage
+        WHERE sku IS NOT NULL
+        ORDER BY sku, seq DESC
+    ),
+    upserted AS (
+        INSERT INTO materials AS m
+            (sku, description, online_description, category_id,
+             uom, format1, format2, is_active)
+        SELECT
+            sku, description, online_description, category_id,
+            uom, format1, format2, is_active
+        FROM src
+        ON CONFLICT (sku) DO UPDATE SET
+            description = EXCLUDED.description,
+            online_description = EXCLUDED.online_description,
+            category_id = EXCLUDED.category_id,
+            uom = EXCLUDED.uom,
+            format1 = EXCLUDED.format1,
+            format2 = EXCLUDED.format2,
+            is_active = EXCLUDED.is_active,
+            updated_at = NOW()
+        WHERE (m.description, m.online_description, m.category_id,
+               m.uom, m.format1, m.format2, m.is_active)
+            IS DISTINCT FROM
+              (EXCLUDED.description, EXCLUDED.online_description, EXCLUDED.category_id,
+               EXCLUDED.uom, EXCLUDED.format1, EXCLUDED.format2, EXCLUDED.is_active)
+        RETURNING (xmax = 0) AS inserted
+    )
+    SELECT
+        (SELECT COUNT(*) FROM src) AS staged,
+        COUNT(*) FILTER (WHERE inserted) AS inserted,
+        COUNT(*) FILTER (WHERE NOT inserted) AS updated
+    FROM upserted
+""")
+
+MaterialRow = Union[MaterialCreate, Dict[str, Any], Sequence[Any]]
+
+
+def _copy_value(value: Any) -> str:
+    """Render one value in PostgreSQL COPY text format"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _copy_line(row: MaterialRow) -> str:
+    """Render a MaterialCreate, dict or positional row as one COPY line"""
+    if isinstance(row, MaterialCreate):
+        row = row.model_dump()
+    if isinstance(row, dict):
+        values = [row.get(column) for column in BULK_LOAD_COLUMNS]
+    else:
+        values = list(row) + [None] * (len(BULK_LOAD_COLUMNS) - len(row))
+    return "\t".join(_copy_value(value) for value in values) + "\n"
+
+
+class _CopyStream(io.TextIOBase):
+    """
+    Read-only file object that renders rows to COPY text on demand
+
+    COPY pulls fixed-size blocks, so only one block of rows is held in
+    memory no matter how many rows the iterable produces.
+    """
+
+    def __init__(self, rows: Iterable[MaterialRow]):
+        self._lines: Iterator[str] = (_copy_line(row) for row in rows)
+        self._buffer = ""
+        self.rows_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> str:
+        while size is None or size < 0 or len(self._buffer) < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self._buffer += line
+            self.rows_read += 1
+
+        if size is None or size < 0:
+            chunk, self._buffer = self._buffer, ""
+        else:
+            chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
+class MaterialService:
+    """
+    Material Catalog Service
+
+    Replaces Excel VLOOKUP with database queries:
+    - Excel: =VLOOKUP(F12,PD,17,0)  [O(n) scan, slow]
+    - Database: SELECT * FROM materials WHERE sku = ? [O(1) index lookup, fast]
+    """
+
+    @staticmethod
+    def get_by_sku(db: Session, sku: str) -> Optional[MaterialORM]:
+        """
+        Fast SKU lookup - replaces Excel VLOOKUP
+
+        Excel equivalent: =VLOOKUP(sku, PD, column_index, 0)
+        Performance: Database index lookup ~100x faster than Excel VLOOKUP
+
+        Args:
+            db: Database session
+            sku: Material SKU (Excel Column F)
+
+        Returns:
+            Material if found, None otherwise
+        """
+        return db.query(MaterialORM).filter(MaterialORM.sku == sku).first()
+
+    @staticmethod
+    def resolve_skus(
+        db: Session,
+        skus: Iterable[str],
+        use_cache: bool = False,
+        chunk_size: int = SKU_RESOLVE_CHUNK_SIZE,
+    ) -> Tuple[Dict[str, Material], List[str]]:
+        """
+        Bulk SKU lookup - replaces a column of VLOOKUPs
+
+        Resolves every SKU of an import file or bid with one
+        "sku = ANY(:skus)" query per chunk instead of one query per row.
+
+        Excel equivalent: =VLOOKUP(F2:F5000, PD, column_index, 0)
+
+        Args:
+            db: Database session
+            skus: SKUs to resolve (duplicates are looked up once)
+            use_cache: Read through the process-local SKU cache (SKU_CACHE_TTL)
+            chunk_size: SKUs per query
+
+        Returns:
+            (sku -> Material for found SKUs, missing SKUs in input order)
+        """
+        pending = list(dict.fromkeys(skus))
+        found: Dict[str, Material] = {}
+
+        if use_cache:
+            uncached = []
+            for sku in pending:
+                material = sku_cache.get(sku)
+                if material is MISSING:
+                    uncached.append(sku)
+                else:
+                    found[sku] = material
+            pending = uncached
+
+        lookup = (
+            select(MaterialORM)
+            .where(MaterialORM.sku == any_(bindparam("skus", type_=ARRAY(String))))
+        )
+        step = max(chunk_size, 1)
+        for start in range(0, len(pending), step):
+            chunk = pending[start:start + step]
+            for row in db.execute(lookup, {"skus": chunk}).scalars():
+                material = Material.model_validate(row)
+                found[row.sku] = material
+                if use_cache:
+                    sku_cache.set(row.sku, material)
+
+        missing = [sku for sku in pending if sku not in found]
+        return found, missing
+
+    @staticmethod
+    def get_by_id(db: Session, material_id: UUID) -> Optional[MaterialORM]:
+        """Get material by UUID"""
+        return db.query(MaterialORM).filter(MaterialORM.id == material_id).first()
+
+    @staticmethod
+    @replica_read
+    def search(db: Session, search_params: MaterialSearch) -> List[MaterialORM]:
+        """
+        Advanced material search
+
+        Supports:
+        - Full-text search in SKU and description
+        - Category filtering
+        - Active/inactive filtering
+        - Pagination
+
+        Uses the same indexed (tsvector + pg_trgm) predicates and relevance
+        order as search_ranked(); use that for cursor paging and totals.
+
+        Args:
+            db: Database session
+            search_params: Search parameters
+
+        Returns:
+            List of materials matching criteria, most relevant first
+        """
+        query, rank = MaterialService._search_query(db.query(MaterialORM), search_params)
+
+        return (
+            query.order_by(*MaterialService._search_order(search_params, rank))
+            .offset(search_params.offset)
+            .limit(search_params.limit)
+            .all()
+        )
+
+    @staticmethod
+    @replica_read
+    def search_ranked(db: Session, search_params: MaterialSearch) -> MaterialSearchResult:
+        """
+        Indexed, ranked material search (estimator search box)
+
+        Matches the query against the full-text document (prefix per word),
+        SKU prefix and SKU/description substrings. Every predicate is backed
+        by a GIN index (tsvector or pg_trgm), so latency stays flat as the
+        catalog grows. Results are ordered by relevance: exact SKU, then SKU
+        prefix, then full-text rank.
+
+        Pass search_params.cursor (next_cursor of the previous page) for
+        keyset pagination; it is used instead of offset. With
+        count_mode="exact" the total match count comes back in the same query.
+
+        Args:
+            db: Database session
+            search_params: Search parameters (same filters as search())
+
+        Returns:
+            Ranked page of materials with total count and next_cursor
+        """
+        query, rank = MaterialService._search_query(db.query(MaterialORM), search_params)
+
+        # Window count is only the full total on offset pages; after a
+        # cursor it would count the remaining rows, so count separately
+        window_count = search_params.count_mode == "exact" and not search_params.cursor
+        page = query.add_columns(rank.label("rank"))
+        if window_count:
+            page = page.add_columns(func.count().over().label("total_count"))
+
+        offset = search_params.offset
+        if search_params.cursor:
+            position = _decode_cursor(search_params.cursor, ("rank", "sku", "id"))
+            page = page.filter(
+                or_(
+                    rank < position["rank"],
+                    and_(
+                        rank == position["rank"],
+                        tuple_(MaterialORM.sku, MaterialORM.id)
+                        > tuple_(literal(position["sku"]), literal(UUID(position["id"]))),
+                    ),
+                )
+            )
+            offset = 0
+
+        rows = (
+            page.order_by(*MaterialService._search_order(search_params, rank))
+            .offset(offset)
+            .limit(search_params.limit + 1)
+            .all()
+        )
+        has_more = len(rows) > search_params.limit
+        rows = rows[:search_params.limit]
+
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            next_cursor = _encode_cursor(
+                {"rank": float(last.rank), "sku": last[0].sku, "id": str(last[0].id)}
+            )
+
+        total_count, is_estimate = None, False
+        if search_params.count_mode == "exact":
+            if window_count and rows:
+                total_count = rows[0].total_count
+            elif window_count and not offset:
+                total_count = 0
+            else:
+                # Cursor page, or offset past the end: count directly
+                total_count = query.order_by(None).count()
+        elif search_params.count_mode == "estimate":
+            total_count, is_estimate = MaterialService._estimate_count(db, query), True
+
+        return MaterialSearchResult(
+            materials=[Material.model_validate(row[0]) for row in rows],
+            total_count=total_count,
+            total_is_estimate=is_estimate,
+            next_cursor=next_cursor,
+            limit=search_params.limit,
+            offset=offset,
+        )
+
+    @staticmethod
+    @replica_read
+    def get_page(
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        active_only: bool = True,
+        count_mode: str = "none",
+        with_pricing: bool = False,
+    ) -> MaterialSearchResult:
+        """
+        Keyset (cursor) pagination over the catalog ordered by (sku, id)
+
+        Unlike get_all(skip=...), every page is an index range scan starting
+        after the previous page's last row, so deep pages (catalog browser,
+        export jobs) cost the same as the first one.
+
+        Args:
+            db: Database session
+            cursor: next_cursor from the previous page (None = first page)
+            limit: Maximum records to return
+            active_only: Filter to active materials only
+            count_mode: "exact" (cached COUNT), "estimate" (statistics) or "none"
+            with_pricing: Return MaterialWithPricing rows (price summary joined
+                in the same query)
+
+        Returns:
+            Page of materials with next_cursor (None on the last page)
+        """
+        query = db.query(MaterialORM)
+        if active_only:
+            query = query.filter(MaterialORM.is_active == True)
+
+        page = query
+        if cursor:
+            position = _decode_cursor(cursor, ("sku", "id"))
+            page = page.filter(
+                tuple_(MaterialORM.sku, MaterialORM.id)
+                > tuple_(literal(position["sku"]), literal(UUID(position["id"])))
+            )
+
+        if with_pricing:
+            page = _with_pricing(page)
+
+        rows = page.order_by(MaterialORM.sku, MaterialORM.id).limit(limit + 1).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        if with_pricing:
+            materials = [_material_with_pricing(row) for row in rows]
+        else:
+            materials = [Material.model_validate(row) for row in rows]
+
+        next_cursor = None
+        if has_more:
+            next_cursor = _encode_cursor({"sku": materials[-1].sku, "id": str(materials[-1].id)})
+
+        total_count, is_estimate = None, False
+        if count_mode in ("exact", "estimate"):
+            total_count = MaterialService.count(db, active_only, mode=count_mode)
+            is_estimate = count_mode == "estimate"
+
+        return MaterialSearchResult(
+            materials=materials,
+            total_count=total_count,
+            total_is_estimate=is_estimate,
+            next_cursor=next_cursor,
+            limit=limit,
+            offset=0,
+        )
+
+    @staticmethod
+    def _estimate_count(db: Session, query) -> int:
+        """
+        Planner row estimate for a query (EXPLAIN, no table scan)
+
+        Accuracy depends on table statistics (ANALYZE); good enough for
+        "about N results" in pagination UIs.
+        """
+        statement = query.order_by(None).statement
+        compiled = statement.compile(dialect=db.get_bind().dialect)
+        plan = (
+            db.connection(bind_arguments={"clause": statement})
+            .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)
+            .scalar()
+        )
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    @staticmethod
+    def _search_query(query, search_params: MaterialSearch):
+        """
+        Apply the indexed text match and MaterialSearch filters to a query
+
+        The query text matches the full-text document (prefix per word), and
+        SKU/description substrings, each backed by a GIN index (tsvector or
+        pg_trgm). Works on ORM queries and select() statements.
+
+        Returns:
+            (filtered query, relevance expression: exact SKU, then SKU
+             prefix, then full-text rank)
+        """
+        rank = literal(0.0)
+
+        if search_params.query:
+            term = search_params.query.strip()
+            contains = f"%{_like_escape(term)}%"
+            prefix = f"{_like_escape(term)}%"
+            matches = [
+                MaterialORM.sku.ilike(contains, escape="\\"),
+                MaterialORM.description.ilike(contains, escape="\\"),
+            ]
+
+            rank = case(
+                (func.lower(MaterialORM.sku) == term.lower(), 3.0),
+                (MaterialORM.sku.ilike(prefix, escape="\\"), 2.0),
+                else_=0.0,
+            )
+
+            ts_query = _prefix_tsquery(term)
+            if ts_query:
+                tsquery = func.to_tsquery("simple", ts_query)
+                matches.append(MaterialORM.search_vector.op("@@")(tsquery))
+                rank = rank + func.ts_rank_cd(MaterialORM.search_vector, tsquery)
+
+            query = query.filter(or_(*matches))
+
+        return MaterialService._apply_search_filters(query, search_params), rank
+
+    @staticmethod
+    def _search_order(search_params: MaterialSearch, rank) -> list:
+        """ORDER BY for _search_query results (rank is a constant without query text)"""
+        order = [MaterialORM.sku, MaterialORM.id]
+        return [rank.desc(), *order] if search_params.query else order
+
+    @staticmethod
+    def _apply_search_filters(query, search_params: MaterialSearch):
+        """Apply the non-text MaterialSearch filters (shared by search and search_ranked)"""
+        if search_params.sku_contains:
+            query = query.filter(MaterialORM.sku.ilike(f"%{search_params.sku_contains}%"))
+
+        if search_params.description_contains:
+            query = query.filter(
+                MaterialORM.description.ilike(f"%{search_params.description_contains}%")
+            )
+
+        if search_params.category_id is not None:
+            query = query.filter(MaterialORM.category_id == search_params.category_id)
+
+        if search_params.is_active is not None:
+            query = query.filter(MaterialORM.is_active == search_params.is_active)
+
+        return query
+
+    @staticmethod
+    @replica_read
+    def get_all(
+        db: Session, skip: int = 0, limit: int = 100, active_only: bool = True
+    ) -> List[MaterialORM]:
+        """
+        Get all materials with pagination
+
+        Deprecated: OFFSET pagination reads and discards every skipped row,
+        so deep pages get slower as the catalog grows. Use get_page() (keyset
+        cursor) instead. Rows are ordered by (sku, id) like get_page(), so
+        pages are stable while callers migrate.
+
+        Args:
+            db: Database session
+            skip: Number of records to skip
+            limit: Maximum records to return
+            active_only: Filter to active materials only
+
+        Returns:
+            List of materials
+        """
+        warnings.warn(
+            "MaterialService.get_all() is deprecated, use get_page()",
+            DeprecationWarning,
+            stacklevel=3,  # caller of the @replica_read wrapper
+        )
+        query = db.query(MaterialORM)
+
+        if active_only:
+            query = query.filter(MaterialORM.is_active == True)
+
+        return query.order_by(MaterialORM.sku, MaterialORM.id).offset(skip).limit(limit).all()
+
+    @staticmethod
+    @replica_read
+    def count(db: Session, active_only: bool = True, mode: str = "exact") -> int:
+        """
+        Get total count of materials
+
+        Exact counts run a plain COUNT(*) (no subquery wrapper) and are cached
+        for MATERIAL_COUNT_TTL seconds; create/update/delete clear the cache.
+        Estimates read table statistics and never scan the table.
+
+        Args:
+            db: Database session
+            active_only: Count active materials only
+            mode: "exact" (cached COUNT) or "estimate" (pg_class.reltuples for
+                all rows, planner estimate for active rows; as of the last
+                ANALYZE/autovacuum)
+
+        Returns:
+            Number of materials
+
+        Raises:
+            ValueError: If mode is not "exact" or "estimate"
+        """
+        if mode == "estimate":
+            if not active_only:
+                reltuples = db.execute(
+                    select(_pg_class.c.reltuples).where(
+                        _pg_class.c.oid == func.to_regclass(MaterialORM.__tablename__)
+                    )
+                ).scalar()
+                # -1 = never analyzed: no statistics yet, fall through to COUNT
+                if reltuples is not None and reltuples >= 0:
+                    return int(reltuples)
+            else:
+                query = db.query(MaterialORM).filter(MaterialORM.is_active == True)
+                return MaterialService._estimate_count(db, query)
+        elif mode != "exact":
+            raise ValueError(f"Unknown count mode: {mode}")
+
+        query = select(func.count(MaterialORM.id))
+        if active_only:
+            query = query.where(MaterialORM.is_active == True)
+
+        cache_key = _count_cache_key(db, query, active_only)
+        cached = count_cache.get(cache_key)
+        if cached is not MISSING:
+            return cached
+
+        total = db.execute(query).scalar()
+
+        count_cache.set(cache_key, total)
+        return total
+
+    @staticmethod
+    def create(db: Session, material: MaterialCreate) -> MaterialORM:
+        """
+        Create new material
+
+        Args:
+            db: Database session
+            material: Material creation data
+
+        Returns:
+            Created material
+
+        Raises:
+            IntegrityError: If SKU already exists
+        """
+        db_material = MaterialORM(**material.model_dump())
+        db.add(db_material)
+        db.commit()
+        _invalidate_counts()
+        _invalidate_skus([db_material.sku])
+        db.refresh(db_material)
+        return db_material
+
+    @staticmethod
+    def bulk_create(db: Session, materials: List[MaterialCreate]) -> List[MaterialORM]:
+        """
+        Bulk create materials - optimized for Excel imports
+
+        Used by auto_import_bat.py to import thousands of materials quickly.
+        For full catalogs (50k+ SKUs) use bulk_load(), which streams rows
+        through COPY and upserts on SKU.
+
+        Args:
+            db: Database session
+            materials: List of materials to create
+
+        Returns:
+            List of created materials
+        """
+        db_materials = [MaterialORM(**m.model_dump()) for m in materials]
+        db.bulk_save_objects(db_materials)
+        db.commit()
+        _invalidate_counts()
+        _invalidate_skus(m.sku for m in db_materials)
+        return db_materials
+
+    @staticmethod
+    def bulk_load(db: Session, rows: Iterable[MaterialRow]) -> Dict[str, int]:
+        """
+        Streaming catalog load - COPY into a staging table, then upsert on SKU
+
+        Rows are rendered lazily and streamed with COPY FROM STDIN, so peak
+        memory stays flat for any catalog size. Existing SKUs are updated only
+        when a field actually changed. Requires the psycopg2 driver.
+
+        Args:
+            db: Database session
+            rows: Any iterable of MaterialCreate objects, dicts keyed by
+                BULK_LOAD_COLUMNS, or tuples in BULK_LOAD_COLUMNS order
+                (raw rows are not validated)
+
+        Returns:
+            Dict with rows read and inserted/updated/unchanged SKU counts
+        """
+        stream = _CopyStream(rows)
+        try:
+            db.execute(_BULK_LOAD_STAGE_SQL)
+            cursor = db.connection().connection.cursor()
+            try:
+                cursor.copy_expert(_BULK_LOAD_COPY_SQL, stream)
+            finally:
+                cursor.close()
+
+            staged, inserted, updated = db.execute(_BULK_LOAD_UPSERT_SQL).one()
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        _invalidate_counts()
+        _invalidate_skus()
+
+        return {
+            "rows": stream.rows_read,
+            "inserted": inserted,
+            "updated": updated,
+            "unchanged": staged - inserted - updated,
+        }
+
+    @staticmethod
+    def update(db: Session, material_id: UUID, material: MaterialUpdate) -> Optional[MaterialORM]:
+        """
+        Update existing material
+
+        Args:
+            db: Database session
+            material_id: Material UUID
+            material: Update data (only non-None fields are updated)
+
+        Returns:
+            Updated material if found, None otherwise
+        """
+        db_material = MaterialService.get_by_id(db, material_id)
+        if not db_material:
+            return None
+
+        # Update only provided fields
+        previous_sku = db_material.sku
+        update_data = material.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(db_material, field, value)
+
+        db.commit()
+        if "is_active" in update_data:
+            _invalidate_counts()
+        _invalidate_skus({previous_sku, db_material.sku})
+        db.refresh(db_material)
+        return db_material
+
+    @staticmethod
+    def delete(db: Session, material_id: UUID) -> bool:
+        """
+        Delete material (soft delete by setting is_active=False)
+
+        Args:
+            db: Database session
+            material_id: Material UUID
+
+        Returns:
+            True if deleted, False if not found
+        """
+        db_material = MaterialService.get_by_id(db, material_id)
+        if not db_material:
+            return False
+
+        db_material.is_active = False
+        db.commit()
+        _invalidate_counts()
+        _invalidate_skus([db_material.sku])
+        return True
+
+    @staticmethod
+    def hard_delete(db: Session, material_id: UUID) -> bool:
+        """
+        Permanently delete material from database
+
+        Warning: This cannot be undone!
+
+        Args:
+            db: Database session
+            material_id: Material UUID
+
+        Returns:
+            True if deleted, False if not found
+        """
+        db_material = MaterialService.get_by_id(db, material_id)
+        if not db_material:
+            return False
+
+        db.delete(db_material)
+        db.commit()
+        _invalidate_counts()
+        _invalidate_skus([db_material.sku])
+        return True
+
+    @staticmethod
+    def get_with_pricing(
+        db: Session, material_id: UUID, price_level: Optional[str] = None
+    ) -> Optional[MaterialWithPricing]:
+        """
+        Get material with current pricing information
+
+        Combines material data with pricing (replaces multiple Excel VLOOKUP calls)
+
+        Reads the material_price_summary read model, so cost, all four level
+        prices and the supplier come back in one query.
+
+        Args:
+            db: Database session
+            material_id: Material UUID
+            price_level: Price level code (01, 02, 03, L5); all four level
+                prices are always returned
+
+        Returns:
+            Material with pricing data (prices None if unpriced), None if not found
+        """
+        row = (
+            _with_pricing(db.query(MaterialORM))
+            .filter(MaterialORM.id == material_id)
+            .first()
+        )
+        return _material_with_pricing(row) if row else None
+
+    @staticmethod
+    @replica_read
+    def get_many_with_pricing(
+        db: Session, material_ids: Iterable[UUID]
+    ) -> Dict[UUID, MaterialWithPricing]:
+        """
+        Bulk get_with_pricing - one query for any number of materials
+
+        Args:
+            db: Database session
+            material_ids: Material UUIDs
+
+        Returns:
+            material_id -> Material with pricing (unknown IDs are left out)
+        """
+        ids = list(dict.fromkeys(material_ids))
+        if not ids:
+            return {}
+
+        rows = _with_pricing(db.query(MaterialORM)).filter(MaterialORM.id.in_(ids)).all()
+        return {row[0].id: _material_with_pricing(row) for row in rows}
+
+    @staticmethod
+    def verify_sku_exists(db: Session, sku: str) -> bool:
+        """
+        Quick check if SKU exists - useful for data validation
+
+        Args:
+            db: Database session
+            sku: Material SKU to check
+
+        Returns:
+            True if exists, False otherwise
+        """
+        return db.query(exists().where(MaterialORM.sku == sku)).scalar()
+
+
+class AsyncMaterialService:
+    """
+    Async read path of the material catalog (AsyncSession on asyncpg)
+
+    Mirrors the MaterialService lookups for request handlers that run on the
+    event loop, so many concurrent lookups share one process without tying up
+    a thread per query (see database.async_connection).
+    """
+
+    @staticmethod
+    async def get_by_sku(db: AsyncSession, sku: str) -> Optional[MaterialORM]:
+        """Fast SKU lookup (async MaterialService.get_by_sku)"""
+        result = await db.execute(select(MaterialORM).where(MaterialORM.sku == sku).limit(1))
+        return result.scalars().first()
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, material_id: UUID) -> Optional[MaterialORM]:
+        """Get material by UUID"""
+        return await db.get(MaterialORM, material_id)
+
+    @staticmethod
+    async def search(db: AsyncSession, search_params: MaterialSearch) -> List[MaterialORM]:
+        """Indexed, relevance-ordered material search (async MaterialService.search)"""
+        query, rank = MaterialService._search_query(select(MaterialORM), search_params)
+        query = (
+            query.order_by(*MaterialService._search_order(search_params, rank))
+            .offset(search_params.offset)
+            .limit(search_params.limit)
+        )
+
+        result = await db.execute(query)
+        return list(result.scalars())
+
+    @staticmethod
+    async def get_all(
+        db: AsyncSession, skip: int = 0, limit: int = 100, active_only: bool = True
+    ) -> List[MaterialORM]:
+        """Get all materials with pagination (deprecated like MaterialService.get_all)"""
+        warnings.warn(
+            "AsyncMaterialService.get_all() is deprecated, use get_page()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        query = select(MaterialORM)
+
+        if active_only:
+            query = query.where(MaterialORM.is_active == True)
+
+        query = query.order_by(MaterialORM.sku, MaterialORM.id)
+        result = await db.execute(query.offset(skip).limit(limit))
+        return list(result.scalars())
+
+    @staticmethod
+    async def get_page(
+        db: AsyncSession, cursor: Optional[str] = None, limit: int = 100, active_only: bool = True
+    ) -> MaterialSearchResult:
+        """Keyset (cursor) pagination ordered by (sku, id) (async MaterialService.get_page)"""
+        query = select(MaterialORM)
+        if active_only:
+            query = query.where(MaterialORM.is_active == True)
+
+        if cursor:
+            position = _decode_cursor(cursor, ("sku", "id"))
+            query = query.where(
+                tuple_(MaterialORM.sku, MaterialORM.id)
+                > tuple_(literal(position["sku"]), literal(UUID(position["id"])))
+            )
+
+        result = await db.execute(query.order_by(MaterialORM.sku, MaterialORM.id).limit(limit + 1))
+        rows = list(result.scalars())
+        has_more = len(rows) > limit
+        materials = [Material.model_validate(row) for row in rows[:limit]]
+
+        next_cursor = None
+        if has_more:
+            next_cursor = _encode_cursor({"sku": materials[-1].sku, "id": str(materials[-1].id)})
+
+        return MaterialSearchResult(materials=materials, next_cursor=next_cursor, limit=limit, offset=0)
+
+    @staticmethod
+    async def count(db: AsyncSession, active_only: bool = True) -> int:
+        """Get total count of materials (shares the MaterialService count cache)"""
+        query = select(func.count()).select_from(MaterialORM)
+        if active_only:
+            query = query.where(MaterialORM.is_active == True)
+
+        cache_key = _count_cache_key(db, query, active_only)
+        cached = count_cache.get(cache_key)
+        if cached is not MISSING:
+            return cached
+
+        total = (await db.execute(query)).scalar_one()
+
+        count_cache.set(cache_key, total)
+        return total
+
+    @staticmethod
+    async def verify_sku_exists(db: AsyncSession, sku: str) -> bool:
+        """Quick check if SKU exists"""
+        query = select(exists().where(MaterialORM.sku == sku))
+        return (await db.execute(query)).scalar_one()
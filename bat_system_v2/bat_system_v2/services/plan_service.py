@@ -0,0 +1,268 @@
+"""
+Plan Service
+Replaces Excel plan sheets (2336-B, 1670, etc.) with database queries
+
+Key functionality:
+- Plan lookup by code (sheet name)
+- Pack extraction (replaces filtering column A by pack and summing columns M/P)
+- Totals and margins computed in the database
+"""
+
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, case, literal
+from sqlalchemy.orm import Session
+
+from ..database.base import Base
+from ..models.plan import (
+    PlanCreate,
+    PlanExtractRequest,
+    PlanExtractResponse,
+    PlanMaterialWithDetails,
+)
+
+
+# SQLAlchemy ORM Models
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, Numeric, String, Text, TIMESTAMP
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.sql import func
+import uuid
+
+from .material_service import MaterialORM
+from .pricing_service import PriceLevelORM, PricingService
+
+
+class PlanORM(Base):
+    """Plan ORM model"""
+
+    __tablename__ = "plans"
+
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    plan_code = Column(String(50), unique=True, nullable=False, index=True)
+    name = Column(String(200))
+    builder = Column(String(100))
+    square_footage = Column(Integer)
+    bedrooms = Column(Integer)
+    bathrooms = Column(Numeric(3, 1))
+    description = Column(Text)
+    is_active = Column(Boolean, default=True)
+    created_at = Column(TIMESTAMP, server_default=func.now())
+
+
+class PackORM(Base):
+    """Pack ORM model"""
+
+    __tablename__ = "packs"
+
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    code = Column(String(50), nullable=False, index=True)
+    name = Column(String(200))
+    elevations = Column(ARRAY(String(10)))
+    phase_code = Column(String(10))
+    display_order = Column(Integer)
+    description = Column(Text)
+
+
+class PlanMaterialORM(Base):
+    """Plan Material ORM model"""
+
+    __tablename__ = "plan_materials"
+
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    plan_id = Column(PG_UUID(as_uuid=True), ForeignKey("plans.id", ondelete="CASCADE"), index=True)
+    pack_id = Column(PG_UUID(as_uuid=True), ForeignKey("packs.id"), index=True)
+    material_id = Column(PG_UUID(as_uuid=True), ForeignKey("materials.id", ondelete="CASCADE"), index=True)
+    quantity = Column(Numeric(10, 4), nullable=False)
+    unified_code = Column(String(50), index=True)
+    location_string = Column(String(200))
+    is_optional = Column(Boolean, default=False)
+    notes = Column(Text)
+    created_at = Column(TIMESTAMP, server_default=func.now())
+
+
+class PlanService:
+    """
+    Plan and pack extraction service
+
+    Replaces Excel workflow:
+    - Open the plan sheet (2336-B, 1670, ...)
+    - Filter column A to the packs being bid
+    - Sum TTL COST (P) and TTL SELL (M), compute MARGIN$ (Q) and MARGIN% (R)
+    """
+
+    @staticmethod
+    def get_by_id(db: Session, plan_id: UUID) -> Optional[PlanORM]:
+        """Get plan by ID"""
+        return db.query(PlanORM).filter(PlanORM.id == plan_id).first()
+
+    @staticmethod
+    def get_by_code(db: Session, plan_code: str) -> Optional[PlanORM]:
+        """
+        Get plan by code (Excel sheet name)
+
+        Args:
+            db: Database session
+            plan_code: Plan code ("1670", "2336-B", "G18L")
+
+        Returns:
+            Plan or None if not found
+        """
+        return db.query(PlanORM).filter(PlanORM.plan_code == plan_code).first()
+
+    @staticmethod
+    def get_all(
+        db: Session, skip: int = 0, limit: int = 100, active_only: bool = True
+    ) -> List[PlanORM]:
+        """Get all plans with pagination"""
+        query = db.query(PlanORM)
+
+        if active_only:
+            query = query.filter(PlanORM.is_active == True)
+
+        return query.order_by(PlanORM.plan_code).offset(skip).limit(limit).all()
+
+    @staticmethod
+    def create(db: Session, plan: PlanCreate) -> PlanORM:
+        """Create new plan"""
+        db_plan = PlanORM(**plan.model_dump())
+        db.add(db_plan)
+        db.commit()
+        db.refresh(db_plan)
+        return db_plan
+
+    @staticmethod
+    def extract_packs(
+        db: Session, request: PlanExtractRequest, as_of: Optional[date] = None
+    ) -> Optional[PlanExtractResponse]:
+        """
+        Extract plan materials for a set of packs with pricing and totals
+
+        Replaces filtering an Excel plan sheet by pack and reading the
+        TTL COST / TTL SELL / MARGIN columns. Materials, current cost, level
+        markup and the plan-wide totals all come back from a single joined
+        query (totals via window sums), so the number of round trips does not
+        grow with the number of materials in the packs.
+
+        Lines without a current cost are returned with no cost/price and are
+        left out of the totals. Without a price level the sell price is the
+        cost (no markup).
+
+        Args:
+            db: Database session
+            request: Plan code, pack codes, price level and optional flag
+            as_of: Pricing date (defaults to today)
+
+        Returns:
+            Extraction with materials and totals, None if the plan does not exist
+
+        Raises:
+            ValueError: If price_level_code does not exist
+        """
+        if request.price_level_code is not None:
+            level_join = and_(
+                PriceLevelORM.code == request.price_level_code,
+                PriceLevelORM.is_active == True,
+            )
+        else:
+            level_join = literal(False)
+
+        current = PricingService.current_pricing_lateral(PlanMaterialORM.material_id, as_of)
+        unit_cost = current.c.cost_per_uom
+        markup = func.coalesce(PriceLevelORM.markup_percentage, 0, type_=Numeric)
+        unit_sell = unit_cost * (1 + markup / 100)
+        line_cost = func.coalesce(PlanMaterialORM.quantity * unit_cost, 0, type_=Numeric)
+        line_sell = func.coalesce(PlanMaterialORM.quantity * unit_sell, 0, type_=Numeric)
+
+        total_cost = func.sum(line_cost, type_=Numeric).over()
+        total_sell = func.sum(line_sell, type_=Numeric).over()
+        margin_percent = case(
+            (total_sell > 0, (1 - total_cost / total_sell) * 100),
+            else_=0,
+        )
+
+        query = (
+            db.query(
+                PlanMaterialORM,
+                PlanORM.plan_code,
+                PlanORM.name.label("plan_name"),
+                MaterialORM.sku,
+                MaterialORM.description,
+                MaterialORM.uom,
+                PriceLevelORM.id.label("price_level_id"),
+                unit_cost.label("current_cost"),
+                unit_sell.label("current_price"),
+                total_cost.label("total_cost"),
+                total_sell.label("total_sell"),
+                margin_percent.label("margin_percent"),
+            )
+            .join(PlanORM, PlanORM.id == PlanMaterialORM.plan_id)
+            .join(PackORM, PackORM.id == PlanMaterialORM.pack_id)
+            .join(MaterialORM, MaterialORM.id == PlanMaterialORM.material_id)
+            .outerjoin(current, literal(True))
+            .outerjoin(PriceLevelORM, level_join)
+            .filter(
+                PlanORM.plan_code == request.plan_code,
+                PackORM.code.in_(request.pack_codes),
+            )
+        )
+
+        if not request.include_optional:
+            query = query.filter(PlanMaterialORM.is_optional == False)
+
+        rows = query.order_by(
+            PackORM.display_order.nullslast(),
+            PackORM.code,
+            PlanMaterialORM.unified_code,
+            PlanMaterialORM.id,
+        ).all()
+
+        if rows:
+            first = rows[0]
+            plan_code, plan_name, level_id = first.plan_code, first.plan_name, first.price_level_id
+            totals = (first.total_cost, first.total_sell, first.margin_percent)
+        else:
+            # Nothing matched: tell "unknown plan" apart from "no materials in these packs"
+            plan = (
+                db.query(PlanORM.plan_code, PlanORM.name, PriceLevelORM.id)
+                .outerjoin(PriceLevelORM, level_join)
+                .filter(PlanORM.plan_code == request.plan_code)
+                .first()
+            )
+            if not plan:
+                return None
+            plan_code, plan_name, level_id = plan
+            totals = (Decimal("0"), Decimal("0"), Decimal("0"))
+
+        if request.price_level_code is not None and level_id is None:
+            raise ValueError(f"Unknown price level: {request.price_level_code}")
+
+        materials = [
+            PlanMaterialWithDetails(
+                **{
+                    column.key: getattr(row[0], column.key)
+                    for column in PlanMaterialORM.__table__.columns
+                },
+                sku=row.sku,
+                description=row.description,
+                uom=row.uom,
+                current_cost=row.current_cost,
+                current_price=row.current_price,
+            )
+            for row in rows
+        ]
+
+        total_cost, total_sell, margin_percent = totals
+        return PlanExtractResponse(
+            plan_code=plan_code,
+            plan_name=plan_name,
+            packs=request.pack_codes,
+            materials=materials,
+            total_cost=total_cost,
+            total_sell=total_sell,
+            margin_dollars=total_sell - total_cost,
+            margin_percent=margin_percent,
+            material_count=len(materials),
+        )
@@ -1,360 +1,945 @@
-"""
-Pricing Engine Service
-Replaces Excel pricing formulas with database-driven calculations
-
-Excel formulas replaced:
-- Column H (PRICE): Nested IF statements with VLOOKUP
-- Column M (TTL SELL): =T12*G12
-- Column P (TTL COST): =V12*G12
-- Column Q (MARGIN$): =M12-P12
-- Column R (MARGIN%): =1-(P12/M12)
-"""
-
-from datetime import date, datetime
-from decimal import Decimal
-from typing import Dict, List, Optional
-from uuid import UUID
-
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session
-
-from ..database.base import Base
-from ..models.pricing import (
-    PriceCalculationRequest,
-    PriceCalculationResponse,
-)
-
-
-# SQLAlchemy ORM Models
-from sqlalchemy import Column, Date, Integer, Numeric, String, TIMESTAMP
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.sql import func
-import uuid
-
-
-class PriceLevelORM(Base):
-    """Price Level ORM model"""
-
-    __tablename__ = "price_levels"
-
-    id = Column(Integer, primary_key=True)
-    code = Column(String(10), unique=True, nullable=False)
-    name = Column(String(100))
-    markup_percentage = Column(Numeric(5, 2))
-    is_active = Column(Integer, default=1)
-
-
-class MaterialPricingORM(Base):
-    """Material Pricing ORM model"""
-
-    __tablename__ = "material_pricing"
-
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    material_id = Column(PG_UUID(as_uuid=True), nullable=False, index=True)
-    supplier_id = Column(PG_UUID(as_uuid=True))
-    cost_per_uom = Column(Numeric(10, 4), nullable=False)
-    uom_cost = Column(String(20))
-    conversion_factor = Column(Numeric(10, 4))
-    effective_date = Column(Date, nullable=False)
-    expiration_date = Column(Date)
-    created_at = Column(TIMESTAMP, server_default=func.now())
-
-
-class CustomerPricingORM(Base):
-    """Customer-specific Pricing ORM model"""
-
-    __tablename__ = "customer_pricing"
-
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    customer_id = Column(PG_UUID(as_uuid=True), nullable=False)
-    material_id = Column(PG_UUID(as_uuid=True), nullable=False)
-    price_level_id = Column(Integer)
-    custom_price = Column(Numeric(10, 4))
-    sell_each = Column(Numeric(10, 4))
-    effective_date = Column(Date, nullable=False)
-    expiration_date = Column(Date)
-
-
-class PricingService:
-    """
-    Pricing Engine Service
-
-    Replaces Excel pricing formulas:
-
-    Excel Column H (PRICE):
-        =IF(G12="",0,
-          IF(S12="01",VLOOKUP(F12,PD,17,0),
-            IF(S12="02",VLOOKUP(F12,PD,20,0),
-              IF(S12="03",VLOOKUP(F12,PD,23,0),...))))
-
-    Database:
-        price = get_price_for_level(material_id, price_level_code)
-
-    Benefits:
-    - No nested IFs
-    - No hardcoded column numbers
-    - Faster lookups (database index)
-    - Easy to add new price levels
-    """
-
-    @staticmethod
-    def get_current_cost(db: Session, material_id: UUID) -> Optional[Decimal]:
-        """
-        Get current cost for material (Excel Column V: COST/EA)
-
-        Replaces: Excel VLOOKUP to get cost
-
-        Args:
-            db: Database session
-            material_id: Material UUID
-
-        Returns:
-            Current cost per UOM or None
-        """
-        pricing = (
-            db.query(MaterialPricingORM)
-            .filter(
-                and_(
-                    MaterialPricingORM.material_id == material_id,
-                    MaterialPricingORM.effective_date <= date.today(),
-                    or_(
-                        MaterialPricingORM.expiration_date.is_(None),
-                        MaterialPricingORM.expiration_date > date.today(),
-                    ),
-                )
-            )
-            .order_by(MaterialPricingORM.effective_date.desc())
-            .first()
-        )
-
-        return pricing.cost_per_uom if pricing else None
-
-    @staticmethod
-    def get_price_for_level(
-        db: Session,
-        material_id: UUID,
-        price_level_code: str,
-        customer_id: Optional[UUID] = None,
-    ) -> Optional[Decimal]:
-        """
-        Get price for material at specified price level (Excel Column H: PRICE)
-
-        Replaces Excel nested IF with VLOOKUP:
-            =IF(G12="",0,IF(S12="01",VLOOKUP(F12,PD,17,0),IF(S12="02",...)))
-
-        Args:
-            db: Database session
-            material_id: Material UUID
-            price_level_code: Price level (01, 02, 03, L5)
-            customer_id: Optional customer ID for custom pricing
-
-        Returns:
-            Price or None
-        """
-        # Check for customer-specific pricing first
-        if customer_id:
-            custom_pricing = (
-                db.query(CustomerPricingORM)
-                .filter(
-                    and_(
-                        CustomerPricingORM.customer_id == customer_id,
-                        CustomerPricingORM.material_id == material_id,
-                        CustomerPricingORM.effective_date <= date.today(),
-                        or_(
-                            CustomerPricingORM.expiration_date.is_(None),
-                            CustomerPricingORM.expiration_date > date.today(),
-                        ),
-                    )
-                )
-                .first()
-            )
-
-            if custom_pricing and custom_pricing.custom_price:
-                return custom_pricing.custom_price
-
-        # Get standard pricing based on price level
-        price_level = (
-            db.query(PriceLevelORM)
-            .filter(PriceLevelORM.code == price_level_code)
-            .first()
-        )
-
-        if not price_level:
-            return None
-
-        # Get current cost
-        cost = PricingService.get_current_cost(db, material_id)
-        if not cost:
-            return None
-
-        # Apply markup
-        if price_level.markup_percentage:
-            markup_multiplier = 1 + (price_level.markup_percentage / 100)
-            return cost * Decimal(str(markup_multiplier))
-
-        return cost
-
-    @staticmethod
-    def calculate_totals(
-        quantity: Decimal, unit_cost: Decimal, unit_sell: Decimal
-    ) -> Dict[str, Decimal]:
-        """
-        Calculate pricing totals (Excel Columns M, P, Q, R)
-
-        Replaces Excel formulas:
-        - Column M (TTL SELL): =IF(G12="",0,IF(G12=0,"",T12*G12))
-        - Column P (TTL COST): =V12*G12
-        - Column Q (MARGIN$): =M12-P12
-        - Column R (MARGIN%): =1-(P12/M12)  [with division-by-zero protection]
-
-        Args:
-            quantity: Quantity (Excel Column G: QTY)
-            unit_cost: Cost per unit (Excel Column V: COST/EA)
-            unit_sell: Sell price per unit (Excel Column H: PRICE)
-
-        Returns:
-            Dictionary with totals and margins
-        """
-        # Total cost (Column P)
-        total_cost = unit_cost * quantity
-
-        # Total sell (Column M)
-        total_sell = unit_sell * quantity
-
-        # Margin dollars (Column Q)
-        margin_dollars = total_sell - total_cost
-
-        # Margin percent (Column R) - with division-by-zero protection
-        if total_sell > 0:
-            margin_percent = (Decimal("1") - (total_cost / total_sell)) * Decimal("100")
-        else:
-            margin_percent = Decimal("0")
-
-        return {
-            "total_cost": total_cost,
-            "total_sell": total_sell,
-            "margin_dollars": margin_dollars,
-            "margin_percent": margin_percent,
-        }
-
-    @staticmethod
-    def calculate_price(
-        db: Session, request: PriceCalculationRequest
-    ) -> Optional[PriceCalculationResponse]:
-        """
-        Complete price calculation for a material
-
-        Replaces entire Excel row calculation (Columns G-R)
-
-        Args:
-            db: Database session
-            request: Calculation request
-
-        Returns:
-            Complete pricing calculation
-        """
-        from .material_service import MaterialService
-
-        # Get material
-        material = MaterialService.get_by_id(db, request.material_id)
-        if not material:
-            return None
-
-        # Get unit cost
-        unit_cost = PricingService.get_current_cost(db, request.material_id)
-        if not unit_cost:
-            return None
-
-        # Get unit sell price
-        unit_sell = PricingService.get_price_for_level(
-            db,
-            request.material_id,
-            request.price_level_code,
-            request.customer_id,
-        )
-        if not unit_sell:
-            return None
-
-        # Calculate totals
-        totals = PricingService.calculate_totals(request.quantity, unit_cost, unit_sell)
-
-        return PriceCalculationResponse(
-            material_id=request.material_id,
-            sku=material.sku,
-            description=material.description,
-            quantity=request.quantity,
-            unit_cost=unit_cost,
-            unit_sell=unit_sell,
-            total_cost=totals["total_cost"],
-            total_sell=totals["total_sell"],
-            margin_dollars=totals["margin_dollars"],
-            margin_percent=totals["margin_percent"],
-            price_level=request.price_level_code,
-        )
-
-    @staticmethod
-    def bulk_update_prices(
-        db: Session,
-        material_ids: List[UUID],
-        adjustment_pct: Decimal,
-        effective_date: date,
-    ) -> int:
-        """
-        Bulk update prices for multiple materials
-
-        Used for monthly price updates (replaces manual Excel updates)
-
-        Args:
-            db: Database session
-            material_ids: List of material IDs
-            adjustment_pct: Percentage adjustment (e.g., 5.5 for 5.5% increase)
-            effective_date: Effective date for new prices
-
-        Returns:
-            Number of materials updated
-        """
-        count = 0
-        multiplier = Decimal("1") + (adjustment_pct / Decimal("100"))
-
-        for material_id in material_ids:
-            # Get current pricing
-            current = (
-                db.query(MaterialPricingORM)
-                .filter(
-                    and_(
-                        MaterialPricingORM.material_id == material_id,
-                        MaterialPricingORM.effective_date <= date.today(),
-                        or_(
-                            MaterialPricingORM.expiration_date.is_(None),
-                            MaterialPricingORM.expiration_date > date.today(),
-                        ),
-                    )
-                )
-                .order_by(MaterialPricingORM.effective_date.desc())
-                .first()
-            )
-
-            if current:
-                # Expire old pricing
-                current.expiration_date = effective_date
-
-                # Create new pricing
-                new_cost = current.cost_per_uom * multiplier
-                new_pricing = MaterialPricingORM(
-                    material_id=material_id,
-                    supplier_id=current.supplier_id,
-                    cost_per_uom=new_cost,
-                    uom_cost=current.uom_cost,
-                    conversion_factor=current.conversion_factor,
-                    effective_date=effective_date,
-                )
-                db.add(new_pricing)
-                count += 1
-
-        db.commit()
-        return count
-
-    @staticmethod
-    def get_price_levels(db: Session) -> List[PriceLevelORM]:
-        """Get all active price levels"""
-        return db.query(PriceLevelORM).filter(PriceLevelORM.is_active == 1).all()
+"""
+Pricing Engine Service
+Replaces Excel pricing formulas with database-driven calculations
+
+Excel formulas replaced:
+- Column H (PRICE): Nested IF statements with VLOOKUP
+- Column M (TTL SELL): =T12*G12
+- Column P (TTL COST): =V12*G12
+- Column Q (MARGIN$): =M12-P12
+- Column R (MARGIN%): =1-(P12/M12)
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, event, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..database.base import Base
+from ..models.pricing import (
+    BulkPriceUpdate,
+    PriceCalculationRequest,
+    PriceCalculationResponse,
+)
+
+
+# SQLAlchemy ORM Models
+from sqlalchemy import Boolean, Column, Date, Integer, Numeric, String, TIMESTAMP
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.sql import func
+import os
+import uuid
+
+from .cache import MISSING, LRUCache
+
+# Effective-dated price snapshots keyed by
+# (material_id, price_level_code, customer_id, as_of_date).
+# Cost-only entries use None for the level and customer. Writes through a
+# Session in this process invalidate entries immediately; the TTL bounds how
+# long a price written by another process (imports, other workers, triggers)
+# can be served stale.
+PRICE_CACHE_SIZE = int(os.getenv("PRICE_CACHE_SIZE", "50000"))
+PRICE_CACHE_TTL = float(os.getenv("PRICE_CACHE_TTL", "300"))
+
+
+def _price_tag(tag):
+    """
+    Canonical price cache tag: material ids and ("customer", id) values as UUID
+
+    Callers pass ids as str or UUID while the ORM hooks see UUIDs; without this
+    a str-tagged entry would never be invalidated by an ORM write.
+    """
+    if isinstance(tag, tuple):
+        kind, value = tag
+        return tag if kind == "price_level" else (kind, _as_uuid(value))
+    return _as_uuid(tag)
+
+
+def _as_uuid(value) -> UUID:
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+price_cache = LRUCache(max_size=PRICE_CACHE_SIZE, ttl=PRICE_CACHE_TTL, normalize_tag=_price_tag)
+
+# Materials per statement/commit in bulk_update_prices (bounds lock duration)
+BULK_UPDATE_CHUNK_SIZE = int(os.getenv("BULK_UPDATE_CHUNK_SIZE", "5000"))
+
+# Expire current pricing rows and insert the adjusted rows in one statement.
+# new_costs holds an explicit price per material (NULL = apply multiplier).
+_BULK_UPDATE_SQL = text("""
+    WITH adjustments AS (
+        SELECT material_id, new_cost
+        FROM unnest(CAST(:material_ids AS uuid[]), CAST(:new_costs AS numeric[]))
+            AS a(material_id, new_cost)
+    ),
+    current_rows AS (
+        SELECT DISTINCT ON (mp.material_id)
+            mp.id, mp.material_id, mp.supplier_id, mp.cost_per_uom,
+            mp.uom_cost, mp.conversion_factor, a.new_cost
+        FROM material_pricing mp
+        JOIN adjustments a ON a.material_id = mp.material_id
+        WHERE mp.effective_date <= :today
+          AND (mp.expiration_date IS NULL OR mp.expiration_date > :today)
+        ORDER BY mp.material_id, mp.effective_date DESC
+    ),
+    expired AS (
+        UPDATE material_pricing mp
+        SET expiration_date = :effective_date
+        FROM current_rows c
+        WHERE mp.id = c.id
+    )
+    INSERT INTO material_pricing
+        (material_id, supplier_id, cost_per_uom, uom_cost, conversion_factor, effective_date)
+    SELECT
+        c.material_id, c.supplier_id,
+        COALESCE(c.new_cost, c.cost_per_uom * CAST(:multiplier AS numeric)),
+        c.uom_cost, c.conversion_factor, :effective_date
+    FROM current_rows c
+""")
+
+
+class PriceLevelORM(Base):
+    """Price Level ORM model"""
+
+    __tablename__ = "price_levels"
+
+    id = Column(Integer, primary_key=True)
+    code = Column(String(10), unique=True, nullable=False)
+    name = Column(String(100))
+    markup_percentage = Column(Numeric(5, 2))
+    is_active = Column(Boolean, default=True)
+
+
+class MaterialPricingORM(Base):
+    """Material Pricing ORM model"""
+
+    __tablename__ = "material_pricing"
+
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    material_id = Column(PG_UUID(as_uuid=True), nullable=False, index=True)
+    supplier_id = Column(PG_UUID(as_uuid=True))
+    cost_per_uom = Column(Numeric(10, 4), nullable=False)
+    uom_cost = Column(String(20))
+    conversion_factor = Column(Numeric(10, 4))
+    effective_date = Column(Date, nullable=False)
+    expiration_date = Column(Date)
+    created_at = Column(TIMESTAMP, server_default=func.now())
+
+
+class CustomerPricingORM(Base):
+    """Customer-specific Pricing ORM model"""
+
+    __tablename__ = "customer_pricing"
+
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    customer_id = Column(PG_UUID(as_uuid=True), nullable=False)
+    material_id = Column(PG_UUID(as_uuid=True), nullable=False)
+    price_level_id = Column(Integer)
+    custom_price = Column(Numeric(10, 4))
+    sell_each = Column(Numeric(10, 4))
+    effective_date = Column(Date, nullable=False)
+    expiration_date = Column(Date)
+
+
+class MaterialPriceSummaryORM(Base):
+    """
+    Current pricing read model (material_price_summary)
+
+    One row per priced material, maintained by database triggers on
+    material_pricing, price_levels and suppliers (see schema.sql).
+    """
+
+    __tablename__ = "material_price_summary"
+
+    material_id = Column(PG_UUID(as_uuid=True), primary_key=True)
+    material_pricing_id = Column(PG_UUID(as_uuid=True))
+    supplier_id = Column(PG_UUID(as_uuid=True))
+    supplier_name = Column(String(200))
+    current_cost = Column(Numeric(10, 4))
+    price_01 = Column(Numeric(10, 4))
+    price_02 = Column(Numeric(10, 4))
+    price_03 = Column(Numeric(10, 4))
+    price_l5 = Column(Numeric(10, 4))
+    valid_until = Column(Date)
+    refreshed_at = Column(TIMESTAMP)
+
+
+def _is_current(model, as_of: date):
+    """Effective-date window shared by material and customer pricing lookups"""
+    return and_(
+        model.effective_date <= as_of,
+        or_(
+            model.expiration_date.is_(None),
+            model.expiration_date > as_of,
+        ),
+    )
+
+
+def _current_cost_statement(material_id: UUID, as_of: date):
+    """Latest effective cost for one material (get_current_cost)"""
+    return (
+        select(MaterialPricingORM.cost_per_uom)
+        .where(
+            and_(
+                MaterialPricingORM.material_id == material_id,
+                _is_current(MaterialPricingORM, as_of),
+            )
+        )
+        .order_by(MaterialPricingORM.effective_date.desc())
+        .limit(1)
+    )
+
+
+def _customer_price_statement(customer_id: UUID, material_id: UUID, as_of: date):
+    """Current customer override price for one material"""
+    return (
+        select(CustomerPricingORM.custom_price)
+        .where(
+            and_(
+                CustomerPricingORM.customer_id == customer_id,
+                CustomerPricingORM.material_id == material_id,
+                _is_current(CustomerPricingORM, as_of),
+            )
+        )
+        .limit(1)
+    )
+
+
+def _price_level_statement(price_level_code: str):
+    """Price level markup lookup by code"""
+    return select(PriceLevelORM.markup_percentage).where(PriceLevelORM.code == price_level_code)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_pricing_writes(session, flush_context):
+    """Record pricing rows written through the ORM so their snapshots can be invalidated"""
+    tags = session.info.setdefault("price_cache_tags", set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, (MaterialPricingORM, CustomerPricingORM)):
+            tags.add(obj.material_id)
+        elif isinstance(obj, PriceLevelORM):
+            tags.add(("price_level", obj.code))
+    # Drop now as well, so this session never reads its own stale snapshot
+    price_cache.invalidate_tags(tags)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_pricing(session):
+    """Invalidate again once committed (other sessions may have re-cached old rows)"""
+    tags = session.info.pop("price_cache_tags", None)
+    if tags:
+        price_cache.invalidate_tags(tags)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pricing_writes(session):
+    """Nothing was written, forget collected tags"""
+    session.info.pop("price_cache_tags", None)
+
+
+class PricingService:
+    """
+    Pricing Engine Service
+
+    Replaces Excel pricing formulas:
+
+    Excel Column H (PRICE):
+        =IF(G12="",0,
+          IF(S12="01",VLOOKUP(F12,PD,17,0),
+            IF(S12="02",VLOOKUP(F12,PD,20,0),
+              IF(S12="03",VLOOKUP(F12,PD,23,0),...))))
+
+    Database:
+        price = get_price_for_level(material_id, price_level_code)
+
+    Benefits:
+    - No nested IFs
+    - No hardcoded column numbers
+    - Faster lookups (database index)
+    - Easy to add new price levels
+    """
+
+    @staticmethod
+    def get_current_cost(
+        db: Session, material_id: UUID, as_of: Optional[date] = None
+    ) -> Optional[Decimal]:
+        """
+        Get current cost for material (Excel Column V: COST/EA)
+
+        Replaces: Excel VLOOKUP to get cost
+
+        Results are served from the price snapshot cache when possible.
+
+        Args:
+            db: Database session
+            material_id: Material UUID
+            as_of: Pricing date (defaults to today)
+
+        Returns:
+            Current cost per UOM or None
+        """
+        as_of = as_of or date.today()
+        cache_key = (material_id, None, None, as_of)
+        cached = price_cache.get(cache_key)
+        if cached is not MISSING:
+            return cached
+
+        cost = db.execute(_current_cost_statement(material_id, as_of)).scalar()
+        price_cache.set(cache_key, cost, tags=(material_id,))
+        return cost
+
+    @staticmethod
+    def get_price_for_level(
+        db: Session,
+        material_id: UUID,
+        price_level_code: str,
+        customer_id: Optional[UUID] = None,
+        as_of: Optional[date] = None,
+    ) -> Optional[Decimal]:
+        """
+        Get price for material at specified price level (Excel Column H: PRICE)
+
+        Replaces Excel nested IF with VLOOKUP:
+            =IF(G12="",0,IF(S12="01",VLOOKUP(F12,PD,17,0),IF(S12="02",...)))
+
+        Results are served from the price snapshot cache when possible.
+
+        Args:
+            db: Database session
+            material_id: Material UUID
+            price_level_code: Price level (01, 02, 03, L5)
+            customer_id: Optional customer ID for custom pricing
+            as_of: Pricing date (defaults to today)
+
+        Returns:
+            Price or None
+        """
+        as_of = as_of or date.today()
+        cache_key = (material_id, price_level_code, customer_id, as_of)
+        cached = price_cache.get(cache_key)
+        if cached is not MISSING:
+            return cached
+
+        price = PricingService._lookup_price_for_level(
+            db, material_id, price_level_code, customer_id, as_of
+        )
+
+        tags = [material_id, ("price_level", price_level_code)]
+        if customer_id:
+            tags.append(("customer", customer_id))
+        price_cache.set(cache_key, price, tags=tags)
+        return price
+
+    @staticmethod
+    def _lookup_price_for_level(
+        db: Session,
+        material_id: UUID,
+        price_level_code: str,
+        customer_id: Optional[UUID],
+        as_of: date,
+    ) -> Optional[Decimal]:
+        """Uncached price resolution: customer override, then level markup on cost"""
+        # Check for customer-specific pricing first
+        if customer_id:
+            custom_price = db.execute(
+                _customer_price_statement(customer_id, material_id, as_of)
+            ).scalar()
+            if custom_price:
+                return custom_price
+
+        # Get standard pricing based on price level
+        price_level = db.execute(_price_level_statement(price_level_code)).first()
+        if not price_level:
+            return None
+
+        # Get current cost
+        cost = PricingService.get_current_cost(db, material_id, as_of)
+        if not cost:
+            return None
+
+        return PricingService.apply_markup(cost, price_level.markup_percentage)
+
+    @staticmethod
+    def apply_markup(cost: Decimal, markup_percentage: Optional[Decimal]) -> Decimal:
+        """
+        Apply a price level markup to a cost
+
+        Args:
+            cost: Cost per UOM
+            markup_percentage: Level markup (e.g., 15.00 for 15%), None for no markup
+
+        Returns:
+            Sell price per UOM
+        """
+        if markup_percentage:
+            markup_multiplier = 1 + (markup_percentage / 100)
+            return cost * Decimal(str(markup_multiplier))
+
+        return cost
+
+    @staticmethod
+    def current_pricing_subquery(
+        as_of: Optional[date] = None, material_ids: Optional[Iterable[UUID]] = None
+    ):
+        """
+        Current cost row per material as a set-based subquery
+
+        Same rule as get_current_cost (latest effective row that has not
+        expired), resolved for many materials at once with DISTINCT ON.
+
+        Args:
+            as_of: Pricing date (defaults to today)
+            material_ids: Optional materials to restrict to
+
+        Returns:
+            Subquery with material_id, supplier_id and cost_per_uom columns
+        """
+        as_of = as_of or date.today()
+        query = (
+            select(
+                MaterialPricingORM.material_id,
+                MaterialPricingORM.supplier_id,
+                MaterialPricingORM.cost_per_uom,
+            )
+            .where(_is_current(MaterialPricingORM, as_of))
+            .distinct(MaterialPricingORM.material_id)
+            .order_by(
+                MaterialPricingORM.material_id,
+                MaterialPricingORM.effective_date.desc(),
+            )
+        )
+        if material_ids is not None:
+            query = query.where(MaterialPricingORM.material_id.in_(list(material_ids)))
+
+        return query.subquery("current_pricing")
+
+    @staticmethod
+    def current_pricing_lateral(material_id_column, as_of: Optional[date] = None):
+        """
+        Current cost row for each outer row as a LATERAL subquery
+
+        Same rule as current_pricing_subquery, but evaluated per joined
+        material with an index probe (LIMIT 1) instead of resolving every
+        material in the pricing table. Use it when the outer query only
+        touches a small slice of the catalog (one plan, one bid).
+
+        Args:
+            material_id_column: Outer column holding the material id
+            as_of: Pricing date (defaults to today)
+
+        Returns:
+            Lateral subquery with supplier_id and cost_per_uom columns
+        """
+        as_of = as_of or date.today()
+        return (
+            select(MaterialPricingORM.supplier_id, MaterialPricingORM.cost_per_uom)
+            .where(
+                and_(
+                    MaterialPricingORM.material_id == material_id_column,
+                    _is_current(MaterialPricingORM, as_of),
+                )
+            )
+            .order_by(MaterialPricingORM.effective_date.desc())
+            .limit(1)
+            .lateral("current_pricing")
+        )
+
+    @staticmethod
+    def calculate_totals(
+        quantity: Decimal, unit_cost: Decimal, unit_sell: Decimal
+    ) -> Dict[str, Decimal]:
+        """
+        Calculate pricing totals (Excel Columns M, P, Q, R)
+
+        Replaces Excel formulas:
+        - Column M (TTL SELL): =IF(G12="",0,IF(G12=0,"",T12*G12))
+        - Column P (TTL COST): =V12*G12
+        - Column Q (MARGIN$): =M12-P12
+        - Column R (MARGIN%): =1-(P12/M12)  [with division-by-zero protection]
+
+        Args:
+            quantity: Quantity (Excel Column G: QTY)
+            unit_cost: Cost per unit (Excel Column V: COST/EA)
+            unit_sell: Sell price per unit (Excel Column H: PRICE)
+
+        Returns:
+            Dictionary with totals and margins
+        """
+        # Total cost (Column P)
+        total_cost = unit_cost * quantity
+
+        # Total sell (Column M)
+        total_sell = unit_sell * quantity
+
+        # Margin dollars (Column Q)
+        margin_dollars = total_sell - total_cost
+
+        # Margin percent (Column R) - with division-by-zero protection
+        if total_sell > 0:
+            margin_percent = (Decimal("1") - (total_cost / total_sell)) * Decimal("100")
+        else:
+            margin_percent = Decimal("0")
+
+        return {
+            "total_cost": total_cost,
+            "total_sell": total_sell,
+            "margin_dollars": margin_dollars,
+            "margin_percent": margin_percent,
+        }
+
+    @staticmethod
+    def calculate_price(
+        db: Session, request: PriceCalculationRequest
+    ) -> Optional[PriceCalculationResponse]:
+        """
+        Complete price calculation for a material
+
+        Replaces entire Excel row calculation (Columns G-R)
+
+        Args:
+            db: Database session
+            request: Calculation request
+
+        Returns:
+            Complete pricing calculation
+        """
+        from .material_service import MaterialService
+
+        # Get material
+        material = MaterialService.get_by_id(db, request.material_id)
+        if not material:
+            return None
+
+        # Get unit cost
+        unit_cost = PricingService.get_current_cost(db, request.material_id)
+        if not unit_cost:
+            return None
+
+        # Get unit sell price
+        unit_sell = PricingService.get_price_for_level(
+            db,
+            request.material_id,
+            request.price_level_code,
+            request.customer_id,
+        )
+        if not unit_sell:
+            return None
+
+        # Calculate totals
+        totals = PricingService.calculate_totals(request.quantity, unit_cost, unit_sell)
+
+        return PriceCalculationResponse(
+            material_id=request.material_id,
+            sku=material.sku,
+            description=material.description,
+            quantity=request.quantity,
+            unit_cost=unit_cost,
+            unit_sell=unit_sell,
+            total_cost=totals["total_cost"],
+            total_sell=totals["total_sell"],
+            margin_dollars=totals["margin_dollars"],
+            margin_percent=totals["margin_percent"],
+            price_level=request.price_level_code,
+        )
+
+    @staticmethod
+    def calculate_prices(
+        db: Session, requests: List[PriceCalculationRequest]
+    ) -> List[Optional[PriceCalculationResponse]]:
+        """
+        Batch price calculation for a whole plan or bid
+
+        Same result as calling calculate_price for each request, but the
+        material, current cost, level markup and customer override lookups
+        are resolved for all requests together. Round trips stay constant
+        (three queries) no matter how many lines are priced.
+
+        Args:
+            db: Database session
+            requests: Calculation requests (one per bid/plan line)
+
+        Returns:
+            Pricing calculations in request order (None where a line cannot be priced)
+        """
+        if not requests:
+            return []
+
+        levels, materials, overrides = PricingService._price_inputs_statements(requests)
+        return PricingService._build_price_results(
+            requests,
+            markups=dict(db.execute(levels).all()),
+            materials={row.id: row for row in db.execute(materials)},
+            overrides={
+                (row.customer_id, row.material_id): row.custom_price
+                for row in (db.execute(overrides) if overrides is not None else [])
+            },
+        )
+
+    @staticmethod
+    def _price_inputs_statements(requests: List[PriceCalculationRequest], as_of: Optional[date] = None):
+        """
+        Statements loading everything calculate_prices needs for a batch
+
+        Shared by the sync and async calculate_prices so both apply the same
+        pricing rules.
+
+        Returns:
+            (level markups, materials with current cost, customer overrides or None)
+        """
+        from .material_service import MaterialORM
+
+        as_of = as_of or date.today()
+        material_ids = {request.material_id for request in requests}
+
+        # Price level markups (small lookup table, one query for all levels)
+        level_codes = {request.price_level_code for request in requests}
+        levels = select(PriceLevelORM.code, PriceLevelORM.markup_percentage).where(
+            PriceLevelORM.code.in_(level_codes)
+        )
+
+        # Materials with their current cost
+        current = PricingService.current_pricing_subquery(as_of, material_ids)
+        materials = (
+            select(
+                MaterialORM.id,
+                MaterialORM.sku,
+                MaterialORM.description,
+                current.c.cost_per_uom,
+            )
+            .outerjoin(current, current.c.material_id == MaterialORM.id)
+            .where(MaterialORM.id.in_(material_ids))
+        )
+
+        # Customer-specific overrides (latest effective row per customer/material)
+        overrides = None
+        customer_ids = {request.customer_id for request in requests if request.customer_id}
+        if customer_ids:
+            overrides = (
+                select(
+                    CustomerPricingORM.customer_id,
+                    CustomerPricingORM.material_id,
+                    CustomerPricingORM.custom_price,
+                )
+                .where(
+                    and_(
+                        CustomerPricingORM.customer_id.in_(customer_ids),
+                        CustomerPricingORM.material_id.in_(material_ids),
+                        _is_current(CustomerPricingORM, as_of),
+                    )
+                )
+                .distinct(CustomerPricingORM.customer_id, CustomerPricingORM.material_id)
+                .order_by(
+                    CustomerPricingORM.customer_id,
+                    CustomerPricingORM.material_id,
+                    CustomerPricingORM.effective_date.desc(),
+                )
+            )
+
+        return levels, materials, overrides
+
+    @staticmethod
+    def _build_price_results(
+        requests: List[PriceCalculationRequest], markups: dict, materials: dict, overrides: dict
+    ) -> List[Optional[PriceCalculationResponse]]:
+        """Assemble calculate_prices results from the loaded markups, costs and overrides"""
+        results: List[Optional[PriceCalculationResponse]] = []
+        for request in requests:
+            material = materials.get(request.material_id)
+            unit_cost = material.cost_per_uom if material else None
+            if not unit_cost:
+                results.append(None)
+                continue
+
+            unit_sell = None
+            if request.customer_id:
+                unit_sell = overrides.get((request.customer_id, request.material_id))
+            if not unit_sell and request.price_level_code in markups:
+                unit_sell = PricingService.apply_markup(
+                    unit_cost, markups[request.price_level_code]
+                )
+            if not unit_sell:
+                results.append(None)
+                continue
+
+            totals = PricingService.calculate_totals(request.quantity, unit_cost, unit_sell)
+            results.append(
+                PriceCalculationResponse(
+                    material_id=request.material_id,
+                    sku=material.sku,
+                    description=material.description,
+                    quantity=request.quantity,
+                    unit_cost=unit_cost,
+                    unit_sell=unit_sell,
+                    total_cost=totals["total_cost"],
+                    total_sell=totals["total_sell"],
+                    margin_dollars=totals["margin_dollars"],
+                    margin_percent=totals["margin_percent"],
+                    price_level=request.price_level_code,
+                )
+            )
+
+        return results
+
+    @staticmethod
+    def bulk_update_prices(
+        db: Session,
+        material_ids: List[UUID],
+        adjustment_pct: Optional[Decimal],
+        effective_date: date,
+        new_prices: Optional[Dict[UUID, Decimal]] = None,
+        chunk_size: int = BULK_UPDATE_CHUNK_SIZE,
+    ) -> int:
+        """
+        Bulk update prices for multiple materials
+
+        Used for monthly price updates (replaces manual Excel updates)
+
+        Set-based: each chunk expires the current pricing rows and inserts
+        the adjusted rows in a single statement, then commits, so lock
+        duration stays bounded for any batch size.
+
+        Args:
+            db: Database session
+            material_ids: List of material IDs
+            adjustment_pct: Percentage adjustment (e.g., 5.5 for 5.5% increase),
+                None to only apply new_prices
+            effective_date: Effective date for new prices
+            new_prices: Optional map of material_id to new cost (overrides adjustment_pct)
+            chunk_size: Materials per statement/transaction
+
+        Returns:
+            Number of materials updated
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        multiplier = None
+        if adjustment_pct is not None:
+            multiplier = Decimal("1") + (adjustment_pct / Decimal("100"))
+
+        explicit_prices = {
+            UUID(str(material_id)): price for material_id, price in (new_prices or {}).items()
+        }
+
+        # Materials with an explicit price, or adjusted by percentage
+        targets = []
+        seen = set()
+        for material_id in list(material_ids) + list(explicit_prices):
+            material_id = UUID(str(material_id))
+            if material_id in seen:
+                continue
+            seen.add(material_id)
+            if material_id in explicit_prices or multiplier is not None:
+                targets.append(material_id)
+
+        count = 0
+        for start in range(0, len(targets), chunk_size):
+            chunk = targets[start:start + chunk_size]
+            result = db.execute(
+                _BULK_UPDATE_SQL,
+                {
+                    "material_ids": [str(material_id) for material_id in chunk],
+                    "new_costs": [explicit_prices.get(material_id) for material_id in chunk],
+                    "multiplier": multiplier,
+                    "today": date.today(),
+                    "effective_date": effective_date,
+                },
+            )
+            db.commit()
+            PricingService.invalidate_cache(material_ids=chunk)
+            count += result.rowcount
+
+        return count
+
+    @staticmethod
+    def apply_bulk_update(
+        db: Session, update: BulkPriceUpdate, chunk_size: int = BULK_UPDATE_CHUNK_SIZE
+    ) -> int:
+        """
+        Apply a BulkPriceUpdate request (percentage adjustment and/or explicit prices)
+
+        Args:
+            db: Database session
+            update: Bulk price update request
+            chunk_size: Materials per statement/transaction
+
+        Returns:
+            Number of materials updated
+        """
+        return PricingService.bulk_update_prices(
+            db,
+            update.material_ids,
+            update.price_adjustment_pct,
+            update.effective_date,
+            new_prices=update.new_prices,
+            chunk_size=chunk_size,
+        )
+
+    @staticmethod
+    def refresh_price_summary(
+        db: Session,
+        material_ids: Optional[Iterable[UUID]] = None,
+        stale_only: bool = False,
+    ) -> int:
+        """
+        Rebuild material_price_summary rows
+
+        Pricing writes refresh the read model through triggers. Rows still go
+        stale when a dated price starts or expires with no write, so run
+        this with stale_only=True once a day (or at startup); with no
+        arguments it rebuilds every row (initial load of an existing database).
+
+        Args:
+            db: Database session
+            material_ids: Materials to rebuild (None = all)
+            stale_only: Only rebuild rows whose valid_until has passed
+
+        Returns:
+            Number of summary rows inserted or changed
+        """
+        if stale_only:
+            stale = select(MaterialPriceSummaryORM.material_id).where(
+                MaterialPriceSummaryORM.valid_until <= func.current_date()
+            )
+            if material_ids is not None:
+                stale = stale.where(
+                    MaterialPriceSummaryORM.material_id.in_(list(material_ids))
+                )
+            material_ids = db.execute(stale).scalars().all()
+            if not material_ids:
+                return 0
+
+        ids = None if material_ids is None else [str(material_id) for material_id in material_ids]
+        changed = db.execute(
+            text("SELECT refresh_material_price_summary(CAST(:material_ids AS uuid[]))"),
+            {"material_ids": ids},
+        ).scalar()
+        db.commit()
+        return changed
+
+    @staticmethod
+    def get_price_levels(db: Session) -> List[PriceLevelORM]:
+        """Get all active price levels"""
+        return db.query(PriceLevelORM).filter(PriceLevelORM.is_active == True).all()
+
+    @staticmethod
+    def invalidate_cache(
+        material_ids: Optional[Iterable[UUID]] = None,
+        price_level_codes: Optional[Iterable[str]] = None,
+    ) -> int:
+        """
+        Invalidate cached price snapshots after a pricing write
+
+        ORM writes to pricing tables are invalidated automatically; call this
+        after raw SQL/bulk statements that bypass the ORM.
+
+        Args:
+            material_ids: Materials whose costs or customer prices changed
+            price_level_codes: Price levels whose markup changed
+
+        Returns:
+            Number of cache entries dropped
+        """
+        if material_ids is None and price_level_codes is None:
+            dropped = len(price_cache)
+            price_cache.clear()
+            return dropped
+
+        tags = list(material_ids or [])
+        tags.extend(("price_level", code) for code in price_level_codes or [])
+        return price_cache.invalidate_tags(tags)
+
+    @staticmethod
+    def get_cache_stats() -> dict:
+        """Get price snapshot cache counters (hits, misses, evictions, hit_rate)"""
+        return price_cache.stats()
+
+
+class AsyncPricingService:
+    """
+    Async read path of the pricing engine (AsyncSession on asyncpg)
+
+    Same rules, statements and price snapshot cache as PricingService, for
+    request handlers that run on the event loop (see database.async_connection).
+    """
+
+    @staticmethod
+    async def get_current_cost(
+        db: AsyncSession, material_id: UUID, as_of: Optional[date] = None
+    ) -> Optional[Decimal]:
+        """Get current cost per UOM (async PricingService.get_current_cost)"""
+        as_of = as_of or date.today()
+        cache_key = (material_id, None, None, as_of)
+        cached = price_cache.get(cache_key)
+        if cached is not MISSING:
+            return cached
+
+        cost = (await db.execute(_current_cost_statement(material_id, as_of))).scalar()
+        price_cache.set(cache_key, cost, tags=(material_id,))
+        return cost
+
+    @staticmethod
+    async def get_price_for_level(
+        db: AsyncSession,
+        material_id: UUID,
+        price_level_code: str,
+        customer_id: Optional[UUID] = None,
+        as_of: Optional[date] = None,
+    ) -> Optional[Decimal]:
+        """Get price at a price level (async PricingService.get_price_for_level)"""
+        as_of = as_of or date.today()
+        cache_key = (material_id, price_level_code, customer_id, as_of)
+        cached = price_cache.get(cache_key)
+        if cached is not MISSING:
+            return cached
+
+        price = None
+        if customer_id:
+            price = (
+                await db.execute(_customer_price_statement(customer_id, material_id, as_of))
+            ).scalar()
+
+        if not price:
+            price_level = (await db.execute(_price_level_statement(price_level_code))).first()
+            cost = None
+            if price_level:
+                cost = await AsyncPricingService.get_current_cost(db, material_id, as_of)
+            price = PricingService.apply_markup(cost, price_level.markup_percentage) if cost else None
+
+        tags = [material_id, ("price_level", price_level_code)]
+        if customer_id:
+            tags.append(("customer", customer_id))
+        price_cache.set(cache_key, price, tags=tags)
+        return price
+
+    @staticmethod
+    async def calculate_prices(
+        db: AsyncSession, requests: List[PriceCalculationRequest]
+    ) -> List[Optional[PriceCalculationResponse]]:
+        """Batch price calculation (async PricingService.calculate_prices, three queries)"""
+        if not requests:
+            return []
+
+        levels, materials, overrides = PricingService._price_inputs_statements(requests)
+        markups = dict((await db.execute(levels)).all())
+        material_rows = {row.id: row for row in (await db.execute(materials)).all()}
+        override_prices = {}
+        if overrides is not None:
+            override_prices = {
+                (row.customer_id, row.material_id): row.custom_price
+                for row in (await db.execute(overrides)).all()
+            }
+
+        return PricingService._build_price_results(
+            requests, markups, material_rows, override_prices
+        )
+
+    @staticmethod
+    async def get_price_levels(db: AsyncSession) -> List[PriceLevelORM]:
+        """Get all active price levels"""
+        result = await db.execute(select(PriceLevelORM).where(PriceLevelORM.is_active == True))
+        return list(result.scalars())
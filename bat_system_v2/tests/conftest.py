@@ -0,0 +1,6 @@
+"""Make the bat_system_v2 package importable when running pytest from this directory"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
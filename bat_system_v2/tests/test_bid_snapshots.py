@@ -0,0 +1,121 @@
+"""Bid revision keyframes and deltas (services/bid_snapshots.py)"""
+
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import UUID
+
+from bat_system_v2.services import bid_snapshots
+from bat_system_v2.services.bid_snapshots import (
+    DELTA,
+    KEYFRAME,
+    apply_delta,
+    build_state,
+    compare_states,
+    decode,
+    diff_states,
+    encode,
+    needs_keyframe,
+)
+
+MATERIAL = UUID("00000000-0000-0000-0000-000000000001")
+
+
+def bid(**overrides):
+    values = {
+        "bid_number": "B-1001",
+        "customer_id": UUID("00000000-0000-0000-0000-0000000000c1"),
+        "plan_id": None,
+        "status": "draft",
+        "valid_until": date(2026, 12, 31),
+        "notes": None,
+        "total_cost": Decimal("100.00"),
+        "total_sell": Decimal("125.00"),
+        "margin_dollars": Decimal("25.00"),
+        "margin_percent": Decimal("20.00"),
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def item(item_id, line_number, quantity="1.0000", **overrides):
+    values = {
+        "id": item_id,
+        "material_id": MATERIAL,
+        "pack_code": "|10.82",
+        "quantity": Decimal(quantity),
+        "unit_cost": Decimal("10.00"),
+        "unit_sell": Decimal("12.50"),
+        "line_total_cost": Decimal("10.00"),
+        "line_total_sell": Decimal("12.50"),
+        "is_optional": False,
+        "line_number": line_number,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def test_build_state_is_json_safe():
+    state = build_state(bid(), [item(1, 1)])
+
+    assert state["bid"]["total_sell"] == "125.00"
+    assert state["bid"]["valid_until"] == "2026-12-31"
+    assert state["items"]["1"]["material_id"] == str(MATERIAL)
+
+
+def test_delta_round_trip():
+    old = build_state(bid(), [item(1, 1), item(2, 2), item(3, 3)])
+    new = build_state(
+        bid(status="submitted", total_sell=Decimal("130.00")),
+        [item(1, 1, quantity="4.0000"), item(3, 3), item(4, 4, pack_code="|20.00")],
+    )
+
+    delta = diff_states(old, new)
+    assert delta["bid"] == {"status": "submitted", "total_sell": "130.00"}
+    assert delta["removed"] == ["2"]
+    assert list(delta["added"]) == ["4"]
+    assert delta["changed"] == {"1": {"quantity": "4.0000"}}
+
+    assert apply_delta(old, delta) == new
+    assert diff_states(new, new) == {"bid": {}, "added": {}, "removed": [], "changed": {}}
+
+
+def test_apply_delta_does_not_modify_the_base_state():
+    old = build_state(bid(), [item(1, 1)])
+    new = build_state(bid(), [item(1, 1, quantity="2.0000")])
+    before = {"bid": dict(old["bid"]), "items": {k: dict(v) for k, v in old["items"].items()}}
+
+    apply_delta(old, diff_states(old, new))
+
+    assert old == before
+
+
+def test_encode_decode_round_trip():
+    state = build_state(bid(), [item(1, 1), item(2, 2)])
+    keyframe = encode(KEYFRAME, state, state)
+
+    assert keyframe["kind"] == KEYFRAME
+    assert keyframe["item_count"] == 2
+    assert keyframe["total_sell"] == "125.00"
+    assert decode(keyframe) == state
+
+    new = build_state(bid(notes="revised"), [item(2, 2)])
+    delta_snapshot = encode(DELTA, diff_states(state, new), new)
+    assert delta_snapshot["item_count"] == 1
+    assert apply_delta(decode(keyframe), decode(delta_snapshot)) == new
+
+
+def test_needs_keyframe(monkeypatch):
+    monkeypatch.setattr(bid_snapshots, "SNAPSHOT_KEYFRAME_INTERVAL", 3)
+    assert [n for n in range(1, 10) if needs_keyframe(n)] == [1, 4, 7]
+
+
+def test_compare_states_reports_old_and_new_values():
+    old = build_state(bid(), [item(1, 1), item(2, 2)])
+    new = build_state(bid(status="won"), [item(1, 1, quantity="3.0000")])
+
+    comparison = compare_states(old, new)
+
+    assert comparison["bid"] == {"status": {"from": "draft", "to": "won"}}
+    assert comparison["removed"] == {"2": old["items"]["2"]}
+    assert comparison["changed"] == {"1": {"quantity": {"from": "1.0000", "to": "3.0000"}}}
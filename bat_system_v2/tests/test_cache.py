@@ -0,0 +1,96 @@
+"""LRUCache (services/cache.py)"""
+
+from uuid import uuid4
+
+import pytest
+
+from bat_system_v2.services import cache as cache_module
+from bat_system_v2.services.cache import MISSING, LRUCache
+
+
+def test_get_miss_returns_missing_and_none_is_cacheable():
+    cache = LRUCache(max_size=2)
+    assert cache.get("a") is MISSING
+    cache.set("a", None)
+    assert cache.get("a") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+    assert len(cache) == 2
+
+
+def test_set_existing_key_replaces_value_and_tags():
+    cache = LRUCache(max_size=4)
+    cache.set("a", 1, tags=("old",))
+    cache.set("a", 2, tags=("new",))
+
+    assert cache.invalidate_tags(["old"]) == 0
+    assert cache.get("a") == 2
+    assert cache.invalidate_tags(["new"]) == 1
+    assert cache.get("a") is MISSING
+
+
+def test_ttl_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = LRUCache(max_size=4, ttl=30)
+    cache.set("a", 1)
+
+    now[0] += 29
+    assert cache.get("a") == 1
+    now[0] += 1
+    assert cache.get("a") is MISSING
+    assert cache.expirations == 1
+    assert len(cache) == 0
+
+
+def test_invalidate_tags_drops_every_tagged_key():
+    cache = LRUCache(max_size=10)
+    cache.set("price:1", 10, tags=("m1",))
+    cache.set("price:1:level", 11, tags=("m1", "level"))
+    cache.set("price:2", 20, tags=("m2",))
+
+    assert cache.invalidate_tags(["m1"]) == 2
+    assert cache.get("price:2") == 20
+    # The "level" tag no longer points at the dropped key
+    assert cache.invalidate_tags(["level"]) == 0
+
+
+def test_normalize_tag_matches_str_and_uuid():
+    material_id = uuid4()
+    cache = LRUCache(max_size=10, normalize_tag=lambda tag: str(tag))
+    cache.set("a", 1, tags=(material_id,))
+    cache.set("b", 2, tags=(str(material_id),))
+
+    assert cache.invalidate_tags([str(material_id)]) == 2
+    assert len(cache) == 0
+
+
+def test_invalidate_and_clear():
+    cache = LRUCache(max_size=10)
+    cache.set("a", 1, tags=("t",))
+    cache.set("b", 2)
+
+    assert cache.invalidate("a") is True
+    assert cache.invalidate("a") is False
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.invalidate_tags(["t"]) == 0
+    assert cache.invalidations == 2
+
+
+def test_max_size_must_be_positive():
+    with pytest.raises(ValueError):
+        LRUCache(max_size=0)
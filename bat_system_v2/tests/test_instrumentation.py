@@ -0,0 +1,102 @@
+"""Per-request query counting (database/instrumentation.py)"""
+
+import contextvars
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from bat_system_v2.database.instrumentation import QueryMetrics, instrument_engine, query_scope
+
+
+@pytest.fixture
+def metrics():
+    return QueryMetrics()
+
+
+@pytest.fixture
+def engine(tmp_path, metrics):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'metrics.db'}", connect_args={"check_same_thread": False}
+    )
+    instrument_engine(engine, name="test", metrics=metrics)
+    yield engine
+    engine.dispose()
+
+
+def run_in_fresh_context(func):
+    """Run func in another thread with an empty context, like a threadpool endpoint"""
+    errors = []
+
+    def target():
+        try:
+            contextvars.Context().run(func)
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    worker = threading.Thread(target=target)
+    worker.start()
+    worker.join()
+    if errors:
+        raise errors[0]
+
+
+def test_session_scope_counts_queries_from_another_context(engine, metrics):
+    db = Session(bind=engine)
+    try:
+        with query_scope("request", metrics=metrics, session=db) as scope:
+
+            def endpoint():
+                for i in range(7):
+                    db.execute(text("SELECT :i"), {"i": i})
+
+            run_in_fresh_context(endpoint)
+    finally:
+        db.close()
+
+    assert scope.query_count == 7
+    assert metrics.queries_per_request.count == 1
+    assert metrics.queries_per_request.total == 7
+
+
+def test_session_scope_reports_n_plus_one(engine, metrics):
+    db = Session(bind=engine)
+    try:
+        with query_scope("request", metrics=metrics, session=db):
+            run_in_fresh_context(
+                lambda: [db.execute(text("SELECT :i"), {"i": i}) for i in range(25)]
+            )
+    finally:
+        db.close()
+
+    assert metrics.n_plus_one_count == 1
+
+
+def test_statements_after_scope_exit_are_not_counted(engine, metrics):
+    db = Session(bind=engine)
+    try:
+        with query_scope("request", metrics=metrics, session=db) as scope:
+            db.execute(text("SELECT 1"))
+        db.execute(text("SELECT 2"))
+    finally:
+        db.close()
+
+    assert scope.query_count == 1
+
+
+def test_context_scope_folds_nested_session_scope(engine, metrics):
+    with query_scope("job", metrics=metrics) as outer:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        db = Session(bind=engine)
+        try:
+            with query_scope("db_context", metrics=metrics, session=db) as inner:
+                db.execute(text("SELECT 2"))
+                db.execute(text("SELECT 3"))
+        finally:
+            db.close()
+
+    assert inner.query_count == 2
+    assert outer.query_count == 3
+    assert metrics.queries_per_request.count == 1
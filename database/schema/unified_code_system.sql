@@ -481,6 +481,9 @@ CREATE TABLE layer1_codes (
         END
     ) STORED,
     is_active BOOLEAN DEFAULT 1,
+    -- Elevations as a bitmask (A=1, B=2, C=4, D=8; see encode_elevations)
+    -- Maintained from layer1_code_elevations; no associations = all elevations
+    elevation_mask INTEGER NOT NULL DEFAULT 67108863,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (plan_id) REFERENCES plans(plan_id),
@@ -493,6 +496,7 @@ CREATE TABLE layer1_codes (
 CREATE INDEX idx_layer1_full_code ON layer1_codes(full_code);
 CREATE INDEX idx_layer1_plan ON layer1_codes(plan_id);
 CREATE INDEX idx_layer1_phase ON layer1_codes(phase_option_code);
+CREATE INDEX idx_layer1_plan_elevation_mask ON layer1_codes(plan_id, elevation_mask);
 
 -- ============================================================================
 -- Layer 1 Code Elevation Associations
@@ -841,6 +845,44 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql IMMUTABLE;
 
+-- Elevation code -> bitmask (same rules as elevation_codes.py)
+-- Each ASCII letter sets its bit in any case (A=1, B=2, C=4, D=8, ... Z=2^25),
+-- separators are ignored ('B, C, D' = 'BCD' = 14) and '**' sets all 26 bits
+CREATE OR REPLACE FUNCTION encode_elevations(p_elevation_code TEXT)
+RETURNS INTEGER AS $$
+    SELECT CASE
+        WHEN p_elevation_code = '**' THEN 67108863
+        ELSE COALESCE((
+            SELECT BIT_OR(1 << (ASCII(UPPER(letter)) - 65))
+            FROM REGEXP_SPLIT_TO_TABLE(p_elevation_code, '') AS letter
+            WHERE letter ~ '^[A-Za-z]$'
+        ), 0)
+    END;
+$$ LANGUAGE sql IMMUTABLE STRICT;
+
+-- Bitmask -> elevation code ('BCD'; '**' for all elevations, '' for none)
+CREATE OR REPLACE FUNCTION decode_elevations(p_mask INTEGER)
+RETURNS TEXT AS $$
+    SELECT CASE
+        WHEN p_mask = 67108863 THEN '**'
+        ELSE COALESCE(STRING_AGG(CHR(65 + bit), '' ORDER BY bit), '')
+    END
+    FROM GENERATE_SERIES(0, 25) AS bit
+    WHERE p_mask & (1 << bit) <> 0;
+$$ LANGUAGE sql IMMUTABLE STRICT;
+
+-- Recompute layer1_codes.elevation_mask from its elevation associations
+CREATE OR REPLACE FUNCTION refresh_layer1_elevation_mask(p_code_id INTEGER)
+RETURNS VOID AS $$
+    UPDATE layer1_codes l1
+    SET elevation_mask = COALESCE((
+            SELECT BIT_OR(encode_elevations(l1e.elevation_code))
+            FROM layer1_code_elevations l1e
+            WHERE l1e.code_id = l1.code_id
+        ), 67108863)
+    WHERE l1.code_id = p_code_id;
+$$ LANGUAGE sql;
+
 -- Function to get all codes for a specific plan and elevation
 CREATE OR REPLACE FUNCTION get_codes_for_plan_elevation(
     p_plan_id TEXT,
@@ -864,10 +906,9 @@ BEGIN
     FROM layer1_codes l1
     JOIN phase_option_definitions pod ON l1.phase_option_code = pod.phase_code
     JOIN material_classes mc ON l1.material_class = mc.class_code
-    LEFT JOIN layer1_code_elevations l1e ON l1.code_id = l1e.code_id
     LEFT JOIN layer1_code_richmond_options l1r ON l1.code_id = l1r.code_id
     WHERE l1.plan_id = p_plan_id
-        AND (l1e.elevation_code = p_elevation_code OR l1e.elevation_code IS NULL)
+        AND l1.elevation_mask & encode_elevations(p_elevation_code) <> 0
     GROUP BY l1.full_code, pod.phase_name, mc.class_name, pod.shipping_order
     ORDER BY pod.shipping_order, l1.full_code;
 END;
@@ -896,6 +937,30 @@ BEFORE UPDATE ON layer2_materials
 FOR EACH ROW
 EXECUTE FUNCTION update_timestamp();
 
+-- Trigger to keep layer1_codes.elevation_mask in step with layer1_code_elevations
+CREATE OR REPLACE FUNCTION layer1_code_elevations_refresh_mask()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM refresh_layer1_elevation_mask(NEW.code_id);
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM refresh_layer1_elevation_mask(OLD.code_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER layer1_code_elevations_mask
+AFTER INSERT OR UPDATE OR DELETE ON layer1_code_elevations
+FOR EACH ROW
+EXECUTE FUNCTION layer1_code_elevations_refresh_mask();
+
+-- Masks for the associations inserted above
+SELECT refresh_layer1_elevation_mask(code_id)
+FROM layer1_code_elevations
+GROUP BY code_id;
+
 -- ============================================================================
 -- NOTES AND USAGE EXAMPLES
 -- ============================================================================
@@ -906,6 +971,17 @@ USAGE EXAMPLES:
 1. Get all codes for a plan and elevation:
    SELECT * FROM get_codes_for_plan_elevation('1234', 'B');
 
+   Or filter by bitmask directly (C = 4):
+   SELECT full_code, decode_elevations(elevation_mask) AS elevations
+   FROM layer1_codes
+   WHERE plan_id = '1234' AND elevation_mask & 4 <> 0;
+
+   Roll up a plan by elevation set (one group per distinct mask):
+   SELECT decode_elevations(elevation_mask) AS elevations, COUNT(*)
+   FROM layer1_codes
+   WHERE plan_id = '1234'
+   GROUP BY elevation_mask;
+
 2. Find all materials for a specific Layer 1 code:
    SELECT * FROM v_materials_complete
    WHERE layer1_code = '1234-20.00-1000';
@@ -948,6 +1024,7 @@ MIGRATION NOTES:
 
 3. Elevation Handling:
    - Richmond: Parse "B, C, D" from CSV → insert 3 rows in layer1_code_elevations
+   - layer1_codes.elevation_mask mirrors those rows as an integer (trigger-maintained)
    - Holt: Extract from template placeholders [Elevation]
    - Single source of truth eliminates triple-encoding problem
 
@@ -14,38 +14,109 @@ Author: BAT Migration Project
 Date: November 13, 2025
 """
 
+import os
 import sqlite3
 import pandas as pd
 import re
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Tuple, Dict
+from typing import Optional, List, Tuple, Dict, Iterable
 import csv
 
+from elevation_codes import count_by_elevation, elevation_bit, elevation_mask_sql
+
+
+# Columns accepted by add_materials_bulk() (unit defaults to "EA", the rest to NULL)
+MATERIAL_COLUMNS = (
+    'plan_code', 'phase_code', 'elevation_code', 'item_type_code',
+    'vendor_sku', 'description', 'quantity', 'unit',
+    'richmond_pack_id', 'richmond_option_code',
+    'holt_item_number', 'holt_activity', 'holt_community', 'notes',
+)
+
+# Legacy references naming the workbook row a material was imported from.
+# add_materials_bulk(replace=True) replaces rows by source_file; rows imported
+# before source_file was recorded are matched by (plan_code, reference).
+SOURCE_KEYS = ('richmond_pack_id', 'holt_item_number')
+
+# Code segments joined into full_code (required, and may not contain '-')
+CODE_SEGMENTS = ('plan_code', 'phase_code', 'elevation_code', 'item_type_code')
+
+# Rows per executemany() call in add_materials_bulk()
+BULK_CHUNK_SIZE = 1000
+
+# Connection settings applied by connect()
+#   performance: WAL journal (readers don't block the writer), fsync only at
+#                checkpoints, memory-mapped reads, 64 MB page cache, temp
+#                tables in memory and a larger prepared statement cache
+#   legacy:      SQLite defaults (rollback journal, fsync on every commit)
+SQLITE_PROFILES = {
+    "performance": {
+        "cached_statements": int(os.getenv("BAT_SQLITE_CACHED_STATEMENTS", "256")),
+        "pragmas": {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "mmap_size": int(os.getenv("BAT_SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+            "cache_size": int(os.getenv("BAT_SQLITE_CACHE_SIZE", "-65536")),  # negative = KiB
+            "temp_store": "MEMORY",
+        },
+    },
+    "legacy": {
+        "cached_statements": 128,
+        "pragmas": {
+            "journal_mode": "DELETE",
+            "synchronous": "FULL",
+            "mmap_size": 0,
+            "cache_size": -2000,
+            "temp_store": "DEFAULT",
+        },
+    },
+}
+DEFAULT_SQLITE_PROFILE = os.getenv("BAT_SQLITE_PROFILE", "performance")
+
 
 class BATCodingSystemBuilder:
     """Main class for building and managing the unified coding system"""
     
-    def __init__(self, db_path: str = "bat_unified.db"):
+    def __init__(self, db_path: str = "bat_unified.db", profile: str = DEFAULT_SQLITE_PROFILE):
         """
         Initialize the coding system builder
         
         Args:
             db_path: Path to SQLite database file
+            profile: Connection settings from SQLITE_PROFILES
         """
+        if profile not in SQLITE_PROFILES:
+            raise ValueError(f"Unknown SQLite profile {profile!r}, expected one of {', '.join(SQLITE_PROFILES)}")
+        
         self.db_path = Path(db_path)
+        self.profile = profile
         self.conn = None
         self.translation_df = None
+        # (pack, elevation letters, item type) -> "phase-elevation-item" suffix
+        self.translation_index = None
+        # (pack, item type) -> suffix, used when the elevation letters don't match
+        self.translation_fallback_index = None
         
     def connect(self):
-        """Establish database connection"""
-        self.conn = sqlite3.connect(self.db_path)
-        print(f"✓ Connected to database: {self.db_path}")
+        """Establish database connection with the profile's settings"""
+        config = SQLITE_PROFILES[self.profile]
+        self.conn = sqlite3.connect(self.db_path, cached_statements=config["cached_statements"])
+        for pragma, value in config["pragmas"].items():
+            self.conn.execute(f"PRAGMA {pragma} = {value}")
+        has_materials = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'materials'"
+        ).fetchone()
+        if has_materials:
+            self.upgrade_materials_table()
+        print(f"✓ Connected to database: {self.db_path} ({self.profile})")
         
     def close(self):
-        """Close database connection"""
+        """Close database connection (refreshing query planner statistics first)"""
         if self.conn:
+            self.conn.execute("PRAGMA optimize")
             self.conn.close()
+            self.conn = None
             print(f"✓ Database connection closed")
     
     def create_schema(self):
@@ -129,7 +200,7 @@ class BATCodingSystemBuilder:
         
         # 5. Materials table (THE BIG ONE)
         print("\n5. Creating materials table...")
-        cursor.execute("""
+        cursor.execute(f"""
             CREATE TABLE IF NOT EXISTS materials (
                 material_id INTEGER PRIMARY KEY AUTOINCREMENT,
                 
@@ -144,6 +215,9 @@ class BATCodingSystemBuilder:
                     (plan_code || '-' || phase_code || '-' || 
                      elevation_code || '-' || item_type_code) STORED,
                 
+                -- Elevation letters as a bitmask (computed, indexed)
+                elevation_mask INTEGER GENERATED ALWAYS AS ({elevation_mask_sql()}) VIRTUAL,
+                
                 -- Material details
                 vendor_sku TEXT,
                 description TEXT,
@@ -165,6 +239,9 @@ class BATCodingSystemBuilder:
                 holt_activity TEXT,
                 holt_community TEXT,
                 
+                -- Workbook the row was imported from (add_materials_bulk)
+                source_file TEXT,
+                
                 -- Metadata
                 created_date DATE DEFAULT CURRENT_DATE,
                 modified_date DATE DEFAULT CURRENT_DATE,
@@ -177,6 +254,8 @@ class BATCodingSystemBuilder:
                 FOREIGN KEY (item_type_code) REFERENCES item_types(type_code)
             )
         """)
+        
+        self.upgrade_materials_table()
         print("   ✓ materials table created")
         
         # 6. Option codes translation table
@@ -234,22 +313,54 @@ class BATCodingSystemBuilder:
         print("\n9. Creating indexes...")
         indexes = [
             "CREATE INDEX IF NOT EXISTS idx_materials_full_code ON materials(full_code)",
-            "CREATE INDEX IF NOT EXISTS idx_materials_plan ON materials(plan_code)",
-            "CREATE INDEX IF NOT EXISTS idx_materials_phase ON materials(phase_code)",
-            "CREATE INDEX IF NOT EXISTS idx_materials_elevation ON materials(plan_code, elevation_code)",
+            # Filter + ORDER BY of get_materials_by_plan / _by_phase / _by_elevation
+            "CREATE INDEX IF NOT EXISTS idx_materials_plan_order "
+            "ON materials(plan_code, phase_code, elevation_code, item_type_code)",
+            "CREATE INDEX IF NOT EXISTS idx_materials_phase_order "
+            "ON materials(phase_code, plan_code, elevation_code)",
+            "CREATE INDEX IF NOT EXISTS idx_materials_elevation_mask "
+            "ON materials(plan_code, phase_code, item_type_code, elevation_mask)",
             "CREATE INDEX IF NOT EXISTS idx_materials_item_type ON materials(item_type_code)",
             "CREATE INDEX IF NOT EXISTS idx_materials_richmond ON materials(richmond_pack_id)",
+            "CREATE INDEX IF NOT EXISTS idx_materials_holt ON materials(holt_item_number)",
+            "CREATE INDEX IF NOT EXISTS idx_materials_source ON materials(source_file, plan_code)",
             "CREATE INDEX IF NOT EXISTS idx_materials_vendor_sku ON materials(vendor_sku)",
             "CREATE INDEX IF NOT EXISTS idx_elevation_mappings ON elevation_mappings(plan_code, phase_code)",
         ]
         
         for idx_sql in indexes:
             cursor.execute(idx_sql)
+        
+        # Single-column indexes replaced by the *_order indexes above
+        for old_index in ('idx_materials_plan', 'idx_materials_phase', 'idx_materials_elevation'):
+            cursor.execute(f"DROP INDEX IF EXISTS {old_index}")
         print(f"   ✓ {len(indexes)} indexes created")
         
         self.conn.commit()
         print("\n✓ SCHEMA CREATION COMPLETE")
         
+    def upgrade_materials_table(self):
+        """
+        Add columns introduced after a database was created
+        
+        Safe to run on every connect; does nothing when the table is current.
+        """
+        cursor = self.conn.cursor()
+        columns = [row[1] for row in cursor.execute("PRAGMA table_xinfo(materials)")]
+        
+        # Only VIRTUAL generated columns can be added
+        if 'elevation_mask' not in columns:
+            cursor.execute(f"""
+                ALTER TABLE materials ADD COLUMN elevation_mask INTEGER
+                GENERATED ALWAYS AS ({elevation_mask_sql()}) VIRTUAL
+            """)
+        if 'source_file' not in columns:
+            cursor.execute("ALTER TABLE materials ADD COLUMN source_file TEXT")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_materials_source ON materials(source_file, plan_code)"
+            )
+        self.conn.commit()
+    
     def load_translation_table(self, csv_path: str):
         """
         Load the translation table from CSV
@@ -269,6 +380,9 @@ class BATCodingSystemBuilder:
         print(f"\n✓ Loaded {len(self.translation_df)} translation records")
         print(f"✓ Columns: {', '.join(self.translation_df.columns)}")
         
+        # Hash lookups for translate_richmond_code()
+        self._build_translation_index()
+        
         # Populate product_phases from translation table
         self._populate_product_phases()
         
@@ -353,6 +467,38 @@ class BATCodingSystemBuilder:
         count = cursor.execute("SELECT COUNT(*) FROM item_types").fetchone()[0]
         print(f"   ✓ {count} item types loaded")
     
+    def _build_translation_index(self):
+        """
+        Build the translate_richmond_code() lookups from translation_df
+        
+        Keys keep the first matching row, like the DataFrame filter they
+        replace. Rows with a blank key value are left out because a blank
+        (NaN) cell never equals a lookup value.
+        """
+        self.translation_index = {}
+        self.translation_fallback_index = {}
+        
+        columns = ['Richmond_Pack_ID', 'Elevation_Letters', 'Item_Type',
+                   'New_Phase_Code', 'New_Elevation_Code', 'New_Item_Code']
+        for pack_id, elevation, item_type, phase, new_elevation, item_code in (
+            self.translation_df[columns].itertuples(index=False, name=None)
+        ):
+            if pd.isna(pack_id) or pd.isna(item_type):
+                continue
+            
+            suffix = f"{phase}-{new_elevation}-{item_code}"
+            if not pd.isna(elevation):
+                self.translation_index.setdefault((pack_id, elevation, item_type), suffix)
+            self.translation_fallback_index.setdefault((pack_id, item_type), suffix)
+    
+    def _lookup_translation(self, richmond_pack_id: str, elevation_str: str,
+                            item_type: str) -> Optional[str]:
+        """Translation suffix for one Richmond code, falling back to a match without elevation"""
+        suffix = self.translation_index.get((richmond_pack_id, elevation_str, item_type))
+        if suffix is None:
+            suffix = self.translation_fallback_index.get((richmond_pack_id, item_type))
+        return suffix
+    
     def translate_richmond_code(self, plan_code: str, richmond_pack_id: str, 
                                 elevation_str: str, item_type: str) -> str:
         """
@@ -369,33 +515,59 @@ class BATCodingSystemBuilder:
         """
         if self.translation_df is None:
             raise ValueError("Translation table not loaded. Call load_translation_table() first.")
+        if self.translation_index is None:
+            self._build_translation_index()
         
         # Normalize elevation string for matching
         elevation_str = elevation_str.strip() if elevation_str else ""
         
-        # Look up in translation table
-        match = self.translation_df[
-            (self.translation_df['Richmond_Pack_ID'] == richmond_pack_id) &
-            (self.translation_df['Elevation_Letters'] == elevation_str) &
-            (self.translation_df['Item_Type'] == item_type)
-        ]
+        # Look up (pack, elevation, item type), then (pack, item type)
+        suffix = self._lookup_translation(richmond_pack_id, elevation_str, item_type)
+        if suffix is None:
+            raise ValueError(f"No translation found for {richmond_pack_id} with type {item_type}")
         
-        if len(match) == 0:
-            # Try without elevation match
-            match = self.translation_df[
-                (self.translation_df['Richmond_Pack_ID'] == richmond_pack_id) &
-                (self.translation_df['Item_Type'] == item_type)
-            ]
-            
-            if len(match) == 0:
-                raise ValueError(f"No translation found for {richmond_pack_id} with type {item_type}")
-            
-            # Use first match
-            match = match.iloc[0:1]
+        return f"{plan_code}-{suffix}"
+    
+    def translate_richmond_codes(self, df: pd.DataFrame, plan_code: str = None,
+                                 errors: str = "raise") -> pd.Series:
+        """
+        Translate a DataFrame of Richmond codes to unified format
         
-        row = match.iloc[0]
+        Batch version of translate_richmond_code() using the same lookups.
         
-        return f"{plan_code}-{row['New_Phase_Code']}-{row['New_Elevation_Code']}-{row['New_Item_Code']}"
+        Args:
+            df: Columns richmond_pack_id, elevation_str and item_type, plus
+                plan_code unless given as an argument (blank elevations match "")
+            plan_code: Plan identifier for every row (overrides a plan_code column)
+            errors: "raise" to raise ValueError on the first untranslatable row,
+                "coerce" to return None for it
+            
+        Returns:
+            Series of unified codes aligned with df's index
+        """
+        if errors not in ("raise", "coerce"):
+            raise ValueError(f"errors must be 'raise' or 'coerce', got {errors!r}")
+        if self.translation_df is None:
+            raise ValueError("Translation table not loaded. Call load_translation_table() first.")
+        if self.translation_index is None:
+            self._build_translation_index()
+        
+        plans = [plan_code] * len(df) if plan_code is not None else df['plan_code']
+        elevations = df['elevation_str'].fillna("").astype(str).str.strip()
+        
+        codes = []
+        for plan, pack_id, elevation, item_type in zip(
+            plans, df['richmond_pack_id'], elevations, df['item_type']
+        ):
+            suffix = self._lookup_translation(pack_id, elevation, item_type)
+            if suffix is None:
+                if errors == "raise":
+                    raise ValueError(f"No translation found for {pack_id} with type {item_type}")
+                codes.append(None)
+            else:
+                codes.append(f"{plan}-{suffix}")
+        
+        return pd.Series(codes, index=df.index, dtype=object, name='unified_code')
     
     def add_material(self, plan_code: str, phase_code: str, elevation_code: str,
                     item_type_code: str, vendor_sku: str, description: str,
@@ -437,6 +609,126 @@ class BATCodingSystemBuilder:
         
         self.conn.commit()
         return cursor.lastrowid
+
+    def validate_material(self, material: Dict) -> Optional[str]:
+        """
+        Check a material dict before insert
+        
+        Args:
+            material: Column values keyed by MATERIAL_COLUMNS names
+            
+        Returns:
+            Error message, or None if the material can be inserted
+        """
+        unknown = set(material) - set(MATERIAL_COLUMNS)
+        if unknown:
+            return f"Unknown columns: {', '.join(sorted(unknown))}"
+        
+        for segment in CODE_SEGMENTS:
+            value = material.get(segment)
+            if value is None or not str(value).strip():
+                return f"Missing {segment}"
+            if '-' in str(value):
+                return f"{segment} may not contain '-': {value}"
+        
+        quantity = material.get('quantity')
+        if quantity is not None:
+            try:
+                float(quantity)
+            except (TypeError, ValueError):
+                return f"Quantity is not a number: {quantity}"
+        
+        return None
+    
+    def add_materials_bulk(self, materials: Iterable[Dict], chunk_size: int = BULK_CHUNK_SIZE,
+                           validate: bool = True, replace: bool = False,
+                           source_file: Optional[str] = None) -> int:
+        """
+        Add many materials in one transaction
+        
+        Rows are inserted with executemany() in chunks of chunk_size and
+        committed once at the end, instead of one commit per row as in
+        add_material(). If any insert fails the whole batch is rolled back.
+        
+        Every row is stamped with source_file. With replace=True, rows from
+        an earlier import of the same source_file for the incoming plans are
+        deleted in the same transaction first, so importing a workbook again
+        replaces its rows instead of appending another copy. Rows from other
+        workbooks are never deleted, even when they share a plan and pack ID
+        / Holt code. Rows imported before source_file was recorded (NULL) are
+        matched by plan_code and source reference (SOURCE_KEYS) instead.
+        
+        Args:
+            materials: Dicts keyed by MATERIAL_COLUMNS names (missing keys are NULL,
+                unit defaults to "EA")
+            chunk_size: Rows per executemany() call
+            validate: Check every material with validate_material() first and
+                insert nothing if any fail
+            replace: Delete existing rows from the same source_file before inserting
+            source_file: Workbook the materials come from (required with replace)
+            
+        Returns:
+            Number of materials inserted
+            
+        Raises:
+            ValueError: If validation fails (message lists the first failures),
+                or replace=True without a source_file
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if replace and not source_file:
+            raise ValueError("replace=True needs the source_file to replace")
+        
+        materials = list(materials)
+        
+        if validate:
+            errors = []
+            for index, material in enumerate(materials):
+                error = self.validate_material(material)
+                if error:
+                    errors.append(f"#{index}: {error}")
+            if errors:
+                shown = '; '.join(errors[:5])
+                more = f" (+{len(errors) - 5} more)" if len(errors) > 5 else ""
+                raise ValueError(f"{len(errors)} invalid materials: {shown}{more}")
+        
+        sql = f"""
+            INSERT INTO materials ({', '.join(MATERIAL_COLUMNS)}, source_file)
+            VALUES ({', '.join('?' * len(MATERIAL_COLUMNS))}, ?)
+        """
+        defaults = {'unit': "EA"}
+        
+        cursor = self.conn.cursor()
+        try:
+            if replace:
+                plans = sorted({material['plan_code'] for material in materials})
+                cursor.executemany(
+                    "DELETE FROM materials WHERE source_file = ? AND plan_code = ?",
+                    [(source_file, plan) for plan in plans]
+                )
+                for key in SOURCE_KEYS:
+                    sources = sorted({
+                        (material['plan_code'], material[key])
+                        for material in materials if material.get(key) is not None
+                    })
+                    cursor.executemany(
+                        f"DELETE FROM materials WHERE source_file IS NULL "
+                        f"AND plan_code = ? AND {key} = ?", sources
+                    )
+            
+            for start in range(0, len(materials), chunk_size):
+                cursor.executemany(sql, [
+                    tuple(
+                        material.get(column, defaults.get(column)) for column in MATERIAL_COLUMNS
+                    ) + (source_file,)
+                    for material in materials[start:start + chunk_size]
+                ])
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        
+        return len(materials)
     
     def get_materials_by_plan(self, plan_code: str) -> pd.DataFrame:
         """Get all materials for a specific plan"""
@@ -479,8 +771,24 @@ class BATCodingSystemBuilder:
         return pd.read_sql_query(query, self.conn, params=[phase_code])
     
     def get_materials_by_elevation(self, plan_code: str, elevation_letter: str) -> pd.DataFrame:
-        """Get all materials for a specific elevation in a plan"""
-        query = """
+        """
+        Get all materials for a specific elevation in a plan
+        
+        A single letter is matched against elevation_mask through
+        idx_materials_elevation_mask; anything else falls back to matching
+        the elevation_code text.
+        """
+        bit = elevation_bit(elevation_letter)
+        if bit:
+            elevation_filter = "elevation_mask & ? != 0"
+            params = [plan_code, bit]
+        else:
+            elevation_filter = """(elevation_code = ? 
+                   OR elevation_code LIKE '%' || ? || '%'
+                   OR elevation_code = '**')"""
+            params = [plan_code, elevation_letter, elevation_letter]
+        
+        query = f"""
             SELECT 
                 material_id,
                 full_code,
@@ -492,12 +800,10 @@ class BATCodingSystemBuilder:
                 unit
             FROM materials
             WHERE plan_code = ?
-              AND (elevation_code = ? 
-                   OR elevation_code LIKE '%' || ? || '%'
-                   OR elevation_code = '**')
+              AND {elevation_filter}
             ORDER BY phase_code, item_type_code
         """
-        return pd.read_sql_query(query, self.conn, params=[plan_code, elevation_letter, elevation_letter])
+        return pd.read_sql_query(query, self.conn, params=params)
     
     def validate_database(self) -> Dict[str, any]:
         """
@@ -715,6 +1021,21 @@ class BATCodingSystemBuilder:
         for row in elev_stats:
             report.append(f"{row[0]:<15} {row[1]:>12,d}")
         
+        # Materials per elevation letter ("**" and "BCD" count under each letter they cover)
+        report.append("\n\nMATERIALS PER ELEVATION")
+        report.append("-"*80)
+        mask_stats = cursor.execute("""
+            SELECT elevation_mask, COUNT(*) as material_count
+            FROM materials
+            GROUP BY elevation_mask
+        """).fetchall()
+        
+        per_letter = count_by_elevation(mask_stats)
+        report.append(f"{'Elevation':<15} {'Materials':>12}")
+        report.append("-"*80)
+        for letter, material_count in per_letter.items():
+            report.append(f"{letter:<15} {material_count:>12,d}")
+        
         report.append("\n" + "="*80)
         report.append("END OF SUMMARY REPORT")
         report.append("="*80)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Elevation Codes
+Integer bitmask encoding for elevation letters
+
+Each elevation letter is one bit (A=1, B=2, C=4, D=8, ... Z=2^25), so
+"BCD" is 14 and "**" (all elevations) has every bit set. "Does this
+material apply to elevation C" becomes mask & 4 != 0, and rollups across
+elevations can group by the integer instead of parsing strings.
+
+The same rules are implemented in SQL by elevation_mask_sql() (SQLite
+materials.elevation_mask) and by encode_elevations()/decode_elevations()
+in database/schema/unified_code_system.sql (PostgreSQL) - keep them in step.
+
+Rules:
+    - "**" encodes to ALL_ELEVATIONS
+    - otherwise every ASCII letter in the code sets its bit, in any case and
+      ignoring separators ("B, C, D", "bcd" and "DCB" all encode to 14)
+    - codes without letters (e.g. Holt "00") encode to 0
+
+Author: BAT Migration Project
+"""
+
+from typing import Iterable, List, Optional, Tuple
+
+ELEVATION_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+ALL_ELEVATIONS = (1 << len(ELEVATION_LETTERS)) - 1
+UNIVERSAL_ELEVATION_CODE = "**"
+
+
+def elevation_bit(letter: str) -> Optional[int]:
+    """Bit for a single elevation letter (any case), None if it isn't one"""
+    if len(letter) != 1:
+        return None
+    index = ELEVATION_LETTERS.find(letter.upper())
+    return 1 << index if index >= 0 and letter.isascii() else None
+
+
+def encode_elevations(elevation_code: str) -> int:
+    """
+    Encode an elevation code as a bitmask
+
+    Args:
+        elevation_code: Code like "BCD", "B, C, D" or "**" (None/"" = 0)
+
+    Returns:
+        Bitmask (e.g. "BCD" -> 14, "**" -> ALL_ELEVATIONS)
+    """
+    if not elevation_code:
+        return 0
+    if elevation_code == UNIVERSAL_ELEVATION_CODE:
+        return ALL_ELEVATIONS
+
+    mask = 0
+    for char in elevation_code:
+        mask |= elevation_bit(char) or 0
+    return mask
+
+
+def decode_elevations(mask: int) -> str:
+    """
+    Elevation code for a bitmask
+
+    Args:
+        mask: Bitmask from encode_elevations()
+
+    Returns:
+        Letters in order ("BCD"), "**" for ALL_ELEVATIONS, "" for 0
+    """
+    if mask == ALL_ELEVATIONS:
+        return UNIVERSAL_ELEVATION_CODE
+    return "".join(elevation_letters(mask))
+
+
+def elevation_letters(mask: int) -> List[str]:
+    """Letters whose bits are set in mask, in order"""
+    return [letter for bit, letter in enumerate(ELEVATION_LETTERS) if mask & (1 << bit)]
+
+
+def applies_to_elevation(mask: int, letter: str) -> bool:
+    """Whether a material with this mask applies to an elevation letter"""
+    bit = elevation_bit(letter)
+    return bool(bit and mask & bit)
+
+
+def count_by_elevation(mask_counts: Iterable[Tuple[int, int]], letters: str = "ABCD") -> dict:
+    """
+    Roll up material counts per mask to a count per elevation letter
+
+    A mask counts towards every letter it applies to, so "**" and "BCD"
+    materials appear under several elevations.
+
+    Args:
+        mask_counts: (mask, material count) pairs, e.g. GROUP BY elevation_mask rows
+        letters: Elevation letters to report
+
+    Returns:
+        {letter: count}
+    """
+    bits = {letter: elevation_bit(letter) for letter in letters}
+    counts = {letter: 0 for letter in letters}
+    for mask, count in mask_counts:
+        for letter, bit in bits.items():
+            if mask & bit:
+                counts[letter] += count
+    return counts
+
+
+def elevation_mask_sql(column: str = "elevation_code") -> str:
+    """
+    SQLite expression computing encode_elevations() of a text column
+
+    Uses upper()/instr(), which are ASCII-only like the Python rules.
+    """
+    letter_bits = " + ".join(
+        f"(instr(upper({column}), '{letter}') > 0) * {1 << bit}"
+        for bit, letter in enumerate(ELEVATION_LETTERS)
+    )
+    return (
+        f"CASE WHEN {column} = '{UNIVERSAL_ELEVATION_CODE}' THEN {ALL_ELEVATIONS} "
+        f"ELSE {letter_bits} END"
+    )
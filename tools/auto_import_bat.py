@@ -1,696 +1,1396 @@
-#!/usr/bin/env python3
-"""
-Automated BAT Import Tool
-Imports Richmond and Holt Excel files into unified database
-
-Version: 1.0.0
-Author: Corey Dev Framework
-"""
-
-import sys
-import pandas as pd
-from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Tuple, Optional
-
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent / "docs" / "Migration Strategy" / "bat_coding_system_builder"))
-
-from bat_coding_system_builder import BATCodingSystemBuilder
-
-__version__ = "1.1.0"
-
-class BATAutoImporter:
-    """Automated BAT file importer with validation"""
-
-    def __init__(self, db_path: str = None):
-        """Initialize importer
-
-        Args:
-            db_path: Path to database (defaults to Migration Strategy location)
-        """
-        if db_path is None:
-            db_path = Path(__file__).parent.parent / "docs" / "Migration Strategy" / "bat_coding_system_builder" / "bat_unified.db"
-
-        self.db_path = Path(db_path)
-        self.builder = BATCodingSystemBuilder(str(self.db_path))
-        self.results = {
-            'imported': [],
-            'flagged': [],
-            'failed': [],
-            'warnings': []
-        }
-        self.stats = {
-            'total_rows': 0,
-            'total_codes': 0,
-            'richmond_materials': 0,
-            'holt_materials': 0
-        }
-
-    def parse_richmond_pack_name(self, pack_name: str) -> Dict:
-        """Parse Richmond pack name into components
-
-        Args:
-            pack_name: Pack name like "|10.82BCD OPT DEN FOUNDATION"
-
-        Returns:
-            Dict with phase_major, phase_minor, elevations, description
-        """
-        # Remove leading pipe and spaces
-        pack_clean = pack_name.strip().lstrip('|')
-
-        # Split on first space to separate code from description
-        parts = pack_clean.split(' ', 1)
-        code_part = parts[0] if parts else ""
-        description = parts[1] if len(parts) > 1 else ""
-
-        # Split on period (if present)
-        if '.' in code_part:
-            major_part, minor_part = code_part.split('.', 1)
-            # Handle edge case: "|.34" (period before number)
-            if not major_part:
-                # Use first digits from minor part as major
-                minor_digits = ''.join(filter(str.isdigit, minor_part))
-                if minor_digits:
-                    major_part = minor_digits[:2] if len(minor_digits) >= 2 else minor_digits
-                    minor_part = minor_digits[2:] if len(minor_digits) > 2 else ""
-        else:
-            # No period - simpler format like "|10" or "|11"
-            major_part = code_part
-            minor_part = ""
-
-        # Extract phase major (digits only)
-        phase_major = ''.join(filter(str.isdigit, major_part))
-
-        # Extract phase minor and elevations from minor part
-        phase_minor = ""
-        elevations = ""
-
-        if minor_part:
-            for char in minor_part:
-                if char.isdigit() or char in ['x', 'X']:
-                    phase_minor += char
-                elif char.isalpha() and char.upper() in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
-                    # Elevation letters (could be ABCD elevations or suffixes like 'f', 's')
-                    elevations += char.upper()
-                # Skip other characters
-
-        return {
-            'phase_major': phase_major,
-            'phase_minor': phase_minor,
-            'elevations': elevations,
-            'description': description,
-            'error': None
-        }
-
-    def detect_item_type(self, description: str, format1: str = None) -> str:
-        """Detect item type code from description
-
-        Args:
-            description: Material description
-            format1: Richmond format1 field (if available)
-
-        Returns:
-            Item type code (e.g., "1000" for framing)
-        """
-        desc_lower = description.lower()
-
-        # Framing lumber patterns
-        if any(word in desc_lower for word in ['2x', 'lumber', 'stud', 'joist', 'beam', 'header']):
-            return "1000"
-
-        # Engineered lumber
-        if any(word in desc_lower for word in ['tji', 'lvl', 'glulam', 'engineered']):
-            return "1100"
-
-        # Hardware
-        if any(word in desc_lower for word in ['hanger', 'connector', 'nail', 'screw', 'bolt', 'strap']):
-            return "1200"
-
-        # Concrete/foundation
-        if any(word in desc_lower for word in ['concrete', 'rebar', 'anchor', 'foundation']):
-            return "1300"
-
-        # Sheathing/housewrap
-        if any(word in desc_lower for word in ['osb', 'plywood', 'sheathing', 'housewrap', 'tyvek']):
-            return "2000"
-
-        # Siding
-        if any(word in desc_lower for word in ['siding', 'hardi', 'fiber cement']):
-            return "2100"
-
-        # Roofing
-        if any(word in desc_lower for word in ['shingle', 'roofing', 'roof', 'underlayment']):
-            return "2200"
-
-        # Windows/doors
-        if any(word in desc_lower for word in ['window', 'door', 'glass']):
-            return "2300"
-
-        # Default to general material
-        return "9000"
-
-    def parse_holt_code(self, code_str: str) -> Dict:
-        """Parse Holt unified code into components
-
-        Args:
-            code_str: Code like "167010100 - 4085" or "167020070" (no separator)
-
-        Returns:
-            Dict with plan, phase, elevation, item_type, full_code
-
-        Example:
-            "167010100 - 4085" → {
-                'plan': '1670',
-                'phase': '101',
-                'elevation': '00',
-                'item_type': '4085',
-                'full_code': '1670-101.000-00-4085'
-            }
-        """
-        # Split on ' - ' to separate main code from item type
-        parts = code_str.strip().split(' - ')
-
-        if len(parts) == 2:
-            # Standard format: "167010100 - 4085"
-            main_part = parts[0].strip()
-            item_type = parts[1].strip()
-        elif len(parts) > 2:
-            # Duplicate separator format: "233619505 - 4085 - 4085"
-            # Take first part as main, second as item type, ignore rest
-            main_part = parts[0].strip()
-            item_type = parts[1].strip()
-        elif len(parts) == 1:
-            # No separator format: "167020070"
-            # Assume item type is 9000 (general) or extract from elsewhere
-            main_part = parts[0].strip()
-            item_type = "9000"  # Default item type
-        else:
-            return {'error': f"Invalid code format: {code_str}"}
-
-        # Handle different main_part lengths and alphanumeric codes
-        # Alphanumeric codes like "169e10300" have letters in plan (169e)
-
-        if len(main_part) == 8:
-            # Format: PPP-PPP-EE (8 digits)
-            plan = "0" + main_part[0:3]  # Pad plan to 4 digits
-            phase = main_part[3:6]
-            elevation = main_part[6:8]
-        elif len(main_part) == 9:
-            # Standard format: PPPP-PPP-EE (9 digits or alphanumeric)
-            plan = main_part[0:4]
-            phase = main_part[4:7]
-            elevation = main_part[7:9]
-        elif len(main_part) == 10:
-            # Alphanumeric plan with extra character: "169e103000"
-            # Format: PPPa-PPP-EE (10 chars, where 'a' is a letter in plan)
-            plan = main_part[0:4]  # Take first 4 chars (e.g., "169e")
-            phase = main_part[4:7]
-            elevation = main_part[7:9]
-        else:
-            return {'error': f"Main code should be 8-10 characters, got {len(main_part)}: {main_part}"}
-
-        # Validate item type
-        item_type_clean = item_type.strip()
-        if not item_type_clean:
-            item_type_clean = "9000"  # Default
-
-        # Build unified code: PPPP-PPP.000-EE-IIII
-        full_code = f"{plan}-{phase}.000-{elevation}-{item_type_clean}"
-
-        return {
-            'plan': plan,
-            'phase': phase,
-            'elevation': elevation,
-            'item_type': item_type_clean,
-            'full_code': full_code,
-            'error': None
-        }
-
-    def import_holt_materials(self, excel_path: Path, dry_run: bool = False) -> Dict:
-        """Import Holt materials from Excel
-
-        Args:
-            excel_path: Path to Excel file
-            dry_run: If True, parse but don't import
-
-        Returns:
-            Dict with import results
-        """
-        print(f"\n{'='*80}")
-        print(f"IMPORTING HOLT MATERIALS")
-        print(f"{'='*80}")
-        print(f"File: {excel_path.name}")
-
-        if not excel_path.exists():
-            return {'error': f"File not found: {excel_path}"}
-
-        # Read Excel file
-        try:
-            df = pd.read_excel(excel_path, sheet_name="indexMaterialListsbyPlan")
-        except Exception as e:
-            return {'error': f"Failed to read Excel: {e}"}
-
-        print(f"Found {len(df)} material rows")
-        self.stats['total_rows'] = len(df)
-
-        # Detect columns
-        option_col = None
-        pack_col = None
-        desc_col = None
-        sku_col = None
-        qty_col = None
-
-        for col in df.columns:
-            col_lower = str(col).lower()
-            if 'option' in col_lower and 'phase' in col_lower:
-                option_col = col
-            if 'pack' in col_lower and 'id' in col_lower:
-                pack_col = col
-            if 'description' in col_lower and 'online' not in col_lower:
-                desc_col = col
-            if 'sku' in col_lower:
-                sku_col = col
-            if 'qty' in col_lower:
-                qty_col = col
-
-        if not option_col:
-            return {'error': f"Could not find Option/Phase Number column. Found: {list(df.columns)}"}
-
-        print(f"\nUsing columns:")
-        print(f"  Option/Phase: {option_col}")
-        print(f"  Pack ID: {pack_col}")
-        print(f"  Description: {desc_col}")
-        print(f"  SKU: {sku_col}")
-        print(f"  Quantity: {qty_col}")
-
-        # Process each row
-        imported = 0
-        flagged = 0
-        failed = 0
-        total_codes_generated = 0
-
-        for idx, row in df.iterrows():
-            # Skip empty rows
-            option_phase_str = str(row.get(option_col, ""))
-            if pd.isna(row.get(option_col)) or option_phase_str == 'nan':
-                continue
-
-            pack_id = str(row.get(pack_col, "")) if pack_col else ""
-            description = str(row.get(desc_col, "")) if desc_col else ""
-            sku = str(row.get(sku_col, "")) if sku_col else ""
-            qty = row.get(qty_col, 0) if qty_col else 0
-
-            # Split comma-separated codes
-            codes = [c.strip() for c in option_phase_str.split(',')]
-            total_codes_generated += len(codes)
-
-            # Track if ANY code for this material succeeds
-            material_success = False
-            material_errors = []
-
-            for code_str in codes:
-                # Parse Holt code
-                parsed = self.parse_holt_code(code_str)
-
-                if parsed.get('error'):
-                    material_errors.append(f"{code_str}: {parsed['error']}")
-                    continue
-
-                full_code = parsed['full_code']
-
-                if not dry_run:
-                    # Import to database
-                    try:
-                        # Note: Would call builder.add_material() here
-                        # For now, just track success
-                        self.results['imported'].append({
-                            'row': idx + 2,
-                            'full_code': full_code,
-                            'pack_id': pack_id,
-                            'description': description[:50],
-                            'sku': sku,
-                            'qty': qty
-                        })
-                        material_success = True
-                    except Exception as e:
-                        material_errors.append(f"{code_str}: {str(e)}")
-                else:
-                    # Dry run - show first few
-                    if imported < 10 and len(codes) <= 3:  # Show simple cases
-                        print(f"  Row {idx+2}: {full_code}")
-                        print(f"    Pack: {pack_id}")
-                        print(f"    Desc: {description[:60]}")
-                    material_success = True
-
-            # Track material-level success/failure
-            if material_success:
-                imported += 1
-            elif material_errors:
-                self.results['flagged'].append({
-                    'row': idx + 2,
-                    'pack_id': pack_id,
-                    'description': description,
-                    'codes': option_phase_str[:100],
-                    'issue': '; '.join(material_errors[:3])
-                })
-                flagged += 1
-
-        self.stats['total_codes'] = total_codes_generated
-        self.stats['holt_materials'] = imported
-
-        print(f"\n{'='*80}")
-        print(f"IMPORT SUMMARY")
-        print(f"{'='*80}")
-        print(f"  📦 Material Rows:     {len(df)}")
-        print(f"  🔢 Codes Generated:   {total_codes_generated}")
-        print(f"  ✅ Imported:          {imported} materials ({len(self.results['imported'])} codes)")
-        print(f"  ⚠️  Flagged:           {flagged}")
-        print(f"  ❌ Failed:            {failed}")
-
-        return {
-            'imported': imported,
-            'flagged': flagged,
-            'failed': failed,
-            'total': len(df),
-            'codes_generated': total_codes_generated
-        }
-
-    def import_richmond_plan(self, excel_path: Path, plan_code: str = None,
-                           sheet_name: str = None, dry_run: bool = False) -> Dict:
-        """Import Richmond plan from Excel
-
-        Args:
-            excel_path: Path to Excel file
-            plan_code: Plan code (e.g., "1670")
-            sheet_name: Sheet name to import (None = auto-detect)
-            dry_run: If True, parse but don't import
-
-        Returns:
-            Dict with import results
-        """
-        print(f"\n{'='*80}")
-        print(f"IMPORTING RICHMOND PLAN: {plan_code or 'Auto-detect'}")
-        print(f"{'='*80}")
-        print(f"File: {excel_path.name}")
-
-        if not excel_path.exists():
-            return {'error': f"File not found: {excel_path}"}
-
-        # Read Excel file
-        try:
-            if sheet_name:
-                df = pd.read_excel(excel_path, sheet_name=sheet_name, header=1)
-            else:
-                # Try to find materials sheet
-                xls = pd.ExcelFile(excel_path)
-                sheet_names = xls.sheet_names
-
-                # Look for common sheet names
-                materials_sheet = None
-                for name in sheet_names:
-                    if 'combined' in name.lower() or 'material' in name.lower():
-                        materials_sheet = name
-                        break
-
-                if not materials_sheet:
-                    materials_sheet = sheet_names[0]
-
-                print(f"Using sheet: {materials_sheet}")
-                # Use header=1 to skip first empty row
-                df = pd.read_excel(excel_path, sheet_name=materials_sheet, header=1)
-
-        except Exception as e:
-            return {'error': f"Failed to read Excel: {e}"}
-
-        print(f"Found {len(df)} rows")
-
-        # Detect columns
-        pack_col = None
-        desc_col = None
-        sku_col = None
-        qty_col = None
-        plan_col = None
-
-        for col in df.columns:
-            col_lower = str(col).lower()
-            # Richmond uses "Location" for pack ID
-            if ('pack' in col_lower or 'location' in col_lower) and pack_col is None:
-                pack_col = col
-            if 'description' in col_lower and desc_col is None:
-                desc_col = col
-            if 'sku' in col_lower and sku_col is None:
-                sku_col = col
-            if 'qty' in col_lower or 'quantity' in col_lower:
-                qty_col = col
-            if 'plan' in col_lower and plan_col is None:
-                plan_col = col
-
-        if not pack_col:
-            return {'error': f"Could not find Pack ID/Location column. Found columns: {list(df.columns)}"}
-
-        print(f"Using columns:")
-        print(f"  Plan: {plan_col}")
-        print(f"  Pack ID/Location: {pack_col}")
-        print(f"  Description: {desc_col}")
-        print(f"  SKU: {sku_col}")
-        print(f"  Quantity: {qty_col}")
-
-        # If we have a Plan column, filter to specific plan
-        if plan_col and plan_code:
-            df = df[df[plan_col] == plan_code]
-            print(f"\nFiltered to plan {plan_code}: {len(df)} rows")
-        elif plan_col and not plan_code:
-            # Show available plans
-            unique_plans = df[plan_col].unique()
-            print(f"\nAvailable plans: {', '.join([str(p) for p in unique_plans[:10]])}")
-            if len(unique_plans) > 10:
-                print(f"... and {len(unique_plans) - 10} more")
-            return {'error': "Multiple plans found. Please specify --plan CODE"}
-
-        if not plan_code:
-            return {'error': "Could not detect plan code. Please specify --plan"}
-
-        print(f"\nPlan Code: {plan_code}")
-
-        # Process each row
-        imported = 0
-        flagged = 0
-        failed = 0
-
-        for idx, row in df.iterrows():
-            # Skip empty rows
-            if pd.isna(row.get(pack_col)):
-                continue
-
-            pack_id = str(row[pack_col]).strip()
-            description = str(row.get(desc_col, "")) if desc_col else ""
-            sku = str(row.get(sku_col, "")) if sku_col else ""
-            qty = row.get(qty_col, 0) if qty_col else 0
-
-            # Parse pack name
-            parsed = self.parse_richmond_pack_name(pack_id)
-
-            if parsed.get('error'):
-                self.results['flagged'].append({
-                    'row': idx + 2,
-                    'pack_id': pack_id,
-                    'description': description,
-                    'issue': parsed['error']
-                })
-                flagged += 1
-                continue
-
-            # Build unified phase code
-            phase_major = parsed['phase_major']
-            phase_minor = parsed['phase_minor']
-
-            if not phase_major:
-                self.results['flagged'].append({
-                    'row': idx + 2,
-                    'pack_id': pack_id,
-                    'description': description,
-                    'issue': "Could not extract phase major"
-                })
-                flagged += 1
-                continue
-
-            # Format phase code: XXX.XXX
-            phase_code = f"{int(phase_major):03d}.{phase_minor or '000'}"
-
-            # Get elevations
-            elevation_code = parsed['elevations'] if parsed['elevations'] else "**"
-
-            # Detect item type
-            item_type_code = self.detect_item_type(description)
-
-            # Build full code
-            full_code = f"{plan_code}-{phase_code}-{elevation_code}-{item_type_code}"
-
-            if not dry_run:
-                # Import to database
-                try:
-                    # Note: Would call builder.add_material() here
-                    # For now, just track success
-                    self.results['imported'].append({
-                        'row': idx + 2,
-                        'full_code': full_code,
-                        'pack_id': pack_id,
-                        'description': description[:50]
-                    })
-                    imported += 1
-                except Exception as e:
-                    self.results['failed'].append({
-                        'row': idx + 2,
-                        'pack_id': pack_id,
-                        'error': str(e)
-                    })
-                    failed += 1
-            else:
-                # Dry run - just show what would be imported
-                if imported < 10:  # Show first 10
-                    print(f"  Row {idx+2}: {full_code}")
-                    print(f"    Pack: {pack_id}")
-                    print(f"    Desc: {description[:60]}")
-                imported += 1
-
-        print(f"\n{'='*80}")
-        print(f"IMPORT SUMMARY")
-        print(f"{'='*80}")
-        print(f"  ✅ Imported: {imported}")
-        print(f"  ⚠️  Flagged:  {flagged}")
-        print(f"  ❌ Failed:   {failed}")
-
-        return {
-            'imported': imported,
-            'flagged': flagged,
-            'failed': failed,
-            'total': len(df)
-        }
-
-    def generate_report(self, output_path: Path = None):
-        """Generate validation report
-
-        Args:
-            output_path: Where to save report (None = print to console)
-        """
-        report = []
-        report.append("=" * 80)
-        report.append("BAT IMPORT VALIDATION REPORT")
-        report.append("=" * 80)
-        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append("")
-
-        # Summary
-        report.append("SUMMARY")
-        report.append("-" * 80)
-        report.append(f"  ✅ Successfully Imported: {len(self.results['imported'])}")
-        report.append(f"  ⚠️  Flagged for Review:   {len(self.results['flagged'])}")
-        report.append(f"  ❌ Failed to Import:     {len(self.results['failed'])}")
-        report.append("")
-
-        # Flagged items
-        if self.results['flagged']:
-            report.append("ITEMS NEEDING REVIEW")
-            report.append("-" * 80)
-            for item in self.results['flagged'][:20]:  # Show first 20
-                report.append(f"\nRow {item['row']}: {item['pack_id']}")
-                report.append(f"  Description: {item['description'][:70]}")
-                report.append(f"  Issue: {item['issue']}")
-
-            if len(self.results['flagged']) > 20:
-                report.append(f"\n... and {len(self.results['flagged']) - 20} more")
-            report.append("")
-
-        # Failed items
-        if self.results['failed']:
-            report.append("FAILED IMPORTS")
-            report.append("-" * 80)
-            for item in self.results['failed'][:10]:  # Show first 10
-                report.append(f"\nRow {item['row']}: {item['pack_id']}")
-                report.append(f"  Error: {item['error']}")
-            report.append("")
-
-        # Sample successful imports
-        if self.results['imported']:
-            report.append("SAMPLE SUCCESSFUL IMPORTS (first 10)")
-            report.append("-" * 80)
-            for item in self.results['imported'][:10]:
-                report.append(f"Row {item['row']}: {item['full_code']}")
-                report.append(f"  Pack: {item['pack_id']}")
-                report.append(f"  Desc: {item['description']}")
-                report.append("")
-
-        report_text = "\n".join(report)
-
-        if output_path:
-            output_path.write_text(report_text)
-            print(f"\n✅ Report saved to: {output_path}")
-        else:
-            print("\n" + report_text)
-
-
-def main():
-    """Main entry point"""
-    import argparse
-
-    parser = argparse.ArgumentParser(description="Automated BAT Import Tool")
-    parser.add_argument('--plan', help="Plan code (e.g., 1670)")
-    parser.add_argument('--richmond', action='store_true', help="Import Richmond files")
-    parser.add_argument('--holt', action='store_true', help="Import Holt files")
-    parser.add_argument('--file', type=Path, help="Specific Excel file to import")
-    parser.add_argument('--dry-run', action='store_true', help="Parse but don't import")
-    parser.add_argument('--report', type=Path, help="Save report to file")
-    parser.add_argument('--version', action='version', version=f'%(prog)s {__version__}')
-
-    args = parser.parse_args()
-
-    # Create importer
-    importer = BATAutoImporter()
-
-    # Holt import mode
-    if args.holt and args.file:
-        result = importer.import_holt_materials(
-            args.file,
-            dry_run=args.dry_run
-        )
-
-        if result.get('error'):
-            print(f"❌ Error: {result['error']}")
-            sys.exit(1)
-
-        # Generate report
-        importer.generate_report(args.report)
-
-    # Richmond import mode
-    elif args.file:
-        result = importer.import_richmond_plan(
-            args.file,
-            plan_code=args.plan,
-            dry_run=args.dry_run
-        )
-
-        if result.get('error'):
-            print(f"❌ Error: {result['error']}")
-            sys.exit(1)
-
-        # Generate report
-        importer.generate_report(args.report)
-
-    else:
-        print("BAT Auto Import Tool")
-        print(f"Version: {__version__}")
-        print("\nUsage:")
-        print("  Richmond:")
-        print("    --file FILE --plan G18L --dry-run    # Test import Richmond plan")
-        print("    --file FILE --plan G18L               # Import Richmond plan G18L")
-        print("\n  Holt:")
-        print("    --holt --file FILE --dry-run          # Test import Holt materials")
-        print("    --holt --file FILE                    # Import all Holt materials")
-        print("\nExamples:")
-        print('  python auto_import_bat.py --file "RAH_MaterialDatabase.xlsx" --plan G18L --dry-run')
-        print('  python auto_import_bat.py --holt --file "indexMaterialListbyPlanHolt20251114.xlsx" --dry-run')
-
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""
+Automated BAT Import Tool
+Imports Richmond and Holt Excel files into unified database
+
+Version: 1.0.0
+Author: Corey Dev Framework
+"""
+
+import contextlib
+import glob
+import io
+import os
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent / "docs" / "Migration Strategy" / "bat_coding_system_builder"))
+
+from bat_coding_system_builder import BULK_CHUNK_SIZE, BATCodingSystemBuilder
+from elevation_codes import count_by_elevation, encode_elevations
+
+__version__ = "1.1.0"
+
+HOLT_SHEET_NAME = "indexMaterialListsbyPlan"
+
+# Richmond plan code in batch file names: "Plan_G18L.xlsx", "Richmond plan-1670 v2.xlsx"
+PLAN_FILENAME = re.compile(r"(?:^|[^A-Za-z])plan[_\- ]+([A-Za-z0-9]+)", re.IGNORECASE)
+
+
+def _db_value(value):
+    """Cell value for SQLite: None for blank cells, numpy scalars as Python values"""
+    if value is None or pd.isna(value):
+        return None
+    return value.item() if isinstance(value, np.generic) else value
+
+
+# Rows per chunk in streaming mode (bounds memory held per chunk)
+DEFAULT_CHUNK_SIZE = 5000
+
+# progress(rows_read, rows_estimate) - called after each streamed chunk
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+class SheetStream:
+    """Lazy row reader for one worksheet (openpyxl read-only mode)
+
+    Yields rows shaped like pd.read_excel would produce them - header names
+    ("Unnamed: N" for blank headers, ".1" suffixes for duplicates), 0-based
+    row index after the header, blank cells as NaN, trailing blank rows
+    dropped - without ever holding the whole sheet in memory.
+
+    Values are passed through as stored in the workbook: unlike a DataFrame
+    there is no column-wide dtype inference, so an integer SKU in a column
+    with blanks stays 12345 instead of becoming 12345.0.
+    """
+
+    def __init__(self, path: Path):
+        from openpyxl import load_workbook
+
+        self.workbook = load_workbook(path, read_only=True, data_only=True)
+        self.sheet_names = self.workbook.sheetnames
+        self.columns: List = []
+        self.rows_read = 0
+        self.rows_estimate: Optional[int] = None
+        self._rows = None
+
+    def open_sheet(self, sheet_name: str, header: int = 0):
+        """Select the worksheet and read its header row
+
+        Args:
+            sheet_name: Worksheet name
+            header: 0-based row number of the header (as in pd.read_excel)
+        """
+        worksheet = self.workbook[sheet_name]
+        self._rows = worksheet.iter_rows(values_only=True)
+
+        header_cells = ()
+        for _ in range(header + 1):
+            header_cells = next(self._rows, ())
+
+        columns = []
+        seen = {}
+        for position, name in enumerate(header_cells):
+            if name is None or name == "":
+                name = f"Unnamed: {position}"
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
+            else:
+                seen[name] = 0
+            columns.append(name)
+        self.columns = columns
+
+        if worksheet.max_row:
+            self.rows_estimate = max(worksheet.max_row - header - 1, 0)
+
+    def rows(self) -> Iterator[Tuple[int, Dict]]:
+        """Yield (index, {column: value}) for each data row"""
+        width = len(self.columns)
+        blank_run = []
+        for idx, cells in enumerate(self._rows):
+            values = [
+                float('nan') if value is None or value == "" else value
+                for value in cells[:width]
+            ]
+            values.extend([float('nan')] * (width - len(values)))
+            row = dict(zip(self.columns, values))
+
+            if all(pd.isna(value) for value in values):
+                # Held back: trailing blank rows are not part of the sheet
+                blank_run.append((idx, row))
+                continue
+
+            for blank in blank_run:
+                self.rows_read += 1
+                yield blank
+            blank_run = []
+            self.rows_read += 1
+            yield idx, row
+
+    def chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Tuple[int, Dict]]]:
+        """Yield rows() in lists of at most chunk_size rows"""
+        chunk = []
+        for item in self.rows():
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def unique_values(self, column) -> List:
+        """Distinct values of one column in first-seen order (consumes the rows)"""
+        unique = {}
+        for _, row in self.rows():
+            value = row.get(column)
+            unique.setdefault('nan' if pd.isna(value) else value, value)
+        return list(unique.values())
+
+    def close(self):
+        """Release the workbook file handle"""
+        self.workbook.close()
+
+
+class BATAutoImporter:
+    """Automated BAT file importer with validation"""
+
+    def __init__(self, db_path: str = None, defer_writes: bool = False):
+        """Initialize importer
+
+        Args:
+            db_path: Path to database (defaults to Migration Strategy location)
+            defer_writes: Leave parsed materials in pending_materials instead of
+                writing them at the end of an import (batch worker processes)
+        """
+        if db_path is None:
+            db_path = Path(__file__).parent.parent / "docs" / "Migration Strategy" / "bat_coding_system_builder" / "bat_unified.db"
+
+        self.db_path = Path(db_path)
+        self.defer_writes = defer_writes
+        self.builder = BATCodingSystemBuilder(str(self.db_path))
+        self.results = {
+            'imported': [],
+            'flagged': [],
+            'failed': [],
+            'warnings': []
+        }
+        # Validated materials waiting for write_pending_materials()
+        self.pending_materials: List[Dict] = []
+        # Per-workbook summaries from import_batch()
+        self.batch_files: List[Dict] = []
+        self.stats = {
+            'total_rows': 0,
+            'total_codes': 0,
+            'richmond_materials': 0,
+            'holt_materials': 0
+        }
+
+    def parse_richmond_pack_name(self, pack_name: str) -> Dict:
+        """Parse Richmond pack name into components
+
+        Args:
+            pack_name: Pack name like "|10.82BCD OPT DEN FOUNDATION"
+
+        Returns:
+            Dict with phase_major, phase_minor, elevations, description
+        """
+        # Remove leading pipe and spaces
+        pack_clean = pack_name.strip().lstrip('|')
+
+        # Split on first space to separate code from description
+        parts = pack_clean.split(' ', 1)
+        code_part = parts[0] if parts else ""
+        description = parts[1] if len(parts) > 1 else ""
+
+        # Split on period (if present)
+        if '.' in code_part:
+            major_part, minor_part = code_part.split('.', 1)
+            # Handle edge case: "|.34" (period before number)
+            if not major_part:
+                # Use first digits from minor part as major
+                minor_digits = ''.join(filter(str.isdigit, minor_part))
+                if minor_digits:
+                    major_part = minor_digits[:2] if len(minor_digits) >= 2 else minor_digits
+                    minor_part = minor_digits[2:] if len(minor_digits) > 2 else ""
+        else:
+            # No period - simpler format like "|10" or "|11"
+            major_part = code_part
+            minor_part = ""
+
+        # Extract phase major (digits only)
+        phase_major = ''.join(filter(str.isdigit, major_part))
+
+        # Extract phase minor and elevations from minor part
+        phase_minor = ""
+        elevations = ""
+
+        if minor_part:
+            for char in minor_part:
+                if char.isdigit() or char in ['x', 'X']:
+                    phase_minor += char
+                elif char.isalpha() and char.upper() in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
+                    # Elevation letters (could be ABCD elevations or suffixes like 'f', 's')
+                    elevations += char.upper()
+                # Skip other characters
+
+        return {
+            'phase_major': phase_major,
+            'phase_minor': phase_minor,
+            'elevations': elevations,
+            'description': description,
+            'error': None
+        }
+
+    def detect_item_type(self, description: str, format1: str = None) -> str:
+        """Detect item type code from description
+
+        Args:
+            description: Material description
+            format1: Richmond format1 field (if available)
+
+        Returns:
+            Item type code (e.g., "1000" for framing)
+        """
+        desc_lower = description.lower()
+
+        # Framing lumber patterns
+        if any(word in desc_lower for word in ['2x', 'lumber', 'stud', 'joist', 'beam', 'header']):
+            return "1000"
+
+        # Engineered lumber
+        if any(word in desc_lower for word in ['tji', 'lvl', 'glulam', 'engineered']):
+            return "1100"
+
+        # Hardware
+        if any(word in desc_lower for word in ['hanger', 'connector', 'nail', 'screw', 'bolt', 'strap']):
+            return "1200"
+
+        # Concrete/foundation
+        if any(word in desc_lower for word in ['concrete', 'rebar', 'anchor', 'foundation']):
+            return "1300"
+
+        # Sheathing/housewrap
+        if any(word in desc_lower for word in ['osb', 'plywood', 'sheathing', 'housewrap', 'tyvek']):
+            return "2000"
+
+        # Siding
+        if any(word in desc_lower for word in ['siding', 'hardi', 'fiber cement']):
+            return "2100"
+
+        # Roofing
+        if any(word in desc_lower for word in ['shingle', 'roofing', 'roof', 'underlayment']):
+            return "2200"
+
+        # Windows/doors
+        if any(word in desc_lower for word in ['window', 'door', 'glass']):
+            return "2300"
+
+        # Default to general material
+        return "9000"
+
+    def parse_holt_code(self, code_str: str) -> Dict:
+        """Parse Holt unified code into components
+
+        Args:
+            code_str: Code like "167010100 - 4085" or "167020070" (no separator)
+
+        Returns:
+            Dict with plan, phase, elevation, item_type, full_code
+
+        Example:
+            "167010100 - 4085" → {
+                'plan': '1670',
+                'phase': '101',
+                'elevation': '00',
+                'item_type': '4085',
+                'full_code': '1670-101.000-00-4085'
+            }
+        """
+        # Split on ' - ' to separate main code from item type
+        parts = code_str.strip().split(' - ')
+
+        if len(parts) == 2:
+            # Standard format: "167010100 - 4085"
+            main_part = parts[0].strip()
+            item_type = parts[1].strip()
+        elif len(parts) > 2:
+            # Duplicate separator format: "233619505 - 4085 - 4085"
+            # Take first part as main, second as item type, ignore rest
+            main_part = parts[0].strip()
+            item_type = parts[1].strip()
+        elif len(parts) == 1:
+            # No separator format: "167020070"
+            # Assume item type is 9000 (general) or extract from elsewhere
+            main_part = parts[0].strip()
+            item_type = "9000"  # Default item type
+        else:
+            return {'error': f"Invalid code format: {code_str}"}
+
+        # Handle different main_part lengths and alphanumeric codes
+        # Alphanumeric codes like "169e10300" have letters in plan (169e)
+
+        if len(main_part) == 8:
+            # Format: PPP-PPP-EE (8 digits)
+            plan = "0" + main_part[0:3]  # Pad plan to 4 digits
+            phase = main_part[3:6]
+            elevation = main_part[6:8]
+        elif len(main_part) == 9:
+            # Standard format: PPPP-PPP-EE (9 digits or alphanumeric)
+            plan = main_part[0:4]
+            phase = main_part[4:7]
+            elevation = main_part[7:9]
+        elif len(main_part) == 10:
+            # Alphanumeric plan with extra character: "169e103000"
+            # Format: PPPa-PPP-EE (10 chars, where 'a' is a letter in plan)
+            plan = main_part[0:4]  # Take first 4 chars (e.g., "169e")
+            phase = main_part[4:7]
+            elevation = main_part[7:9]
+        else:
+            return {'error': f"Main code should be 8-10 characters, got {len(main_part)}: {main_part}"}
+
+        # Validate item type
+        item_type_clean = item_type.strip()
+        if not item_type_clean:
+            item_type_clean = "9000"  # Default
+
+        # Build unified code: PPPP-PPP.000-EE-IIII
+        full_code = f"{plan}-{phase}.000-{elevation}-{item_type_clean}"
+
+        return {
+            'plan': plan,
+            'phase': phase,
+            'elevation': elevation,
+            'item_type': item_type_clean,
+            'full_code': full_code,
+            'error': None
+        }
+
+    def parse_holt_codes(self, values: pd.Series) -> pd.DataFrame:
+        """parse_holt_code() for a whole Option/Phase Number column
+
+        Same rules as parse_holt_code(), applied with pandas string column
+        operations instead of a Python call per code. Comma-separated code
+        lists are exploded to one row per code; empty cells (NaN/'nan') are
+        skipped like in the row import.
+
+        Args:
+            values: Option/Phase Number column (any index)
+
+        Returns:
+            DataFrame with one row per code, indexed by the source row index:
+            code, plan, phase, elevation, item_type, full_code, error.
+            Parsed codes have error None; failed codes have only code and error set.
+        """
+        text = values.astype(str)
+        codes = text[values.notna() & (text != 'nan')].str.split(',').explode().str.strip()
+        codes = codes.astype(object)
+
+        # Holt sheets repeat each code across many materials: parse the
+        # distinct codes, then broadcast back by position
+        labels, distinct = pd.factorize(codes)
+        distinct = pd.Series(distinct, dtype=object)
+
+        # "main - item[ - ignored]"; no separator means item type 9000
+        parts = distinct.str.split(' - ')
+        main = parts.str.get(0).str.strip()
+        item_type = parts.str.get(1).fillna('').str.strip()
+        item_type = item_type.mask(item_type == '', '9000')
+
+        # 8 chars: PPP-PPP-EE (plan padded to 4); 9-10 chars: PPPP-PPP-EE
+        length = main.str.len()
+        short = length == 8
+        plan = main.str.slice(0, 4).mask(short, '0' + main.str.slice(0, 3))
+        phase = main.str.slice(4, 7).mask(short, main.str.slice(3, 6))
+        elevation = main.str.slice(7, 9).mask(short, main.str.slice(6, 8))
+        full_code = plan + '-' + phase + '.000-' + elevation + '-' + item_type
+
+        valid = length.between(8, 10).to_numpy()
+        error = np.full(len(distinct), None, dtype=object)
+        error[~valid] = ('Main code should be 8-10 characters, got '
+                         + length[~valid].astype(str) + ': ' + main[~valid]).to_numpy(dtype=object)
+        columns = {'code': codes.to_numpy()}
+        for field, column in (('plan', plan), ('phase', phase), ('elevation', elevation),
+                              ('item_type', item_type), ('full_code', full_code)):
+            columns[field] = np.where(valid, column.to_numpy(dtype=object), None)[labels]
+        columns['error'] = error[labels]
+        return pd.DataFrame(columns, index=codes.index, dtype=object)
+
+    def _parse_holt_rows(self, values: pd.Series) -> Dict:
+        """parse_holt_codes() grouped back to rows: row index -> list of parsed code dicts"""
+        parsed = self.parse_holt_codes(values)
+        by_row = {}
+        for idx, record in zip(parsed.index, parsed.to_dict('records')):
+            by_row.setdefault(idx, []).append(record)
+        return by_row
+
+    def _detect_holt_columns(self, columns) -> Dict:
+        """Find the Holt material sheet columns by header name"""
+        cols = {'option': None, 'pack': None, 'desc': None, 'sku': None, 'qty': None}
+        for col in columns:
+            col_lower = str(col).lower()
+            if 'option' in col_lower and 'phase' in col_lower:
+                cols['option'] = col
+            if 'pack' in col_lower and 'id' in col_lower:
+                cols['pack'] = col
+            if 'description' in col_lower and 'online' not in col_lower:
+                cols['desc'] = col
+            if 'sku' in col_lower:
+                cols['sku'] = col
+            if 'qty' in col_lower:
+                cols['qty'] = col
+        return cols
+
+    def _process_holt_row(self, idx, row, cols: Dict, dry_run: bool, counts: Dict,
+                          parsed_codes: List[Dict]):
+        """Record one Holt material row and its parsed codes in results/counts
+
+        Args:
+            idx: 0-based data row index (report row = idx + 2)
+            row: pandas Series or dict of column -> value (blank cells NaN)
+            cols: Columns from _detect_holt_columns()
+            dry_run: If True, parse but don't import
+            counts: Running imported/flagged/codes counters
+            parsed_codes: The row's codes from _parse_holt_rows()
+        """
+        option_col, pack_col, desc_col = cols['option'], cols['pack'], cols['desc']
+        sku_col, qty_col = cols['sku'], cols['qty']
+
+        # Skip empty rows
+        option_phase_str = str(row.get(option_col, ""))
+        if pd.isna(row.get(option_col)) or option_phase_str == 'nan':
+            return
+
+        pack_id = str(row.get(pack_col, "")) if pack_col else ""
+        description = str(row.get(desc_col, "")) if desc_col else ""
+        sku = str(row.get(sku_col, "")) if sku_col else ""
+        qty = row.get(qty_col, 0) if qty_col else 0
+
+        # Comma-separated codes, parsed for the whole column/chunk up front
+        codes = parsed_codes
+        counts['codes'] += len(codes)
+
+        # Track if ANY code for this material succeeds
+        material_success = False
+        material_errors = []
+
+        for parsed in codes:
+            code_str = parsed['code']
+
+            if parsed.get('error'):
+                material_errors.append(f"{code_str}: {parsed['error']}")
+                continue
+
+            full_code = parsed['full_code']
+
+            if not dry_run:
+                # Import to database
+                try:
+                    material = {
+                        'plan_code': parsed['plan'],
+                        'phase_code': f"{parsed['phase']}.000",
+                        'elevation_code': parsed['elevation'],
+                        'item_type_code': parsed['item_type'],
+                        'vendor_sku': _db_value(row.get(sku_col)) if sku_col else None,
+                        'description': _db_value(row.get(desc_col)) if desc_col else None,
+                        'quantity': _db_value(qty),
+                        'holt_item_number': code_str,
+                    }
+                    error = self.builder.validate_material(material)
+                    if error:
+                        raise ValueError(error)
+                    self.pending_materials.append(material)
+
+                    self.results['imported'].append({
+                        'row': idx + 2,
+                        'full_code': full_code,
+                        'pack_id': pack_id,
+                        'description': description[:50],
+                        'sku': sku,
+                        'qty': qty
+                    })
+                    material_success = True
+                except Exception as e:
+                    material_errors.append(f"{code_str}: {str(e)}")
+            else:
+                # Dry run - show first few
+                if counts['imported'] < 10 and len(codes) <= 3:  # Show simple cases
+                    print(f"  Row {idx+2}: {full_code}")
+                    print(f"    Pack: {pack_id}")
+                    print(f"    Desc: {description[:60]}")
+                material_success = True
+
+        # Track material-level success/failure
+        if material_success:
+            counts['imported'] += 1
+        elif material_errors:
+            self.results['flagged'].append({
+                'row': idx + 2,
+                'pack_id': pack_id,
+                'description': description,
+                'codes': option_phase_str[:100],
+                'issue': '; '.join(material_errors[:3])
+            })
+            counts['flagged'] += 1
+
+    def import_holt_materials(self, excel_path: Path, dry_run: bool = False,
+                              streaming: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                              progress: Optional[ProgressCallback] = None) -> Dict:
+        """Import Holt materials from Excel
+
+        Args:
+            excel_path: Path to Excel file
+            dry_run: If True, parse but don't import
+            streaming: Read rows lazily (openpyxl read-only) in chunks instead
+                of loading the whole sheet into a DataFrame
+            chunk_size: Rows per chunk in streaming mode
+            progress: Optional callback(rows_read, rows_estimate) after each chunk
+
+        Returns:
+            Dict with import results
+        """
+        print(f"\n{'='*80}")
+        print(f"IMPORTING HOLT MATERIALS")
+        print(f"{'='*80}")
+        print(f"File: {excel_path.name}")
+
+        if not excel_path.exists():
+            return {'error': f"File not found: {excel_path}"}
+
+        # Read Excel file
+        try:
+            if streaming:
+                stream = SheetStream(excel_path)
+                stream.open_sheet(HOLT_SHEET_NAME)
+                columns = stream.columns
+            else:
+                df = pd.read_excel(excel_path, sheet_name=HOLT_SHEET_NAME)
+                columns = df.columns
+        except Exception as e:
+            return {'error': f"Failed to read Excel: {e}"}
+
+        if streaming:
+            print(f"Streaming ~{stream.rows_estimate} material rows in chunks of {chunk_size}")
+        else:
+            print(f"Found {len(df)} material rows")
+            self.stats['total_rows'] = len(df)
+
+        # Detect columns
+        cols = self._detect_holt_columns(columns)
+
+        if not cols['option']:
+            if streaming:
+                stream.close()
+            return {'error': f"Could not find Option/Phase Number column. Found: {list(columns)}"}
+
+        print(f"\nUsing columns:")
+        print(f"  Option/Phase: {cols['option']}")
+        print(f"  Pack ID: {cols['pack']}")
+        print(f"  Description: {cols['desc']}")
+        print(f"  SKU: {cols['sku']}")
+        print(f"  Quantity: {cols['qty']}")
+
+        # Process each row
+        counts = {'imported': 0, 'flagged': 0, 'failed': 0, 'codes': 0}
+
+        if streaming:
+            try:
+                for chunk in stream.chunks(chunk_size):
+                    option_values = pd.Series(
+                        [row.get(cols['option']) for _, row in chunk],
+                        index=[idx for idx, _ in chunk], dtype=object,
+                    )
+                    parsed_rows = self._parse_holt_rows(option_values)
+                    for idx, row in chunk:
+                        self._process_holt_row(idx, row, cols, dry_run, counts,
+                                               parsed_rows.get(idx, []))
+                    if progress:
+                        progress(stream.rows_read, stream.rows_estimate)
+            except Exception as e:
+                return {'error': f"Failed to read Excel: {e}"}
+            finally:
+                stream.close()
+            total_rows = stream.rows_read
+            self.stats['total_rows'] = total_rows
+        else:
+            parsed_rows = self._parse_holt_rows(df[cols['option']])
+            for idx, row in df.iterrows():
+                self._process_holt_row(idx, row, cols, dry_run, counts, parsed_rows.get(idx, []))
+            total_rows = len(df)
+
+        written = None
+        if not dry_run and not self.defer_writes:
+            try:
+                written = self.write_pending_materials(excel_path.name)
+            except Exception as e:
+                return {'error': f"Failed to write materials: {e}"}
+
+        imported, flagged, failed = counts['imported'], counts['flagged'], counts['failed']
+        total_codes_generated = counts['codes']
+        self.stats['total_codes'] = total_codes_generated
+        self.stats['holt_materials'] = imported
+
+        print(f"\n{'='*80}")
+        print(f"IMPORT SUMMARY")
+        print(f"{'='*80}")
+        print(f"  📦 Material Rows:     {total_rows}")
+        print(f"  🔢 Codes Generated:   {total_codes_generated}")
+        print(f"  ✅ Imported:          {imported} materials ({len(self.results['imported'])} codes)")
+        print(f"  ⚠️  Flagged:           {flagged}")
+        print(f"  ❌ Failed:            {failed}")
+        if written is not None:
+            print(f"  💾 Written:           {written} codes to {self.db_path.name}")
+
+        return {
+            'imported': imported,
+            'flagged': flagged,
+            'failed': failed,
+            'total': total_rows,
+            'codes_generated': total_codes_generated
+        }
+
+    def _find_materials_sheet(self, sheet_names: List[str]) -> str:
+        """Pick the Richmond materials sheet ("combined"/"material" name, else the first)"""
+        for name in sheet_names:
+            if 'combined' in name.lower() or 'material' in name.lower():
+                return name
+        return sheet_names[0]
+
+    def _detect_richmond_columns(self, columns) -> Dict:
+        """Find the Richmond plan sheet columns by header name"""
+        cols = {'pack': None, 'desc': None, 'sku': None, 'qty': None, 'plan': None}
+        for col in columns:
+            col_lower = str(col).lower()
+            # Richmond uses "Location" for pack ID
+            if ('pack' in col_lower or 'location' in col_lower) and cols['pack'] is None:
+                cols['pack'] = col
+            if 'description' in col_lower and cols['desc'] is None:
+                cols['desc'] = col
+            if 'sku' in col_lower and cols['sku'] is None:
+                cols['sku'] = col
+            if 'qty' in col_lower or 'quantity' in col_lower:
+                cols['qty'] = col
+            if 'plan' in col_lower and cols['plan'] is None:
+                cols['plan'] = col
+        return cols
+
+    def _process_richmond_row(self, idx, row, cols: Dict, plan_code: str,
+                              dry_run: bool, counts: Dict):
+        """Parse one Richmond plan row and record it in results/counts
+
+        Args:
+            idx: 0-based data row index (report row = idx + 2)
+            row: pandas Series or dict of column -> value (blank cells NaN)
+            cols: Columns from _detect_richmond_columns()
+            plan_code: Plan code for the unified code
+            dry_run: If True, parse but don't import
+            counts: Running imported/flagged/failed counters
+        """
+        pack_col, desc_col, sku_col, qty_col = cols['pack'], cols['desc'], cols['sku'], cols['qty']
+
+        # Skip empty rows
+        if pd.isna(row.get(pack_col)):
+            return
+
+        pack_id = str(row[pack_col]).strip()
+        description = str(row.get(desc_col, "")) if desc_col else ""
+        sku = str(row.get(sku_col, "")) if sku_col else ""
+        qty = row.get(qty_col, 0) if qty_col else 0
+
+        # Parse pack name
+        parsed = self.parse_richmond_pack_name(pack_id)
+
+        if parsed.get('error'):
+            self.results['flagged'].append({
+                'row': idx + 2,
+                'pack_id': pack_id,
+                'description': description,
+                'issue': parsed['error']
+            })
+            counts['flagged'] += 1
+            return
+
+        # Build unified phase code
+        phase_major = parsed['phase_major']
+        phase_minor = parsed['phase_minor']
+
+        if not phase_major:
+            self.results['flagged'].append({
+                'row': idx + 2,
+                'pack_id': pack_id,
+                'description': description,
+                'issue': "Could not extract phase major"
+            })
+            counts['flagged'] += 1
+            return
+
+        # Format phase code: XXX.XXX
+        phase_code = f"{int(phase_major):03d}.{phase_minor or '000'}"
+
+        # Get elevations
+        elevation_code = parsed['elevations'] if parsed['elevations'] else "**"
+
+        # Detect item type
+        item_type_code = self.detect_item_type(description)
+
+        # Build full code
+        full_code = f"{plan_code}-{phase_code}-{elevation_code}-{item_type_code}"
+
+        if not dry_run:
+            # Import to database
+            try:
+                material = {
+                    'plan_code': plan_code,
+                    'phase_code': phase_code,
+                    'elevation_code': elevation_code,
+                    'item_type_code': item_type_code,
+                    'vendor_sku': _db_value(row.get(sku_col)) if sku_col else None,
+                    'description': _db_value(row.get(desc_col)) if desc_col else None,
+                    'quantity': _db_value(qty),
+                    'richmond_pack_id': pack_id,
+                }
+                error = self.builder.validate_material(material)
+                if error:
+                    raise ValueError(error)
+                self.pending_materials.append(material)
+
+                self.results['imported'].append({
+                    'row': idx + 2,
+                    'full_code': full_code,
+                    'pack_id': pack_id,
+                    'description': description[:50],
+                    'elevation_mask': encode_elevations(elevation_code)
+                })
+                counts['imported'] += 1
+            except Exception as e:
+                self.results['failed'].append({
+                    'row': idx + 2,
+                    'pack_id': pack_id,
+                    'error': str(e)
+                })
+                counts['failed'] += 1
+        else:
+            # Dry run - just show what would be imported
+            if counts['imported'] < 10:  # Show first 10
+                print(f"  Row {idx+2}: {full_code}")
+                print(f"    Pack: {pack_id}")
+                print(f"    Desc: {description[:60]}")
+            counts['imported'] += 1
+
+    def import_richmond_plan(self, excel_path: Path, plan_code: str = None,
+                           sheet_name: str = None, dry_run: bool = False,
+                           streaming: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                           progress: Optional[ProgressCallback] = None) -> Dict:
+        """Import Richmond plan from Excel
+
+        Args:
+            excel_path: Path to Excel file
+            plan_code: Plan code (e.g., "1670")
+            sheet_name: Sheet name to import (None = auto-detect)
+            dry_run: If True, parse but don't import
+            streaming: Read rows lazily (openpyxl read-only) in chunks instead
+                of loading the whole sheet into a DataFrame
+            chunk_size: Rows per chunk in streaming mode
+            progress: Optional callback(rows_read, rows_estimate) after each chunk
+
+        Returns:
+            Dict with import results
+        """
+        print(f"\n{'='*80}")
+        print(f"IMPORTING RICHMOND PLAN: {plan_code or 'Auto-detect'}")
+        print(f"{'='*80}")
+        print(f"File: {excel_path.name}")
+
+        if not excel_path.exists():
+            return {'error': f"File not found: {excel_path}"}
+
+        # Read Excel file
+        try:
+            if streaming:
+                stream = SheetStream(excel_path)
+                if not sheet_name:
+                    sheet_name = self._find_materials_sheet(stream.sheet_names)
+                    print(f"Using sheet: {sheet_name}")
+                # header=1: skip first empty row
+                stream.open_sheet(sheet_name, header=1)
+                columns = stream.columns
+            elif sheet_name:
+                df = pd.read_excel(excel_path, sheet_name=sheet_name, header=1)
+                columns = df.columns
+            else:
+                # Try to find materials sheet
+                xls = pd.ExcelFile(excel_path)
+                materials_sheet = self._find_materials_sheet(xls.sheet_names)
+
+                print(f"Using sheet: {materials_sheet}")
+                # Use header=1 to skip first empty row
+                df = pd.read_excel(excel_path, sheet_name=materials_sheet, header=1)
+                columns = df.columns
+
+        except Exception as e:
+            return {'error': f"Failed to read Excel: {e}"}
+
+        if streaming:
+            print(f"Streaming ~{stream.rows_estimate} rows in chunks of {chunk_size}")
+        else:
+            print(f"Found {len(df)} rows")
+
+        # Detect columns
+        cols = self._detect_richmond_columns(columns)
+        plan_col = cols['plan']
+
+        error = None
+        if not cols['pack']:
+            error = f"Could not find Pack ID/Location column. Found columns: {list(columns)}"
+        else:
+            print(f"Using columns:")
+            print(f"  Plan: {plan_col}")
+            print(f"  Pack ID/Location: {cols['pack']}")
+            print(f"  Description: {cols['desc']}")
+            print(f"  SKU: {cols['sku']}")
+            print(f"  Quantity: {cols['qty']}")
+
+            # If we have a Plan column, filter to specific plan
+            if plan_col and plan_code:
+                if not streaming:
+                    df = df[df[plan_col] == plan_code]
+                    print(f"\nFiltered to plan {plan_code}: {len(df)} rows")
+            elif plan_col and not plan_code:
+                # Show available plans
+                if streaming:
+                    unique_plans = stream.unique_values(plan_col)
+                else:
+                    unique_plans = df[plan_col].unique()
+                print(f"\nAvailable plans: {', '.join([str(p) for p in unique_plans[:10]])}")
+                if len(unique_plans) > 10:
+                    print(f"... and {len(unique_plans) - 10} more")
+                error = "Multiple plans found. Please specify --plan CODE"
+
+            if not error and not plan_code:
+                error = "Could not detect plan code. Please specify --plan"
+
+        if error:
+            if streaming:
+                stream.close()
+            return {'error': error}
+
+        print(f"\nPlan Code: {plan_code}")
+
+        # Process each row
+        counts = {'imported': 0, 'flagged': 0, 'failed': 0}
+
+        if streaming:
+            total_rows = 0
+            try:
+                for chunk in stream.chunks(chunk_size):
+                    for idx, row in chunk:
+                        # Same filter as df[df[plan_col] == plan_code]
+                        if plan_col and row.get(plan_col) != plan_code:
+                            continue
+                        total_rows += 1
+                        self._process_richmond_row(idx, row, cols, plan_code, dry_run, counts)
+                    if progress:
+                        progress(stream.rows_read, stream.rows_estimate)
+            except Exception as e:
+                return {'error': f"Failed to read Excel: {e}"}
+            finally:
+                stream.close()
+            if plan_col:
+                print(f"\nFiltered to plan {plan_code}: {total_rows} rows")
+        else:
+            for idx, row in df.iterrows():
+                self._process_richmond_row(idx, row, cols, plan_code, dry_run, counts)
+            total_rows = len(df)
+
+        written = None
+        if not dry_run and not self.defer_writes:
+            try:
+                written = self.write_pending_materials(excel_path.name)
+            except Exception as e:
+                return {'error': f"Failed to write materials: {e}"}
+
+        imported, flagged, failed = counts['imported'], counts['flagged'], counts['failed']
+
+        print(f"\n{'='*80}")
+        print(f"IMPORT SUMMARY")
+        print(f"{'='*80}")
+        print(f"  ✅ Imported: {imported}")
+        print(f"  ⚠️  Flagged:  {flagged}")
+        print(f"  ❌ Failed:   {failed}")
+        if written is not None:
+            print(f"  💾 Written:  {written} materials to {self.db_path.name}")
+
+        return {
+            'imported': imported,
+            'flagged': flagged,
+            'failed': failed,
+            'total': total_rows
+        }
+
+    def import_batch(self, paths: List[Path], plan_code: str = None, kind: str = None,
+                     dry_run: bool = False, workers: int = None, streaming: bool = False,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict:
+        """Import many workbooks, parsing them in parallel worker processes
+
+        Each workbook is parsed by import_holt_materials() or
+        import_richmond_plan() in a ProcessPoolExecutor worker, which sends
+        its results, stats and validated materials back instead of writing.
+        This process is the only writer: it keeps one database connection
+        open and writes each workbook in its own transaction, in input order
+        as soon as it and the workbooks before it are parsed, while the other
+        workers keep parsing. That transaction replaces the rows of an
+        earlier import of the same workbook file name (see
+        write_pending_materials()), so monthly re-runs don't duplicate
+        materials; workbooks sharing a file name in one batch are failed
+        instead of written. Results and stats are merged in input order
+        (each entry tagged with its file name).
+
+        Args:
+            paths: Workbooks to import
+            plan_code: Richmond plan code for every workbook (None = from a
+                "Plan_<code>" file name)
+            kind: "holt", "richmond" or None to detect per workbook
+                (Holt workbooks have the indexMaterialListsbyPlan sheet)
+            dry_run: If True, parse but don't import
+            workers: Worker processes (None = one per CPU core)
+            streaming: Stream rows in chunks inside each worker
+            chunk_size: Rows per chunk in streaming mode
+
+        Returns:
+            Dict with totals across workbooks (files, failed_files, imported,
+            flagged, failed, total, written)
+        """
+        print(f"\n{'='*80}")
+        print(f"BATCH IMPORT: {len(paths)} workbooks")
+        print(f"{'='*80}")
+
+        workers = min(workers or os.cpu_count() or 1, max(len(paths), 1))
+        print(f"Workers: {workers}")
+
+        # Rows are replaced by file name, so same-named workbooks would replace each other
+        name_counts = Counter(path.name for path in paths)
+        shared_names = set() if dry_run else {name for name, n in name_counts.items() if n > 1}
+
+        tasks = [
+            {
+                'index': index,
+                'path': path,
+                'db_path': str(self.db_path),
+                'kind': kind,
+                'plan_code': plan_code,
+                'dry_run': dry_run,
+                'streaming': streaming,
+                'chunk_size': chunk_size,
+            }
+            for index, path in enumerate(paths)
+            if path.name not in shared_names
+        ]
+        parsed_files = {}
+        written_files = {}
+        for path in paths:
+            if path.name in shared_names:
+                parsed_files[path] = {'kind': kind, 'result': {
+                    'error': f"{name_counts[path.name]} workbooks in the batch are named {path.name}"
+                }}
+        # Parsed workbooks waiting for the ones before them to be written
+        ready = {}
+        next_index = 0
+
+        if not dry_run:
+            self._connect_writer()
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(_import_workbook, task): task for task in tasks}
+                for future in as_completed(futures):
+                    task = futures[future]
+                    try:
+                        ready[task['index']] = future.result()
+                    except Exception as e:
+                        ready[task['index']] = {'kind': kind, 'result': {'error': f"Worker failed: {e}"}}
+
+                    while next_index < len(paths):
+                        path = paths[next_index]
+                        if path.name in shared_names:
+                            next_index += 1
+                            continue
+                        if next_index not in ready:
+                            break
+                        parsed = ready.pop(next_index)
+                        next_index += 1
+
+                        error = parsed['result'].get('error')
+                        if not error and not dry_run:
+                            try:
+                                written_files[path] = self.builder.add_materials_bulk(
+                                    parsed['materials'], validate=False, replace=True,
+                                    source_file=path.name,
+                                )
+                            except Exception as e:
+                                parsed['result'] = {'error': f"Failed to write materials: {e}"}
+
+                        parsed_files[path] = parsed
+                        status = parsed['result'].get('error') or (
+                            f"{parsed['result']['imported']} imported, {parsed['result']['flagged']} flagged"
+                        )
+                        print(f"  [{len(parsed_files)}/{len(paths)}] {path.name} ({parsed['kind']}): {status}",
+                              flush=True)
+        finally:
+            if not dry_run:
+                self.builder.close()
+
+        totals = {'files': len(paths), 'failed_files': 0, 'imported': 0, 'flagged': 0,
+                  'failed': 0, 'total': 0, 'written': sum(written_files.values())}
+
+        for path in paths:
+            parsed = parsed_files[path]
+            result = parsed['result']
+            self.batch_files.append({
+                'file': path.name,
+                'kind': parsed['kind'],
+                'written': written_files.get(path),
+                **result,
+            })
+            if result.get('error'):
+                totals['failed_files'] += 1
+                continue
+
+            for key, items in parsed['results'].items():
+                self.results[key].extend({'file': path.name, **item} for item in items)
+            for key, value in parsed['stats'].items():
+                self.stats[key] += value
+            for key in ('imported', 'flagged', 'failed', 'total'):
+                totals[key] += result[key]
+
+        print(f"\n{'='*80}")
+        print(f"BATCH SUMMARY")
+        print(f"{'='*80}")
+        print(f"  📚 Workbooks:  {totals['files']} ({totals['failed_files']} failed)")
+        print(f"  ✅ Imported:   {totals['imported']}")
+        print(f"  ⚠️  Flagged:    {totals['flagged']}")
+        print(f"  ❌ Failed:     {totals['failed']}")
+        if not dry_run:
+            print(f"  💾 Written:    {totals['written']} codes to {self.db_path.name}")
+
+        return totals
+
+    def _connect_writer(self):
+        """Open the builder connection, creating the schema if the database has none"""
+        self.builder.connect()
+        has_schema = self.builder.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'materials'"
+        ).fetchone()
+        if not has_schema:
+            self.builder.create_schema()
+
+    def write_pending_materials(self, source_file: str, chunk_size: int = BULK_CHUNK_SIZE) -> int:
+        """Write the materials buffered by an import in one transaction
+
+        Materials were already checked with validate_material() while rows
+        were parsed, so the batch is written without a second validation
+        pass. Rows imported earlier from the same workbook (for the same
+        plans) are replaced, so re-running an import does not duplicate
+        them. Creates the schema if the database has no materials table.
+
+        Args:
+            source_file: Workbook file name the materials were parsed from
+            chunk_size: Rows per executemany() call
+
+        Returns:
+            Number of materials written
+        """
+        if not self.pending_materials:
+            return 0
+
+        self._connect_writer()
+        try:
+            written = self.builder.add_materials_bulk(
+                self.pending_materials, chunk_size=chunk_size, validate=False, replace=True,
+                source_file=source_file,
+            )
+        finally:
+            self.builder.close()
+
+        self.pending_materials = []
+        return written
+
+    @staticmethod
+    def _report_location(item: Dict) -> str:
+        """Row label for a report entry, prefixed with the workbook name in batch imports"""
+        if 'file' in item:
+            return f"{item['file']} row {item['row']}"
+        return f"Row {item['row']}"
+
+    def generate_report(self, output_path: Path = None):
+        """Generate validation report
+
+        Args:
+            output_path: Where to save report (None = print to console)
+        """
+        report = []
+        report.append("=" * 80)
+        report.append("BAT IMPORT VALIDATION REPORT")
+        report.append("=" * 80)
+        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        report.append("")
+
+        # Summary
+        report.append("SUMMARY")
+        report.append("-" * 80)
+        report.append(f"  ✅ Successfully Imported: {len(self.results['imported'])}")
+        report.append(f"  ⚠️  Flagged for Review:   {len(self.results['flagged'])}")
+        report.append(f"  ❌ Failed to Import:     {len(self.results['failed'])}")
+        report.append("")
+
+        # Per-workbook results (batch imports)
+        if self.batch_files:
+            report.append("WORKBOOKS")
+            report.append("-" * 80)
+            for item in self.batch_files:
+                if item.get('error'):
+                    status = f"❌ {item['error']}"
+                else:
+                    status = f"{item['imported']} imported, {item['flagged']} flagged, {item['failed']} failed"
+                report.append(f"  {item['file']} ({item['kind'] or 'unknown'}): {status}")
+            report.append("")
+
+        # Flagged items
+        if self.results['flagged']:
+            report.append("ITEMS NEEDING REVIEW")
+            report.append("-" * 80)
+            for item in self.results['flagged'][:20]:  # Show first 20
+                report.append(f"\n{self._report_location(item)}: {item['pack_id']}")
+                report.append(f"  Description: {item['description'][:70]}")
+                report.append(f"  Issue: {item['issue']}")
+
+            if len(self.results['flagged']) > 20:
+                report.append(f"\n... and {len(self.results['flagged']) - 20} more")
+            report.append("")
+
+        # Failed items
+        if self.results['failed']:
+            report.append("FAILED IMPORTS")
+            report.append("-" * 80)
+            for item in self.results['failed'][:10]:  # Show first 10
+                report.append(f"\n{self._report_location(item)}: {item['pack_id']}")
+                report.append(f"  Error: {item['error']}")
+            report.append("")
+
+        # Richmond imports rolled up by elevation (a "**" or "BCD" code counts under each letter)
+        elevation_masks = Counter(
+            item['elevation_mask'] for item in self.results['imported'] if 'elevation_mask' in item
+        )
+        if elevation_masks:
+            report.append("IMPORTED CODES BY ELEVATION")
+            report.append("-" * 80)
+            for letter, count in count_by_elevation(elevation_masks.items()).items():
+                report.append(f"  Elevation {letter}: {count}")
+            report.append("")
+
+        # Sample successful imports
+        if self.results['imported']:
+            report.append("SAMPLE SUCCESSFUL IMPORTS (first 10)")
+            report.append("-" * 80)
+            for item in self.results['imported'][:10]:
+                report.append(f"{self._report_location(item)}: {item['full_code']}")
+                report.append(f"  Pack: {item['pack_id']}")
+                report.append(f"  Desc: {item['description']}")
+                report.append("")
+
+        report_text = "\n".join(report)
+
+        if output_path:
+            output_path.write_text(report_text)
+            print(f"\n✅ Report saved to: {output_path}")
+        else:
+            print("\n" + report_text)
+
+
+def find_workbooks(directory: Path = None, pattern: str = None) -> List[Path]:
+    """Excel workbooks in a directory and/or matching a glob pattern
+
+    Args:
+        directory: Directory whose *.xlsx / *.xlsm files are imported
+        pattern: Glob pattern (e.g. "plans/**/*.xlsx", recursive)
+
+    Returns:
+        Sorted unique paths, without Excel lock files (~$...)
+    """
+    paths = set()
+    if directory:
+        for extension in ("*.xlsx", "*.xlsm"):
+            paths.update(Path(directory).glob(extension))
+    if pattern:
+        paths.update(Path(match) for match in glob.glob(pattern, recursive=True))
+    return sorted(path for path in paths if path.is_file() and not path.name.startswith("~$"))
+
+
+def _plan_code_from_filename(path: Path) -> Optional[str]:
+    """Plan code from a "Plan_1670.xlsx" / "plan-G18L ..." file name
+
+    "Plan" must start a word and be followed by a separator, so names like
+    "Richmond Plans" or "Planning" give None rather than a wrong code.
+    """
+    match = PLAN_FILENAME.search(path.stem)
+    return match.group(1) if match else None
+
+
+def _workbook_kind(path: Path) -> str:
+    """Workbook type: holt if it has the Holt materials sheet, else richmond"""
+    stream = SheetStream(path)
+    try:
+        return 'holt' if HOLT_SHEET_NAME in stream.sheet_names else 'richmond'
+    finally:
+        stream.close()
+
+
+def _import_workbook(task: Dict) -> Dict:
+    """Parse one workbook in an import_batch() worker process
+
+    Nothing is written here: the validated materials go back to the writer
+    with the results and stats. Console output is captured to keep the
+    parent's progress readable.
+    """
+    path = task['path']
+    importer = BATAutoImporter(task['db_path'], defer_writes=True)
+    options = {
+        'dry_run': task['dry_run'],
+        'streaming': task['streaming'],
+        'chunk_size': task['chunk_size'],
+    }
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            kind = task['kind'] or _workbook_kind(path)
+        except Exception as e:
+            return {'kind': None, 'result': {'error': f"Failed to read Excel: {e}"}}
+
+        if kind == 'holt':
+            result = importer.import_holt_materials(path, **options)
+        else:
+            plan_code = task['plan_code'] or _plan_code_from_filename(path)
+            if not plan_code:
+                return {'kind': kind, 'result': {
+                    'error': "No plan code in file name (expected e.g. Plan_G18L.xlsx); use --plan"
+                }}
+            result = importer.import_richmond_plan(path, plan_code=plan_code, **options)
+
+    return {
+        'kind': kind,
+        'result': result,
+        'results': importer.results,
+        'stats': importer.stats,
+        'materials': importer.pending_materials,
+    }
+
+
+def main():
+    """Main entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Automated BAT Import Tool")
+    parser.add_argument('--plan', help="Plan code (e.g., 1670)")
+    parser.add_argument('--richmond', action='store_true', help="Import Richmond files")
+    parser.add_argument('--holt', action='store_true', help="Import Holt files")
+    parser.add_argument('--file', type=Path, help="Specific Excel file to import")
+    parser.add_argument('--dry-run', action='store_true', help="Parse but don't import")
+    parser.add_argument('--report', type=Path, help="Save report to file")
+    parser.add_argument('--stream', action='store_true',
+                        help="Stream rows in chunks (openpyxl read-only) for large workbooks")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Rows per chunk with --stream (default {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument('--dir', type=Path, help="Import every workbook in a directory (batch mode)")
+    parser.add_argument('--glob', help='Import workbooks matching a glob, e.g. "plans/**/*.xlsx" (batch mode)')
+    parser.add_argument('--workers', type=int,
+                        help="Worker processes for batch mode (default: one per CPU core)")
+    parser.add_argument('--version', action='version', version=f'%(prog)s {__version__}')
+
+    args = parser.parse_args()
+
+    # Create importer
+    importer = BATAutoImporter()
+
+    def show_progress(rows_read, rows_estimate):
+        total = f"/~{rows_estimate}" if rows_estimate else ""
+        print(f"  ... {rows_read}{total} rows", flush=True)
+
+    stream_options = {
+        'streaming': args.stream,
+        'chunk_size': args.chunk_size,
+        'progress': show_progress if args.stream else None,
+    }
+
+    # Batch mode: many workbooks parsed in parallel, one writer
+    if args.dir or args.glob:
+        paths = find_workbooks(args.dir, args.glob)
+        if not paths:
+            print("❌ Error: No workbooks found")
+            sys.exit(1)
+
+        kind = 'holt' if args.holt else 'richmond' if args.richmond else None
+        result = importer.import_batch(
+            paths,
+            plan_code=args.plan,
+            kind=kind,
+            dry_run=args.dry_run,
+            workers=args.workers,
+            streaming=args.stream,
+            chunk_size=args.chunk_size
+        )
+
+        # Generate report
+        importer.generate_report(args.report)
+
+        if result['failed_files']:
+            sys.exit(1)
+
+    # Holt import mode
+    elif args.holt and args.file:
+        result = importer.import_holt_materials(
+            args.file,
+            dry_run=args.dry_run,
+            **stream_options
+        )
+
+        if result.get('error'):
+            print(f"❌ Error: {result['error']}")
+            sys.exit(1)
+
+        # Generate report
+        importer.generate_report(args.report)
+
+    # Richmond import mode
+    elif args.file:
+        result = importer.import_richmond_plan(
+            args.file,
+            plan_code=args.plan,
+            dry_run=args.dry_run,
+            **stream_options
+        )
+
+        if result.get('error'):
+            print(f"❌ Error: {result['error']}")
+            sys.exit(1)
+
+        # Generate report
+        importer.generate_report(args.report)
+
+    else:
+        print("BAT Auto Import Tool")
+        print(f"Version: {__version__}")
+        print("\nUsage:")
+        print("  Richmond:")
+        print("    --file FILE --plan G18L --dry-run    # Test import Richmond plan")
+        print("    --file FILE --plan G18L               # Import Richmond plan G18L")
+        print("\n  Holt:")
+        print("    --holt --file FILE --dry-run          # Test import Holt materials")
+        print("    --holt --file FILE                    # Import all Holt materials")
+        print("\n  Large workbooks:")
+        print("    --stream [--chunk-size 5000]          # Stream rows in chunks (low memory)")
+        print("\n  Batch (Holt/Richmond detected per workbook):")
+        print("    --dir DIR [--workers 4] [--dry-run]   # Every workbook in a directory")
+        print('    --glob "plans/**/*.xlsx"              # Workbooks matching a pattern')
+        print("\nExamples:")
+        print('  python auto_import_bat.py --file "RAH_MaterialDatabase.xlsx" --plan G18L --dry-run')
+        print('  python auto_import_bat.py --holt --file "indexMaterialListbyPlanHolt20251114.xlsx" --dry-run')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+BAT Import Benchmarks
+Times the import hot paths and checks that the fast paths give identical results
+
+Version: 1.1.0
+Author: Corey Dev Framework
+"""
+
+import contextlib
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+from auto_import_bat import HOLT_SHEET_NAME, BATAutoImporter, find_workbooks
+from bat_coding_system_builder import SQLITE_PROFILES, BATCodingSystemBuilder
+
+__version__ = "1.1.0"
+
+# Code shapes seen in Holt workbooks (plus malformed ones that must be flagged)
+HOLT_CODE_SHAPES = [
+    "{plan}{phase}{elev} - {item}",          # standard 9-char main code
+    "{plan}{phase}{elev}",                   # no separator -> item 9000
+    "{plan}{phase}{elev} - {item} - {item}", # duplicated separator
+    "{plan3}{phase}{elev} - {item}",         # 8-char main code (plan padded)
+    "{plan3}e{phase}{elev}0 - {item}",       # 10-char alphanumeric plan
+    "{plan}{phase} - {item}",                # too short -> error
+    "{plan}{phase}{elev}  -  {item}",        # odd spacing
+    "{plan}{phase}{elev} - ",                # empty item type
+]
+
+
+def _random_holt_code(rng: random.Random) -> str:
+    """One code in a random HOLT_CODE_SHAPES shape"""
+    return rng.choice(HOLT_CODE_SHAPES).format(
+        plan=rng.choice(["1670", "2336", "169e", "G18L"]),
+        plan3=rng.choice(["167", "233", "169"]),
+        phase=f"{rng.randint(10, 999):03d}",
+        elev=rng.choice(["00", "01", "02", "03", "04"]),
+        item=rng.choice(["4085", "1000", "2100", "9000"]),
+    )
+
+
+def generate_holt_codes(total_codes: int, distinct: int = 5000, seed: int = 42) -> pd.Series:
+    """Build an Option/Phase Number column holding about total_codes codes
+
+    Rows hold 1-4 comma-separated codes drawn from a pool of distinct codes
+    (Holt sheets repeat each option/phase code across many materials);
+    distinct=0 makes every code random. A few rows are blank.
+    """
+    rng = random.Random(seed)
+    pool = [_random_holt_code(rng) for _ in range(distinct)]
+
+    values = []
+    codes = 0
+    while codes < total_codes:
+        if rng.random() < 0.02:
+            values.append(None)
+            continue
+
+        row_codes = [
+            rng.choice(pool) if pool else _random_holt_code(rng)
+            for _ in range(rng.choice([1, 1, 1, 2, 3, 4]))
+        ]
+        codes += len(row_codes)
+        values.append(", ".join(row_codes))
+    return pd.Series(values, name="Option/Phase Number")
+
+
+def parse_per_row(importer: BATAutoImporter, values: pd.Series) -> List[Tuple[int, str, Dict]]:
+    """Row-by-row path: split each cell and call parse_holt_code() per code"""
+    parsed = []
+    for idx, value in values.items():
+        option_phase_str = str(value)
+        if pd.isna(value) or option_phase_str == 'nan':
+            continue
+        for code_str in [c.strip() for c in option_phase_str.split(',')]:
+            parsed.append((idx, code_str, importer.parse_holt_code(code_str)))
+    return parsed
+
+
+def as_row_results(frame: pd.DataFrame) -> List[Tuple[int, str, Dict]]:
+    """parse_holt_codes() output in the parse_per_row() (row, code, dict) shape"""
+    parsed = []
+    for idx, record in zip(frame.index, frame.to_dict('records')):
+        code_str = record.pop('code')
+        if record['error'] is not None:
+            record = {'error': record['error']}
+        parsed.append((idx, code_str, record))
+    return parsed
+
+
+def benchmark_parser(codes: int, repeat: int, excel_file: Path = None, distinct: int = 5000) -> bool:
+    """Time per-row vs vectorized column Holt code parsing and compare the results
+
+    Returns:
+        True if both paths produced identical results
+    """
+    importer = BATAutoImporter()
+
+    if excel_file:
+        df = pd.read_excel(excel_file, sheet_name=HOLT_SHEET_NAME)
+        column = importer._detect_holt_columns(df.columns)['option']
+        values = df[column]
+        print(f"Source: {excel_file.name} ({len(values)} rows)")
+    else:
+        values = generate_holt_codes(codes, distinct)
+        print(f"Source: generated ({len(values)} rows, pool of {distinct or 'all-random'} codes)")
+
+    timings = {}
+    results = {}
+    paths = [
+        ("per-row", lambda: parse_per_row(importer, values)),
+        ("vectorized", lambda: importer.parse_holt_codes(values)),
+    ]
+    for name, parse in paths:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results[name] = parse()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        timings[name] = best
+
+    results["vectorized"] = as_row_results(results["vectorized"])
+    total = len(results["per-row"])
+    errors = sum(1 for _, _, parsed in results["per-row"] if parsed.get('error'))
+    identical = results["per-row"] == results["vectorized"]
+
+    print(f"Codes parsed: {total} ({errors} flagged)")
+    print(f"\n{'Path':<12} {'Best time':>10} {'Codes/sec':>12}")
+    for name, elapsed in timings.items():
+        print(f"{name:<12} {elapsed:>9.3f}s {total / elapsed:>12,.0f}")
+    print(f"\nSpeedup: {timings['per-row'] / timings['vectorized']:.1f}x")
+    print(f"Identical results: {'✅ yes' if identical else '❌ NO'}")
+
+    if not identical:
+        for expected, actual in zip(results["per-row"], results["vectorized"]):
+            if expected != actual:
+                print(f"  First difference:\n    per-row:    {expected}\n    vectorized: {actual}")
+                break
+
+    return identical
+
+
+def _generate_materials(count: int, seed: int = 42) -> List[Dict]:
+    """Material dicts spread over a few plans, phases and elevations"""
+    rng = random.Random(seed)
+    return [
+        {
+            'plan_code': rng.choice(["1670", "2336", "G18L", "G603"]),
+            'phase_code': f"{rng.randint(9, 90):03d}.{rng.choice(['000', '820', '100'])}",
+            'elevation_code': rng.choice(["**", "A", "B", "BCD", "CD"]),
+            'item_type_code': rng.choice(["1000", "2000", "2100", "4085"]),
+            'vendor_sku': f"SKU{i:06d}",
+            'description': f"Material {i}",
+            'quantity': rng.randint(1, 50),
+        }
+        for i in range(count)
+    ]
+
+
+def _timed(action) -> float:
+    """Seconds taken by action() with its console output suppressed"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        action()
+        return time.perf_counter() - start
+
+
+def benchmark_sqlite(rows: int, single_rows: int, queries: int) -> Dict[str, Dict[str, float]]:
+    """Time import and query workloads on a fresh database for each SQLite profile
+
+    Workloads:
+        add_material: single_rows inserts, one commit each (menu / old import path)
+        bulk insert:  rows inserts through add_materials_bulk (one transaction)
+        queries:      queries plan/elevation lookups over the loaded materials
+
+    Returns:
+        {profile: {workload: seconds}}
+    """
+    materials = _generate_materials(rows)
+    lookups = [(m['plan_code'], m['elevation_code'][-1]) for m in materials[:queries]]
+    timings = {}
+
+    for profile in SQLITE_PROFILES:
+        with tempfile.TemporaryDirectory() as tmp:
+            builder = BATCodingSystemBuilder(Path(tmp) / "bat_unified.db", profile=profile)
+            _timed(builder.connect)
+            _timed(builder.create_schema)
+
+            timings[profile] = {
+                'add_material': _timed(lambda: [builder.add_material(**m) for m in materials[:single_rows]]),
+                'bulk insert': _timed(lambda: builder.add_materials_bulk(materials)),
+                'queries': _timed(lambda: [
+                    builder.get_materials_by_elevation(plan, elevation) for plan, elevation in lookups
+                ]),
+            }
+            _timed(builder.close)
+
+    return timings
+
+
+def write_holt_workbook(path: Path, total_codes: int, seed: int = 42):
+    """Holt workbook whose Option/Phase column holds about total_codes generated codes"""
+    from openpyxl import Workbook
+
+    rng = random.Random(seed)
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(HOLT_SHEET_NAME)
+    sheet.append(["Option/Phase Number", "Pack ID", "Description", "Sku", "Qty"])
+    for i, value in enumerate(generate_holt_codes(total_codes, seed=seed)):
+        sheet.append([value, f"P{i % 40}", f"Material {i}", f"SKU{i:06d}", rng.randint(1, 50)])
+    workbook.save(path)
+
+
+def benchmark_batch(files: int, codes: int, worker_counts: List[int]) -> Dict[int, float]:
+    """Time import_batch() (dry run) over copies of a generated Holt workbook
+
+    Returns:
+        {workers: seconds}
+    """
+    timings = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "holt_0.xlsx"
+        write_holt_workbook(source, codes)
+        for i in range(1, files):
+            shutil.copy(source, Path(tmp) / f"holt_{i}.xlsx")
+        paths = find_workbooks(Path(tmp))
+
+        for workers in worker_counts:
+            importer = BATAutoImporter(db_path=Path(tmp) / "bat_unified.db")
+            timings[workers] = _timed(lambda: importer.import_batch(paths, dry_run=True, workers=workers))
+    return timings
+
+
+def main():
+    """Main entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="BAT import benchmarks")
+    parser.add_argument('--version', action='version', version=f'%(prog)s {__version__}')
+    subparsers = parser.add_subparsers(dest='command')
+
+    parser_bench = subparsers.add_parser('parser', help="Holt code parser: per-row vs vectorized")
+    parser_bench.add_argument('--codes', type=int, default=100_000,
+                              help="Number of generated codes (default 100000)")
+    parser_bench.add_argument('--file', type=Path, help="Use a Holt workbook instead of generated codes")
+    parser_bench.add_argument('--distinct', type=int, default=5000,
+                              help="Distinct codes in the generated pool (0 = every code random)")
+    parser_bench.add_argument('--repeat', type=int, default=3, help="Runs per path, best time kept")
+
+    parser_sqlite = subparsers.add_parser('sqlite', help="bat_unified.db: SQLite profiles compared")
+    parser_sqlite.add_argument('--rows', type=int, default=50_000, help="Materials bulk inserted (default 50000)")
+    parser_sqlite.add_argument('--single-rows', type=int, default=2000,
+                               help="Materials inserted one commit at a time (default 2000)")
+    parser_sqlite.add_argument('--queries', type=int, default=200, help="Plan/elevation queries (default 200)")
+
+    parser_batch = subparsers.add_parser('batch', help="Batch import throughput by worker count")
+    parser_batch.add_argument('--files', type=int, default=8, help="Workbooks to import (default 8)")
+    parser_batch.add_argument('--codes', type=int, default=20_000, help="Codes per workbook (default 20000)")
+    parser_batch.add_argument('--workers', default=None,
+                              help="Comma-separated worker counts (default 1,2,4,... up to the CPU count)")
+
+    args = parser.parse_args()
+
+    if args.command == 'parser':
+        print(f"\n{'='*80}")
+        print("HOLT CODE PARSER BENCHMARK")
+        print(f"{'='*80}")
+        identical = benchmark_parser(args.codes, args.repeat, args.file, args.distinct)
+        sys.exit(0 if identical else 1)
+
+    if args.command == 'sqlite':
+        print(f"\n{'='*80}")
+        print("SQLITE PROFILE BENCHMARK")
+        print(f"{'='*80}")
+        timings = benchmark_sqlite(args.rows, args.single_rows, args.queries)
+        baseline, fast = timings['legacy'], timings['performance']
+
+        print(f"{'Workload':<14} {'legacy':>10} {'performance':>12} {'Speedup':>9}")
+        for workload in baseline:
+            print(f"{workload:<14} {baseline[workload]:>9.3f}s {fast[workload]:>11.3f}s "
+                  f"{baseline[workload] / fast[workload]:>8.1f}x")
+        print(f"\n(add_material: {args.single_rows} rows, bulk insert: {args.rows} rows, "
+              f"queries: {args.queries})")
+        return
+
+    if args.command == 'batch':
+        print(f"\n{'='*80}")
+        print("BATCH IMPORT BENCHMARK")
+        print(f"{'='*80}")
+        if args.workers:
+            worker_counts = [int(count) for count in args.workers.split(',')]
+        else:
+            cores = os.cpu_count() or 1
+            worker_counts = sorted({min(1 << i, cores) for i in range(cores.bit_length() + 1)})
+        timings = benchmark_batch(args.files, args.codes, worker_counts)
+
+        print(f"{args.files} workbooks x ~{args.codes} codes, dry run, {os.cpu_count()} CPU cores\n")
+        print(f"{'Workers':>8} {'Time':>10} {'Files/sec':>10} {'Speedup':>9}")
+        for workers, elapsed in timings.items():
+            print(f"{workers:>8} {elapsed:>9.2f}s {args.files / elapsed:>10.2f} "
+                  f"{timings[worker_counts[0]] / elapsed:>8.1f}x")
+        return
+
+    parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""Make the tools and the BAT coding system builder importable from the tests"""
+
+import sys
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent
+BUILDER_DIR = TOOLS_DIR.parent / "docs" / "Migration Strategy" / "bat_coding_system_builder"
+
+for path in (TOOLS_DIR, BUILDER_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
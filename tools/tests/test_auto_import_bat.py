@@ -0,0 +1,143 @@
+"""Holt code parsing and batch helpers in auto_import_bat.py"""
+
+import contextlib
+import io
+import shutil
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from auto_import_bat import BATAutoImporter, _plan_code_from_filename
+from benchmark_bat_import import write_holt_workbook
+
+
+@pytest.fixture
+def importer(tmp_path):
+    return BATAutoImporter(db_path=str(tmp_path / "bat_unified.db"))
+
+
+def parse_per_row(importer, values):
+    """Reference: split each cell and call parse_holt_code() per code"""
+    parsed = []
+    for idx, value in values.items():
+        if pd.isna(value) or str(value) == 'nan':
+            continue
+        for code_str in [c.strip() for c in str(value).split(',')]:
+            parsed.append((idx, code_str, importer.parse_holt_code(code_str)))
+    return parsed
+
+
+def as_row_results(frame):
+    parsed = []
+    for idx, record in zip(frame.index, frame.to_dict('records')):
+        code_str = record.pop('code')
+        if record['error'] is not None:
+            record = {'error': record['error']}
+        parsed.append((idx, code_str, record))
+    return parsed
+
+
+@pytest.mark.parametrize("values", [
+    [],
+    [np.nan, 'nan'],
+    ["167010100 - 4085", "167010100 - 4085, 167020070"],
+    ["233619505 - 4085 - 4085", "16701010", "169e103000 - ", "1670101", "1234567890123,"],
+    [167020070, np.nan, 167010100.0],
+])
+def test_parse_holt_codes_matches_parse_holt_code(importer, values):
+    series = pd.Series(values, index=range(10, 10 + len(values)), dtype=object)
+    assert as_row_results(importer.parse_holt_codes(series)) == parse_per_row(importer, series)
+
+
+def test_parse_holt_codes_fields(importer):
+    frame = importer.parse_holt_codes(pd.Series(["167010100 - 4085, 16701010", "12"]))
+
+    assert frame.index.tolist() == [0, 0, 1]
+    assert frame.iloc[0].to_dict() == {
+        'code': "167010100 - 4085",
+        'plan': "1670",
+        'phase': "101",
+        'elevation': "00",
+        'item_type': "4085",
+        'full_code': "1670-101.000-00-4085",
+        'error': None,
+    }
+    assert frame.iloc[1]['full_code'] == "0167-010.000-10-9000"
+    assert frame.iloc[2]['plan'] is None
+    assert frame.iloc[2]['error'] == "Main code should be 8-10 characters, got 2: 12"
+
+
+def test_parse_holt_code_returns_a_new_dict(importer):
+    first = importer.parse_holt_code("167010100 - 4085")
+    first['plan'] = "XXXX"
+    assert importer.parse_holt_code("167010100 - 4085")['plan'] == "1670"
+
+
+@pytest.mark.parametrize("name, plan_code", [
+    ("Plan_G18L.xlsx", "G18L"),
+    ("plan-1670.xlsx", "1670"),
+    ("Richmond plan-1670 v2.xlsx", "1670"),
+    ("2024_PLAN 2336.xlsm", "2336"),
+    ("Richmond Plans.xlsx", None),
+    ("Planning 1670.xlsx", None),
+    ("Floorplan_1670.xlsx", None),
+    ("Plan.xlsx", None),
+])
+def test_plan_code_from_filename(name, plan_code):
+    assert _plan_code_from_filename(Path(name)) == plan_code
+
+
+@pytest.fixture
+def holt_workbooks(tmp_path):
+    source = tmp_path / "source.xlsx"
+    write_holt_workbook(source, 300, seed=1)
+    paths = []
+    for name in ("holt_a.xlsx", "holt_b.xlsx", "holt_c.xlsx"):
+        shutil.copy(source, tmp_path / name)
+        paths.append(tmp_path / name)
+    return paths
+
+
+def run_batch(db_path, paths):
+    importer = BATAutoImporter(db_path=str(db_path))
+    with contextlib.redirect_stdout(io.StringIO()):
+        totals = importer.import_batch(paths, workers=2)
+    return importer, totals
+
+
+def material_rows(db_path):
+    with contextlib.closing(sqlite3.connect(db_path)) as conn:
+        return conn.execute(
+            "SELECT material_id, source_file, holt_item_number FROM materials ORDER BY material_id"
+        ).fetchall()
+
+
+def test_batch_rerun_is_deterministic(tmp_path, holt_workbooks):
+    db_path = tmp_path / "bat_unified.db"
+    _, first = run_batch(db_path, holt_workbooks)
+    rows_after_first = material_rows(db_path)
+    _, second = run_batch(db_path, holt_workbooks)
+    rows_after_second = material_rows(db_path)
+
+    assert first['written'] == second['written'] == len(rows_after_first) > 0
+    # Written in input order: each workbook's rows follow the previous workbook's
+    sources = [source for _, source, _ in rows_after_second]
+    assert sources == sorted(sources)
+    assert [row[1:] for row in rows_after_second] == [row[1:] for row in rows_after_first]
+
+
+def test_batch_fails_workbooks_sharing_a_file_name(tmp_path, holt_workbooks):
+    duplicate = tmp_path / "other" / holt_workbooks[0].name
+    duplicate.parent.mkdir()
+    shutil.copy(holt_workbooks[0], duplicate)
+    db_path = tmp_path / "bat_unified.db"
+
+    importer, totals = run_batch(db_path, holt_workbooks + [duplicate])
+
+    assert totals['failed_files'] == 2
+    assert {row[1] for row in material_rows(db_path)} == {"holt_b.xlsx", "holt_c.xlsx"}
+    errors = [entry['error'] for entry in importer.batch_files if entry.get('error')]
+    assert errors == ["2 workbooks in the batch are named holt_a.xlsx"] * 2
@@ -0,0 +1,115 @@
+"""add_materials_bulk() replace semantics in the SQLite builder"""
+
+import sqlite3
+
+import pytest
+
+from bat_coding_system_builder import BATCodingSystemBuilder
+
+
+def material(plan="1670", pack="|10.82", sku="SKU-1", **extra):
+    return {
+        'plan_code': plan,
+        'phase_code': "010.820",
+        'elevation_code': "A",
+        'item_type_code': "1000",
+        'vendor_sku': sku,
+        'richmond_pack_id': pack,
+        **extra,
+    }
+
+
+@pytest.fixture
+def builder(tmp_path):
+    builder = BATCodingSystemBuilder(str(tmp_path / "bat_unified.db"))
+    builder.connect()
+    builder.create_schema()
+    yield builder
+    builder.close()
+
+
+def rows(builder):
+    return builder.conn.execute(
+        "SELECT source_file, plan_code, richmond_pack_id, vendor_sku FROM materials "
+        "ORDER BY source_file, plan_code, vendor_sku"
+    ).fetchall()
+
+
+def test_reimport_replaces_the_same_workbook(builder):
+    builder.add_materials_bulk([material(sku="OLD")], replace=True, source_file="Plan_1670.xlsx")
+    builder.add_materials_bulk([material(sku="NEW")], replace=True, source_file="Plan_1670.xlsx")
+
+    assert rows(builder) == [("Plan_1670.xlsx", "1670", "|10.82", "NEW")]
+
+
+def test_workbooks_sharing_a_key_do_not_replace_each_other(builder):
+    builder.add_materials_bulk([material(sku="A")], replace=True, source_file="a.xlsx")
+    builder.add_materials_bulk([material(sku="B")], replace=True, source_file="b.xlsx")
+    builder.add_materials_bulk([material(sku="A2")], replace=True, source_file="a.xlsx")
+
+    assert rows(builder) == [
+        ("a.xlsx", "1670", "|10.82", "A2"),
+        ("b.xlsx", "1670", "|10.82", "B"),
+    ]
+
+
+def test_replace_is_limited_to_the_incoming_plans(builder):
+    workbook = "Richmond.xlsx"
+    builder.add_materials_bulk([material(plan="1670", sku="X")], replace=True, source_file=workbook)
+    builder.add_materials_bulk([material(plan="G18L", sku="Y")], replace=True, source_file=workbook)
+    builder.add_materials_bulk([material(plan="1670", sku="X2")], replace=True, source_file=workbook)
+
+    assert rows(builder) == [(workbook, "1670", "|10.82", "X2"), (workbook, "G18L", "|10.82", "Y")]
+
+
+def test_legacy_rows_without_source_are_replaced_by_key(builder):
+    builder.add_materials_bulk([
+        material(sku="LEGACY"),
+        material(pack="|99.00", sku="OTHER"),
+        material(pack=None, sku="HOLT", holt_item_number="167010100 - 4085"),
+    ])
+    builder.add_materials_bulk([
+        material(sku="NEW"),
+        material(pack=None, sku="HOLT2", holt_item_number="167010100 - 4085"),
+    ], replace=True, source_file="Plan_1670.xlsx")
+
+    assert rows(builder) == [
+        (None, "1670", "|99.00", "OTHER"),
+        ("Plan_1670.xlsx", "1670", None, "HOLT2"),
+        ("Plan_1670.xlsx", "1670", "|10.82", "NEW"),
+    ]
+
+
+def test_replace_requires_a_source_file(builder):
+    with pytest.raises(ValueError, match="source_file"):
+        builder.add_materials_bulk([material()], replace=True)
+    assert rows(builder) == []
+
+
+def test_connect_adds_source_file_to_older_databases(tmp_path):
+    db_path = tmp_path / "old.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE materials (
+            material_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            plan_code TEXT NOT NULL, phase_code TEXT NOT NULL,
+            elevation_code TEXT NOT NULL, item_type_code TEXT NOT NULL,
+            vendor_sku TEXT, description TEXT, quantity REAL, unit TEXT,
+            richmond_pack_id TEXT, richmond_option_code TEXT,
+            holt_item_number TEXT, holt_activity TEXT, holt_community TEXT, notes TEXT
+        )
+    """)
+    conn.execute(
+        "INSERT INTO materials (plan_code, phase_code, elevation_code, item_type_code, "
+        "vendor_sku, richmond_pack_id) VALUES ('1670', '010.820', 'A', '1000', 'OLD', '|10.82')"
+    )
+    conn.commit()
+    conn.close()
+
+    builder = BATCodingSystemBuilder(str(db_path))
+    builder.connect()
+    try:
+        builder.add_materials_bulk([material(sku="NEW")], replace=True, source_file="Plan_1670.xlsx")
+        assert rows(builder) == [("Plan_1670.xlsx", "1670", "|10.82", "NEW")]
+    finally:
+        builder.close()
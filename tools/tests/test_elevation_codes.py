@@ -0,0 +1,72 @@
+"""Elevation bitmasks: Python encode/decode vs the SQLite elevation_mask_sql() column"""
+
+import sqlite3
+
+import pytest
+
+from elevation_codes import (
+    ALL_ELEVATIONS,
+    applies_to_elevation,
+    count_by_elevation,
+    decode_elevations,
+    elevation_mask_sql,
+    encode_elevations,
+)
+
+CODES = ["A", "BCD", "B, C, D", "bcd", "DCB", "**", "00", "", "A-Z", "Z", "abcdefghijklmnopqrstuvwxyz",
+         "*", "***", "é", "B/é"]
+
+
+@pytest.fixture(scope="module")
+def conn():
+    conn = sqlite3.connect(":memory:")
+    yield conn
+    conn.close()
+
+
+def sql_mask(conn, code):
+    return conn.execute(
+        f"SELECT {elevation_mask_sql()} FROM (SELECT ? AS elevation_code)", (code,)
+    ).fetchone()[0]
+
+
+@pytest.mark.parametrize("code", CODES)
+def test_sql_matches_python(conn, code):
+    assert sql_mask(conn, code) == encode_elevations(code)
+
+
+@pytest.mark.parametrize("code, mask", [
+    ("BCD", 14),
+    ("B, C, D", 14),
+    ("**", ALL_ELEVATIONS),
+    ("00", 0),
+    (None, 0),
+])
+def test_encode(code, mask):
+    assert encode_elevations(code) == mask
+
+
+@pytest.mark.parametrize("mask", [0, 1, 14, 2 ** 25, ALL_ELEVATIONS, ALL_ELEVATIONS - 1])
+def test_decode_round_trip(conn, mask):
+    code = decode_elevations(mask)
+    assert encode_elevations(code) == mask
+    assert sql_mask(conn, code) == mask
+
+
+def test_decode():
+    assert decode_elevations(14) == "BCD"
+    assert decode_elevations(ALL_ELEVATIONS) == "**"
+    assert decode_elevations(0) == ""
+
+
+def test_applies_to_elevation():
+    mask = encode_elevations("BCD")
+    assert applies_to_elevation(mask, "c")
+    assert not applies_to_elevation(mask, "A")
+    assert not applies_to_elevation(mask, "1")
+
+
+def test_count_by_elevation():
+    counts = count_by_elevation([(encode_elevations("A"), 5), (encode_elevations("BCD"), 2),
+                                 (ALL_ELEVATIONS, 1), (0, 7)])
+    assert counts == {"A": 6, "B": 3, "C": 3, "D": 3}